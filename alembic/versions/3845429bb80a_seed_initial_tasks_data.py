@@ -13,7 +13,7 @@ from sqlalchemy.sql import table, column
 from datetime import datetime
 
 # revision identifiers, used by Alembic.
-revision: str = '{seu_novo_id_de_revisao}' # Substitua pelo ID gerado
+revision: str = '3845429bb80a'
 down_revision: Union[str, None] = '95f6134fd4cb' # ID da migração anterior (criação da tabela)
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
@@ -0,0 +1,49 @@
+"""add task query indexes
+
+Revision ID: 7c1e5f2a9b4d
+Revises: 3845429bb80a
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5f2a9b4d'
+down_revision: Union[str, None] = '3845429bb80a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_TASKS = sa.text("status != 'completed'")
+
+
+def upgrade() -> None:
+    # Índices compostos para os filtros usados em TaskServices
+    op.create_index('ix_tasks_status_due_date', 'tasks', ['status', 'due_date'], unique=False)
+    op.create_index('ix_tasks_assigned_to_status', 'tasks', ['assigned_to', 'status'], unique=False)
+    op.create_index(op.f('ix_tasks_priority'), 'tasks', ['priority'], unique=False)
+    # Índice parcial: tarefas em aberto ordenadas por vencimento
+    op.create_index(
+        'ix_tasks_open_due_date',
+        'tasks',
+        ['due_date', 'id'],
+        unique=False,
+        postgresql_where=OPEN_TASKS,
+        sqlite_where=OPEN_TASKS,
+    )
+    # ix_tasks_id duplica a chave primária e ix_tasks_status é coberto
+    # por ix_tasks_status_due_date
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_tasks_status', table_name='tasks')
+
+
+def downgrade() -> None:
+    op.create_index('ix_tasks_status', 'tasks', ['status'], unique=False)
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+    op.drop_index('ix_tasks_open_due_date', table_name='tasks')
+    op.drop_index(op.f('ix_tasks_priority'), table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_status', table_name='tasks')
+    op.drop_index('ix_tasks_status_due_date', table_name='tasks')
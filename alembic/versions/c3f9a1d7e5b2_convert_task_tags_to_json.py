@@ -0,0 +1,100 @@
+"""convert task tags to json
+
+Revision ID: c3f9a1d7e5b2
+Revises: a41d8e3c6f27
+Create Date: 2026-10-18 14:21:09.274153
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a1d7e5b2'
+down_revision: Union[str, None] = 'a41d8e3c6f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+tasks = sa.table('tasks', sa.column('id', sa.Integer), sa.column('tags', sa.String))
+
+
+def normalize(raw):
+    """Turn the legacy string column into a clean JSON array of tags."""
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        # Valores antigos fora do formato JSON: lista separada por vírgulas
+        value = raw.split(',')
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    tags = []
+    for tag in value:
+        tag = str(tag).strip().lower()[:50]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags[:20]
+
+
+def backfill(bind) -> None:
+    """Normalize non-empty legacy values in id batches (keyset)."""
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(tasks.c.id, tasks.c.tags)
+            .where(tasks.c.id > last_id, tasks.c.tags != '[]')
+            .order_by(tasks.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        for task_id, raw in rows:
+            tags = json.dumps(normalize(raw), ensure_ascii=False)
+            if tags != raw:
+                bind.execute(
+                    tasks.update().where(tasks.c.id == task_id).values(tags=tags)
+                )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.execute("UPDATE tasks SET tags = '[]' WHERE tags IS NULL OR tags = ''")
+    backfill(bind)
+
+    if bind.dialect.name == 'postgresql':
+        op.alter_column(
+            'tasks', 'tags',
+            type_=postgresql.JSONB(),
+            postgresql_using='tags::jsonb',
+            server_default=sa.text("'[]'"),
+            nullable=False,
+        )
+        # jsonb_ops: atende ?| (tags_any) e ?& (tags_all)
+        op.create_index(
+            'ix_tasks_tags', 'tasks', ['tags'], unique=False, postgresql_using='gin'
+        )
+    # SQLite guarda JSON como texto: recriar a tabela (batch) só mudaria o
+    # tipo declarado e apagaria os triggers da busca textual
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_tasks_tags', table_name='tasks')
+        op.alter_column(
+            'tasks', 'tags',
+            type_=sa.String(length=500),
+            postgresql_using='tags::text',
+            server_default=None,
+            nullable=True,
+        )
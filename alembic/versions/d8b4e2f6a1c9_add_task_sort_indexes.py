@@ -0,0 +1,38 @@
+"""add task sort indexes
+
+Revision ID: d8b4e2f6a1c9
+Revises: c3f9a1d7e5b2
+Create Date: 2026-10-18 15:02:44.810376
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b4e2f6a1c9'
+down_revision: Union[str, None] = 'c3f9a1d7e5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesmo texto de app.models.task.PRIORITY_RANK_SQL (low < medium < high)
+PRIORITY_RANK = sa.text(
+    "(CASE priority WHEN 'low' THEN 0 WHEN 'medium' THEN 1 WHEN 'high' THEN 2 END)"
+)
+
+
+def upgrade() -> None:
+    # Índices (campo, id) para sort=; a ordem descendente usa a varredura reversa
+    op.create_index('ix_tasks_due_date_id', 'tasks', ['due_date', 'id'], unique=False)
+    op.create_index('ix_tasks_priority_rank_id', 'tasks', [PRIORITY_RANK, 'id'], unique=False)
+    op.create_index('ix_tasks_created_at_id', 'tasks', ['created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_priority_rank_id', table_name='tasks')
+    op.drop_index('ix_tasks_due_date_id', table_name='tasks')
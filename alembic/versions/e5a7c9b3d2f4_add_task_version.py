@@ -0,0 +1,32 @@
+"""add task version
+
+Revision ID: e5a7c9b3d2f4
+Revises: d8b4e2f6a1c9
+Create Date: 2026-10-18 16:47:31.562918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9b3d2f4'
+down_revision: Union[str, None] = 'd8b4e2f6a1c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Contador de versões para concorrência otimista; linhas existentes
+    # começam na versão 1. ADD COLUMN direto, sem batch: no SQLite recriar a
+    # tabela apagaria os triggers da busca textual
+    op.add_column(
+        'tasks',
+        sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('tasks', 'version')
@@ -0,0 +1,27 @@
+"""add task title sort index
+
+Revision ID: f2c6d8a4b1e7
+Revises: e5a7c9b3d2f4
+Create Date: 2026-10-18 18:21:09.437215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8a4b1e7'
+down_revision: Union[str, None] = 'e5a7c9b3d2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # sort=title também precisa do seu índice (campo, id)
+    op.create_index('ix_tasks_title_id', 'tasks', ['title', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_title_id', table_name='tasks')
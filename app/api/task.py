@@ -1,26 +1,218 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import (Any, Awaitable, Callable, Dict, List, NamedTuple, Optional,
+                    Tuple, Union)
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (APIRouter, Body, Depends, Header, HTTPException, Query,
+                     Request, Response, status)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.core import settings
+from app.database import get_session
 from app.models.enums import TaskPriority, TaskStatus
+from app.schemas.task import BulkResult
 from app.schemas.task import Task as TaskSchema
-from app.schemas.task import TaskCreate, TaskUpdate
-from app.services.task_services import TaskServices
+from app.schemas.task import (TaskBatch, TaskBulkUpdate, TaskCreate, TaskPatch,
+                              TaskStats, TaskUpdate, normalize_tags)
+from app.services.async_task_services import AsyncTaskServices
+from app.services.conditional import (content_etag, is_not_modified, task_etag,
+                                      validator_headers)
+from app.services.export import MEDIA_TYPES, ExportFormat, encode_stream
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.services.serialization import (TASK_FIELDS, dump_task_batch,
+                                        dump_tasks, parse_fields)
+from app.services.task_events import event_stream
+from app.services.task_query import parse_filter
+from app.services.task_services import (EXPORT_COLUMNS, MAX_BULK_ITEMS,
+                                        SORT_KEYS, parse_sort)
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MERGE_PATCH_MEDIA_TYPE = "application/merge-patch+json"
+
+
+class PageParams(NamedTuple):
+    cursor: Optional[str]
+    limit: int
+    fields: Optional[Tuple[str, ...]] = None
+    sort: Optional[Tuple[str, ...]] = None
+
+
+async def field_params(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (id is always included), "
+        f"e.g. id,title,status. Available: {', '.join(TASK_FIELDS)}",
+    ),
+) -> Optional[Tuple[str, ...]]:
+    """Sparse fieldset query parameter."""
+    try:
+        return parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+async def page_params(
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor taken from the {NEXT_CURSOR_HEADER} header"
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    fields: Optional[Tuple[str, ...]] = Depends(field_params),
+) -> PageParams:
+    """Common keyset pagination and sparse fieldset query parameters."""
+    return PageParams(cursor=cursor, limit=limit, fields=fields)
+
+
+async def get_task_services(
+    request: Request,
+    db: Union[AsyncSession, Session] = Depends(get_session),
+) -> AsyncTaskServices:
+    """Task service bound to the configured session, read cache and events."""
+    state = request.app.state
+    return AsyncTaskServices(
+        db,
+        cache=getattr(state, "task_cache", None),
+        events=getattr(state, "event_broker", None),
+    )
+
+
+async def sorted_page_params(
+    params: PageParams = Depends(page_params),
+    sort: Optional[str] = Query(
+        None,
+        description="Comma-separated sort fields, '-' for descending, e.g. "
+        f"due_date,-priority. Available: {', '.join(SORT_KEYS)}",
+    ),
+) -> PageParams:
+    """Page parameters plus ``sort=`` for the routes that accept it."""
+    try:
+        return params._replace(sort=parse_sort(sort))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def paged_response(
+    response: Response, page: Page, fields: Optional[Tuple[str, ...]] = None
+) -> Response:
+    """Encode the page items as JSON, exposing the next cursor as a header.
+
+    Items are dumped straight to bytes by pydantic-core instead of being
+    validated one by one against ``response_model``, which would re-run the
+    schema's input validators on every row; ``response_model`` still
+    documents the payload.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return Response(
+        dump_tasks(page.items, fields),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
+
+
+async def conditional_page(
+    request: Request,
+    response: Response,
+    params: PageParams,
+    load: Callable[[], Awaitable[Page]],
+) -> Response:
+    """Load the page and answer 304 when If-None-Match matches its ETag.
+
+    The weak ETag is a digest of the encoded items and the next cursor, so
+    it always describes the body being sent. Cached pages carry the ETag
+    computed when they were stored, so a matching If-None-Match is answered
+    without a query or encoding the items. Lists carry no Last-Modified:
+    max(updated_at) does not move when a row is deleted or leaves the
+    filter, so If-Modified-Since could not be answered correctly.
+    """
+    page = await load()
+    body = None
+    if page.etag is None:
+        body = dump_tasks(page.items, params.fields)
+    headers = {"ETag": page.etag or content_etag(body, page.next_cursor)}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if is_not_modified(request.headers, headers["ETag"], None):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if body is None:
+        body = dump_tasks(page.items, params.fields)
+    response.headers.update(headers)
+    return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
+def tag_params(values: Optional[List[str]], name: str) -> Optional[List[str]]:
+    """Normalize repeated and/or comma-separated tag query parameters.
+
+    A parameter that is present but names no tag (``tags_any=,``) is a 400,
+    not a dropped filter.
+    """
+    if values is None:
+        return None
+    tags = [tag for value in values for tag in value.split(",") if tag.strip()]
+    if not tags:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{name} expects at least one tag",
+        )
+    try:
+        return normalize_tags(tags)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def id_params(values: List[str]) -> List[int]:
+    """Parse repeated and/or comma-separated ids, de-duplicated in order."""
+    try:
+        ids = [int(raw) for value in values for raw in value.split(",") if raw.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be integers"
+        )
+    ids = list(dict.fromkeys(ids))
+    if not ids or len(ids) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pass between 1 and {MAX_BULK_ITEMS} ids",
+        )
+    return ids
+
+
+def task_validators(task) -> Tuple[str, Union[datetime, str]]:
+    """ETag and updated_at of a task (ORM object or cached dict)."""
+    if isinstance(task, dict):
+        task_id, updated_at = task["id"], task["updated_at"]
+    else:
+        task_id, updated_at = task.id, task.updated_at
+    return task_etag(task_id, updated_at), updated_at
+
+
 # === ENDPOINTS CRUD BÁSICOS ===
 
 
 @router.get("/", response_model=List[TaskSchema], summary="List all tasks")
-def list_tasks(db: Session = Depends(get_db)):
-    """List all tasks in the database."""
-    task_service = TaskServices(db)
-    tasks = task_service.list_tasks()
-    return tasks or []
+async def list_tasks(
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """List tasks in the database, one page at a time."""
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.list_tasks(
+            params.cursor,
+            params.limit,
+            fields=params.fields,
+            sort=params.sort,
+        ),
+    )
 
 
 # === ENDPOINTS DE FILTRO - REORDENADOS ===
@@ -28,98 +220,363 @@ def list_tasks(db: Session = Depends(get_db)):
 
 
 @router.get("/overdue", response_model=List[TaskSchema])
-def get_overdue_tasks(db: Session = Depends(get_db)):
+async def get_overdue_tasks(
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get all overdue tasks."""
-    service = TaskServices(db)
-    tasks = service.get_overdue_tasks()
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.get_overdue_tasks(
+            params.cursor, params.limit, fields=params.fields
+        ),
+    )
 
 
 @router.get("/due-soon", response_model=List[TaskSchema])
-def get_tasks_due_soon(
+async def get_tasks_due_soon(
+    request: Request,
+    response: Response,
     days: int = Query(7, description="Number of days to look ahead"),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
 ):
     """Get tasks due within the next N days."""
-    service = TaskServices(db)
-    tasks = service.get_tasks_due_soon(days)
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.get_tasks_due_soon(
+            days, params.cursor, params.limit, fields=params.fields
+        ),
+    )
 
 
 @router.get("/due-today", response_model=List[TaskSchema])
-def get_tasks_due_today(db: Session = Depends(get_db)):
+async def get_tasks_due_today(
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get tasks due today."""
-    service = TaskServices(db)
-    tasks = service.get_tasks_due_today()
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.get_tasks_due_today(
+            params.cursor, params.limit, fields=params.fields
+        ),
+    )
 
 
 @router.get("/search", response_model=List[TaskSchema])
-def search_tasks(
+async def search_tasks(
+    request: Request,
+    response: Response,
     q: str = Query(..., description="Search term for title or description"),
-    db: Session = Depends(get_db),
+    params: PageParams = Depends(page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
 ):
     """Search tasks by title or description."""
-    service = TaskServices(db)
-    tasks = service.search_tasks(q)
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.search_tasks(
+            q, params.cursor, params.limit, fields=params.fields
+        ),
+    )
 
 
 @router.get("/filter", response_model=List[TaskSchema])
-def filter_tasks_advanced(
+async def filter_tasks_advanced(
+    request: Request,
+    response: Response,
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
     assigned_to: Optional[str] = Query(None, description="Filter by assigned person"),
     start_date: Optional[datetime] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[datetime] = Query(None, description="End date (YYYY-MM-DD)"),
     search: Optional[str] = Query(None, description="Search in title/description"),
-    db: Session = Depends(get_db),
+    tags_any: Optional[List[str]] = Query(
+        None, description="Tasks with at least one of these tags (repeat or a,b)"
+    ),
+    tags_all: Optional[List[str]] = Query(
+        None, description="Tasks with every one of these tags (repeat or a,b)"
+    ),
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
 ):
     """Advanced task filtering."""
-    service = TaskServices(db)
-    tasks = service.filter_tasks_advanced(
+    criteria = dict(
+        status=status,
+        priority=priority,
+        assigned_to=assigned_to,
+        start_date=start_date,
+        end_date=end_date,
+        search_term=search,
+        tags_any=tag_params(tags_any, "tags_any"),
+        tags_all=tag_params(tags_all, "tags_all"),
+    )
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.filter_tasks_advanced(
+            **criteria,
+            cursor=params.cursor,
+            limit=params.limit,
+            fields=params.fields,
+            sort=params.sort,
+        ),
+    )
+
+
+@router.post("/query", response_model=List[TaskSchema], summary="Query tasks")
+async def query_tasks(
+    response: Response,
+    where: Dict[str, Any] = Body(
+        {},
+        examples=[
+            {
+                "priority": {"in": ["high", "medium"]},
+                "assigned_to": {"in": ["ana", "bruno"]},
+                "not": {"status": "completed"},
+                "or": [
+                    {"due_date": {"lt": "2030-01-01T00:00:00"}},
+                    {"due_date": {"is_null": True}},
+                ],
+            }
+        ],
+    ),
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Filter tasks with a JSON expression: and/or/not groups and, per field,
+    eq, ne, in, not_in, gt, gte, lt, lte, is_null (tags: any, all).
+
+    Paging, ``sort=`` and ``fields=`` work as on the GET list routes.
+    """
+    try:
+        criteria = parse_filter(where)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    page = await service.query_tasks(
+        criteria,
+        params.cursor,
+        params.limit,
+        fields=params.fields,
+        sort=params.sort,
+    )
+    return paged_response(response, page, params.fields)
+
+
+@router.get("/stats", response_model=TaskStats, summary="Task statistics")
+async def get_task_stats(service: AsyncTaskServices = Depends(get_task_services)):
+    """Counts per status, priority and assignee, plus a due-date histogram."""
+    return await service.get_task_stats()
+
+
+@router.get("/export", summary="Export tasks")
+async def export_tasks(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Output format"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned person"),
+    start_date: Optional[datetime] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[datetime] = Query(None, description="End date (YYYY-MM-DD)"),
+    search: Optional[str] = Query(None, description="Search in title/description"),
+    tags_any: Optional[List[str]] = Query(
+        None, description="Tasks with at least one of these tags (repeat or a,b)"
+    ),
+    tags_all: Optional[List[str]] = Query(
+        None, description="Tasks with every one of these tags (repeat or a,b)"
+    ),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Stream every task matching the advanced filter as NDJSON or CSV."""
+    batches = service.export_tasks(
         status=status,
         priority=priority,
         assigned_to=assigned_to,
         start_date=start_date,
         end_date=end_date,
         search_term=search,
+        tags_any=tag_params(tags_any, "tags_any"),
+        tags_all=tag_params(tags_all, "tags_all"),
+    )
+    columns = [column.key for column in EXPORT_COLUMNS]
+    return StreamingResponse(
+        encode_stream(batches, format, columns),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format.value}"'},
+    )
+
+
+@router.get("/stream", summary="Stream task changes (Server-Sent Events)")
+async def stream_tasks(
+    request: Request,
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned person"),
+):
+    """Push created/updated/deleted task events as they happen."""
+    return StreamingResponse(
+        event_stream(
+            request.app.state.event_broker,
+            request.is_disconnected,
+            settings.event_heartbeat,
+            status=status,
+            priority=priority,
+            assigned_to=assigned_to,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return tasks
 
 
 @router.get("/filter/status/{status}", response_model=List[TaskSchema])
-def get_tasks_by_status(status: TaskStatus, db: Session = Depends(get_db)):
+async def get_tasks_by_status(
+    status: TaskStatus,
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get all tasks with specific status."""
-    service = TaskServices(db)
-    tasks = service.filter_tasks_by_status(status)
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.filter_tasks_by_status(
+            status,
+            params.cursor,
+            params.limit,
+            fields=params.fields,
+            sort=params.sort,
+        ),
+    )
 
 
 @router.get("/filter/priority/{priority}", response_model=List[TaskSchema])
-def get_tasks_by_priority(priority: TaskPriority, db: Session = Depends(get_db)):
+async def get_tasks_by_priority(
+    priority: TaskPriority,
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get all tasks with specific priority."""
-    service = TaskServices(db)
-    tasks = service.filter_tasks_by_priority(priority)
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.filter_tasks_by_priority(
+            priority,
+            params.cursor,
+            params.limit,
+            fields=params.fields,
+            sort=params.sort,
+        ),
+    )
 
 
 @router.get("/filter/assigned/{assigned_to}", response_model=List[TaskSchema])
-def get_tasks_by_assigned_to(assigned_to: str, db: Session = Depends(get_db)):
+async def get_tasks_by_assigned_to(
+    assigned_to: str,
+    request: Request,
+    response: Response,
+    params: PageParams = Depends(sorted_page_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get all tasks assigned to specific person."""
-    service = TaskServices(db)
-    tasks = service.filter_tasks_by_assigned_to(assigned_to)
-    return tasks
+    return await conditional_page(
+        request,
+        response,
+        params,
+        lambda: service.filter_tasks_by_assigned_to(
+            assigned_to,
+            params.cursor,
+            params.limit,
+            fields=params.fields,
+            sort=params.sort,
+        ),
+    )
+
+
+# === ENDPOINTS EM LOTE ===
+
+
+@router.get("/batch", response_model=TaskBatch, summary="Get tasks by IDs")
+async def get_tasks_batch(
+    ids: List[str] = Query(
+        ...,
+        description=f"Task IDs, repeated or comma-separated (up to {MAX_BULK_ITEMS})",
+    ),
+    fields: Optional[Tuple[str, ...]] = Depends(field_params),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Get many tasks with one query, in the requested order.
+
+    Ids that do not exist are listed in ``missing`` instead of failing the
+    request.
+    """
+    task_ids = id_params(ids)
+    found = await service.get_tasks(task_ids)
+    return Response(
+        dump_task_batch(
+            [found[task_id] for task_id in task_ids if task_id in found],
+            [task_id for task_id in task_ids if task_id not in found],
+            fields,
+        ),
+        media_type="application/json",
+    )
+
+
+@router.post("/bulk", response_model=BulkResult, summary="Create tasks in bulk")
+async def bulk_create_tasks(
+    items: List[TaskCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Create many tasks in a single transaction."""
+    return await service.bulk_create_tasks(items)
+
+
+@router.patch("/bulk", response_model=BulkResult, summary="Update tasks in bulk")
+async def bulk_update_tasks(
+    items: List[TaskBulkUpdate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Update many tasks in a single transaction."""
+    return await service.bulk_update_tasks(items)
+
+
+@router.delete("/bulk", response_model=BulkResult, summary="Delete tasks in bulk")
+async def bulk_delete_tasks(
+    ids: List[int] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Delete many tasks in a single transaction."""
+    return await service.bulk_delete_tasks(ids)
 
 
 # === ENDPOINTS CRUD BÁSICOS CONTINUAÇÃO ===
 
 
 @router.get("/{task_id}", response_model=TaskSchema, summary="Get task by ID")
-def get_task(task_id: int, db: Session = Depends(get_db)):
+async def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Get a specific task by ID."""
-    task_service = TaskServices(db)
-    task = task_service.get_task(task_id)
+    task = await service.get_task(task_id)
 
     if not task:
         raise HTTPException(
@@ -127,6 +584,12 @@ def get_task(task_id: int, db: Session = Depends(get_db)):
             detail=f"Task with ID {task_id} not found",
         )
 
+    etag, updated_at = task_validators(task)
+    headers = validator_headers(etag, updated_at)
+    if is_not_modified(request.headers, etag, updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return task
 
 
@@ -136,18 +599,70 @@ def get_task(task_id: int, db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
     summary="Create new task",
 )
-def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(
+    task_data: TaskCreate,
+    response: Response,
+    service: AsyncTaskServices = Depends(get_task_services),
+):
     """Create a new task."""
-    task_service = TaskServices(db)
-    task = task_service.create_task(task_data)
+    task = await service.create_task(task_data)
+    response.headers.update(validator_headers(*task_validators(task)))
     return task
 
 
 @router.put("/{task_id}", response_model=TaskSchema, summary="Update task")
-def update_task(task_id: int, task_data: TaskUpdate, db: Session = Depends(get_db)):
-    """Update an existing task."""
-    task_service = TaskServices(db)
-    task = task_service.update_task(task_id, task_data)
+async def update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag from GET /tasks/{id}"),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Update an existing task.
+
+    412 if If-Match no longer matches; 409 if ``version`` is sent and the
+    task has been written since that version was read.
+    """
+    task = await service.update_task(task_id, task_data, if_match)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task with ID {task_id} not found",
+        )
+
+    response.headers.update(validator_headers(*task_validators(task)))
+    return task
+
+
+@router.patch(
+    "/{task_id}",
+    response_model=TaskSchema,
+    summary="Partially update task",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                MERGE_PATCH_MEDIA_TYPE: {
+                    "schema": {"$ref": "#/components/schemas/TaskPatch"}
+                }
+            }
+        }
+    },
+)
+async def patch_task(
+    task_id: int,
+    patch: TaskPatch,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="ETag from GET /tasks/{id}"),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Apply a JSON Merge Patch: one UPDATE of only the fields sent.
+
+    The row is not read first; ``null`` clears a field, and If-Match and
+    ``version`` are checked by the UPDATE itself (412/409 when the task
+    changed meanwhile).
+    """
+    task = await service.update_task(task_id, patch, if_match)
 
     if not task:
         raise HTTPException(
@@ -155,16 +670,23 @@ def update_task(task_id: int, task_data: TaskUpdate, db: Session = Depends(get_d
             detail=f"Task with ID {task_id} not found",
         )
 
+    response.headers.update(validator_headers(*task_validators(task)))
     return task
 
 
 @router.delete(
     "/{task_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete task"
 )
-def delete_task(task_id: int, db: Session = Depends(get_db)):
-    """Delete a task."""
-    task_service = TaskServices(db)
-    success = task_service.delete_task(task_id)
+async def delete_task(
+    task_id: int,
+    if_match: Optional[str] = Header(None, description="ETag from GET /tasks/{id}"),
+    version: Optional[int] = Query(
+        None, ge=1, description="Version from GET /tasks/{id} (409 if stale)"
+    ),
+    service: AsyncTaskServices = Depends(get_task_services),
+):
+    """Delete a task (412 if If-Match no longer matches, 409 if version is stale)."""
+    success = await service.delete_task(task_id, if_match, version)
 
     if not success:
         raise HTTPException(
@@ -1,9 +1,12 @@
-from .config import (DATABASE_URL, Environment, is_debug, is_development,
-                     is_production, is_staging, is_testing, settings)
+from .config import (DATABASE_URL, BrokerBackend, CacheBackend, Environment,
+                     is_debug, is_development, is_production, is_staging,
+                     is_testing, settings)
 
 __all__ = [
     "settings",
     "Environment",
+    "CacheBackend",
+    "BrokerBackend",
     "is_production",
     "is_testing",
     "is_development",
@@ -0,0 +1,225 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import CacheBackend, Settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    """Hit/miss/eviction counters for one in-process cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory cost of a cached value by its JSON length."""
+    return len(json.dumps(value, default=str))
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry TTL.
+
+    Bounded by entry count and, when ``max_bytes`` is set, by the estimated
+    size of the stored values. Each uvicorn worker has its own copy, so
+    entries are only invalidated within this process.
+    """
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_entry(self, key: str) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes and self.size > self.max_bytes and self._entries
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self.size -= entry[2]
+            self.stats.evictions += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._get_entry(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return entry[0]
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        size = estimate_size(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        self._remove(key)
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (value, expires_at, size)
+        self.size += size
+        self._evict()
+
+    async def set_many(self, values: Mapping[str, Any], ttl: Optional[int] = None):
+        for key, value in values.items():
+            await self.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._remove(key)
+
+    async def incr(self, key: str) -> int:
+        entry = self._get_entry(key)
+        value = (entry[0] if entry else 0) + 1
+        self._remove(key)
+        self._entries[key] = (value, None, 0)
+        return value
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            **self.stats.snapshot(),
+        }
+
+
+class RedisCache:
+    """Redis-backed cache storing JSON values.
+
+    Failures are logged and treated as cache misses so a Redis outage
+    degrades to database reads instead of failing requests.
+    """
+
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self.client.get(key)
+        except (RedisError, OSError):
+            logger.warning("Redis GET failed for %s", key, exc_info=True)
+            return None
+        return None if raw is None else json.loads(raw)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """One MGET round trip for all ``keys``."""
+        if not keys:
+            return []
+        try:
+            raws = await self.client.mget(keys)
+        except (RedisError, OSError):
+            logger.warning("Redis MGET failed for %d keys", len(keys), exc_info=True)
+            return [None] * len(keys)
+        return [None if raw is None else json.loads(raw) for raw in raws]
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            await self.client.set(key, json.dumps(value), ex=ttl or None)
+        except (RedisError, OSError):
+            logger.warning("Redis SET failed for %s", key, exc_info=True)
+
+    async def set_many(self, values: Mapping[str, Any], ttl: Optional[int] = None):
+        """Pipelined SETs, sent in one round trip."""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, json.dumps(value), ex=ttl or None)
+                await pipe.execute()
+        except (RedisError, OSError):
+            logger.warning("Redis SET failed for %d keys", len(values), exc_info=True)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.delete(*keys)
+        except (RedisError, OSError):
+            logger.warning("Redis DEL failed for %s", keys, exc_info=True)
+
+    async def incr(self, key: str) -> int:
+        try:
+            return await self.client.incr(key)
+        except (RedisError, OSError):
+            logger.warning("Redis INCR failed for %s", key, exc_info=True)
+            return 0
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+async def create_cache(settings: Settings):
+    """Build the configured cache, falling back to memory if Redis is down."""
+    if settings.cache_backend == CacheBackend.NONE:
+        return None
+
+    if settings.cache_backend == CacheBackend.REDIS:
+        client = aioredis.from_url(settings.redis_url)
+        try:
+            await client.ping()
+        except (RedisError, OSError):
+            logger.warning(
+                "Redis unavailable at %s, using in-process cache", settings.redis_url
+            )
+            await client.close()
+        else:
+            logger.info("Using Redis cache at %s", settings.redis_url)
+            return RedisCache(client)
+
+    return MemoryCache(max_entries=settings.cache_max_entries)
+
+
+def create_local_cache(settings: Settings, shared) -> Optional[MemoryCache]:
+    """Per-process cache in front of a shared (Redis) cache, if enabled."""
+    if not settings.local_cache or shared is None or isinstance(shared, MemoryCache):
+        return None
+    return MemoryCache(
+        max_entries=settings.local_cache_max_entries,
+        max_bytes=settings.local_cache_max_bytes,
+    )
@@ -11,6 +11,17 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+class CacheBackend(str, Enum):
+    REDIS = "redis"
+    MEMORY = "memory"
+    NONE = "none"
+
+
+class BrokerBackend(str, Enum):
+    REDIS = "redis"
+    MEMORY = "memory"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -19,6 +30,54 @@ class Settings(BaseSettings):
     environment: Environment = Environment.DEVELOPMENT
     debug: bool = True
 
+    # Usa AsyncSession (asyncpg/aiosqlite) no caminho das requisições
+    async_database: bool = False
+
+    # Pool de conexões (por processo/worker do uvicorn)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # segundos; -1 desativa
+    db_pool_pre_ping: bool = True
+    # Timeout por statement no Postgres, em ms (0 = sem limite)
+    db_statement_timeout_ms: int = 0
+    # Pool externo (PgBouncer em transaction pooling): NullPool, sem cache
+    # de prepared statements e sem parâmetros de sessão na conexão
+    db_external_pooler: bool = False
+
+    # Cache de leitura: Redis, com fallback para LRU em memória se indisponível
+    cache_backend: CacheBackend = CacheBackend.REDIS
+    cache_ttl: int = 300  # GET /tasks/{id}, em segundos
+    cache_list_ttl: int = 30  # listagens e filtros, em segundos
+    cache_max_entries: int = 10_000  # limite do LRU em memória
+
+    # Cache local por processo na frente do Redis para GET /tasks/{id}.
+    # O TTL limita quanto tempo um worker pode servir dados desatualizados
+    # após escritas feitas por outros workers.
+    local_cache: bool = False
+    local_cache_ttl: int = 5
+    local_cache_max_entries: int = 1_000
+    local_cache_max_bytes: int = 16 * 1024 * 1024
+
+    # Feed de eventos (/tasks/stream): Redis pub/sub entre workers
+    event_broker: BrokerBackend = BrokerBackend.REDIS
+    event_heartbeat: int = 15  # segundos entre keepalives do SSE
+
+    # Sweeper que muda tarefas pendentes vencidas para TaskStatus.OVERDUE;
+    # altera dados, por isso vem desligado. Com ele ativo /tasks/overdue
+    # filtra por status. Desative o modo in-process ao rodar o worker
+    # separado (python -m app.services.overdue_sweeper).
+    overdue_sweeper: bool = False
+    overdue_sweep_in_process: bool = True
+    overdue_sweep_interval: int = 60  # segundos
+    overdue_sweep_batch_size: int = 1000
+
+    # Instrumentação: /metrics (Prometheus) e log de queries lentas
+    metrics_enabled: bool = True
+    slow_query_ms: int = 500  # 0 desativa o log
+    # Em desenvolvimento, avisa quando uma requisição excede N queries (0 desativa)
+    query_budget: int = 10
+
 
 settings = Settings()
 
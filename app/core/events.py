@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import BrokerBackend, Settings
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "tasks:events"
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+class MemoryBroker:
+    """In-process fan-out of events to subscriber queues.
+
+    Only reaches subscribers of the current worker; used on its own in tests
+    and single-worker deployments, and as the local fan-out of RedisBroker.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    def register(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unregister(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue = self.register()
+        try:
+            yield queue
+        finally:
+            self.unregister(queue)
+
+    def deliver(self, event: Dict[str, Any]) -> None:
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Assinante lento: descarta o evento em vez de bloquear os demais
+                logger.warning("Dropping task event for a slow subscriber")
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        self.deliver(event)
+
+    async def close(self) -> None:
+        self.subscribers.clear()
+
+
+class RedisBroker:
+    """Redis pub/sub fan-out across uvicorn workers.
+
+    Each worker holds one subscription to ``EVENTS_CHANNEL`` and hands the
+    messages to its local subscribers, so the number of Redis connections
+    does not grow with the number of open streams.
+    """
+
+    def __init__(self, client: aioredis.Redis, channel: str = EVENTS_CHANNEL):
+        self.client = client
+        self.channel = channel
+        self.local = MemoryBroker()
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self.local.deliver(json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except (RedisError, OSError):
+            logger.error("Task event listener stopped", exc_info=True)
+        finally:
+            await pubsub.close()
+
+    def subscribe(self):
+        return self.local.subscribe()
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        try:
+            await self.client.publish(self.channel, json.dumps(event))
+        except (RedisError, OSError):
+            logger.warning("Redis PUBLISH failed for task event", exc_info=True)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self.local.close()
+        await self.client.close()
+
+
+async def create_broker(settings: Settings):
+    """Build the configured event broker, falling back to memory."""
+    if settings.event_broker == BrokerBackend.REDIS:
+        client = aioredis.from_url(settings.redis_url)
+        try:
+            await client.ping()
+        except (RedisError, OSError):
+            logger.warning(
+                "Redis unavailable at %s, task events stay within this worker",
+                settings.redis_url,
+            )
+            await client.close()
+        else:
+            broker = RedisBroker(client)
+            await broker.start()
+            return broker
+
+    return MemoryBroker()
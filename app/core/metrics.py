@@ -0,0 +1,238 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import is_debug, settings
+
+logger = logging.getLogger(__name__)
+
+# Registro próprio: não mistura com métricas padrão do processo
+REGISTRY = CollectorRegistry()
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    registry=REGISTRY,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    registry=REGISTRY,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duration of individual SQL statements",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+    registry=REGISTRY,
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+    registry=REGISTRY,
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent in SQL statements per HTTP request",
+    ["route"],
+    registry=REGISTRY,
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "SQL statements slower than SLOW_QUERY_MS",
+    ["route"],
+    registry=REGISTRY,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class QueryStats:
+    """SQL statements executed while serving one request."""
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.count = 0
+        self.duration = 0.0
+
+    @property
+    def route(self) -> str:
+        route = (self.scope or {}).get("route")
+        return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+# Objeto mutável: continua visível nas threads do threadpool e no run_sync
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    DB_QUERY_DURATION.observe(elapsed)
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+
+    if settings.slow_query_ms and elapsed * 1000 >= settings.slow_query_ms:
+        route = stats.route if stats is not None else None
+        SLOW_QUERIES.labels(route=route or UNMATCHED_ROUTE).inc()
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            route or "background",
+            " ".join(statement.split()),
+        )
+
+
+class QueryCounter:
+    """Statements executed on an engine while a ``count_queries`` block runs."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(" ".join(statement.split()))
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{number}. {statement}"
+            for number, statement in enumerate(self.statements, start=1)
+        )
+
+
+@contextmanager
+def count_queries(*engines: Engine) -> Iterator[QueryCounter]:
+    """Count every statement run on ``engines`` inside the block, from any thread.
+
+    Unlike the per-request stats, this is engine-wide: it also sees queries
+    issued by the TestClient's worker thread. Pass ``AsyncEngine.sync_engine``
+    for an async engine.
+    """
+    counter = QueryCounter()
+    for engine in engines:
+        event.listen(engine, "after_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        for engine in engines:
+            event.remove(engine, "after_cursor_execute", counter)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement of ``engine`` (use ``AsyncEngine.sync_engine``)."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, in-flight and per-request SQL stats.
+
+    Routes are labelled by their template (``/tasks/{task_id}``), not the
+    raw path, to keep label cardinality bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = current_query_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            current_query_stats.reset(token)
+            route = stats.route
+            REQUEST_LATENCY.labels(
+                method=scope["method"], route=route, status=str(status_code)
+            ).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route=route).observe(stats.count)
+            DB_TIME_PER_REQUEST.labels(route=route).observe(stats.duration)
+            if is_debug() and 0 < settings.query_budget < stats.count:
+                logger.warning(
+                    "%s %s ran %d SQL statements (budget %d, %.1f ms in SQL)",
+                    scope["method"],
+                    route,
+                    stats.count,
+                    settings.query_budget,
+                    stats.duration * 1000,
+                )
+
+
+def _flatten(prefix: str, values: Dict[str, Any]) -> Iterator[tuple]:
+    for key, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        yield f"{prefix}_{key}", value
+
+
+class StatusCollector:
+    """Exposes pool and cache snapshots as gauges at scrape time.
+
+    ``pool_status`` returns ``{engine: pool_status(...)}`` and
+    ``cache_stats`` a ``TaskCache.stats()`` dict (or None).
+    """
+
+    def __init__(
+        self,
+        pool_status: Callable[[], Dict[str, dict]],
+        cache_stats: Callable[[], Optional[Dict[str, Any]]],
+    ):
+        self.pool_status = pool_status
+        self.cache_stats = cache_stats
+
+    def collect(self):
+        gauges: Dict[str, GaugeMetricFamily] = {}
+
+        def gauge(name: str, label: str, label_value: str, value: float) -> None:
+            if name not in gauges:
+                gauges[name] = GaugeMetricFamily(
+                    name, name.replace("_", " "), labels=[label]
+                )
+            gauges[name].add_metric([label_value], value)
+
+        for engine_name, status in self.pool_status().items():
+            for name, value in _flatten("db_pool", status):
+                gauge(name, "engine", engine_name, value)
+
+        for cache_name, stats in (self.cache_stats() or {}).items():
+            if isinstance(stats, dict):
+                for name, value in _flatten("cache", stats):
+                    gauge(name, "cache", cache_name, value)
+
+        yield from gauges.values()
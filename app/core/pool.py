@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from app.core.config import Settings
+
+
+class PoolMetrics:
+    """Counters for connection checkouts, including time spent waiting."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.total_wait, 6),
+                "wait_seconds_avg": round(self.total_wait / attempts, 6)
+                if attempts
+                else 0.0,
+                "wait_seconds_max": round(self.max_wait, 6),
+            }
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout (``_do_get``) of the pool it is mixed into."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Loggers sob sqlalchemy.pool (WARN por padrão), não em app.core.pool:
+        # com o root em DEBUG, cada checkout seria registrado
+        pool_class = next(
+            base for base in cls.__mro__ if base.__module__.startswith("sqlalchemy.")
+        )
+        cls._sqla_logger_namespace = f"{pool_class.__module__}.{pool_class.__name__}"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(InstrumentedPoolMixin, NullPool):
+    pass
+
+
+def engine_options(url: str, settings: Settings, is_async: bool = False) -> dict:
+    """Build create_engine/create_async_engine keyword arguments from Settings."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    options: Dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    connect_args: Dict[str, Any] = {}
+
+    if backend == "sqlite":
+        if not is_async:
+            connect_args["check_same_thread"] = False
+        # Banco em memória usa o pool padrão (uma conexão por thread)
+        if parsed.database in (None, "", ":memory:"):
+            options["connect_args"] = connect_args
+            return options
+
+    if settings.db_external_pooler:
+        # O pooler externo gerencia as conexões; cada checkout abre uma nova
+        options["poolclass"] = InstrumentedNullPool
+        if backend == "postgresql" and is_async:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+    else:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+
+    if (
+        backend == "postgresql"
+        and settings.db_statement_timeout_ms
+        and not settings.db_external_pooler
+    ):
+        timeout = str(settings.db_statement_timeout_ms)
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": timeout}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+
+    options["connect_args"] = connect_args
+    return options
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Live pool occupancy plus the checkout wait metrics."""
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -1,24 +1,70 @@
 import os
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional, Union
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 from sqlalchemy.orm import session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.pool import engine_options, pool_status
 
 load_dotenv()
 
+# Drivers assíncronos equivalentes a cada backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
 if os.getenv("TESTING"):
     # Banco de dados em memória para testes
     SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-    )
 else:
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./tasks.db")
-    engine = create_engine(DATABASE_URL)
+    SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./tasks.db")
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL, settings)
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if settings.metrics_enabled:
+    instrument_engine(engine)
+
+
+def async_database_url(url: str) -> str:
+    """Translate a sync database URL into its async driver equivalent."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if drivername is None:
+        raise ValueError(f"No async driver configured for {parsed.drivername}")
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    async_url = async_database_url(url)
+    return create_async_engine(
+        async_url, **engine_options(async_url, settings, is_async=True)
+    )
+
+
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if settings.async_database:
+    async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL)
+    if settings.metrics_enabled:
+        instrument_engine(async_engine.sync_engine)
+    # Sem expirar na commit: os objetos são serializados fora do greenlet
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
 
 def get_db() -> Generator[session.Session, None, None]:
     """Dependency to get a database session."""
@@ -27,3 +73,30 @@ def get_db() -> Generator[session.Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_session() -> AsyncGenerator[Union[AsyncSession, session.Session], None]:
+    """Dependency yielding an AsyncSession or a Session, as configured."""
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        db: session.Session = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+
+
+def get_pool_status() -> dict:
+    """Connection pool occupancy and wait metrics for every engine."""
+    status = {"sync": pool_status(engine.pool)}
+    if async_engine is not None:
+        status["async"] = pool_status(async_engine.pool)
+    return status
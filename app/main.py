@@ -1,16 +1,70 @@
-from fastapi import Depends, FastAPI
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import Depends, FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app import __description__, __title__, __version__
 from app.api import task
 from app.core import settings
+from app.core.cache import create_cache, create_local_cache
+from app.core.events import create_broker
 from app.core.logging import setup_logging
-from app.database import get_db
+from app.core.metrics import REGISTRY, MetricsMiddleware, StatusCollector
+from app.database import SessionLocal, get_db, get_pool_status
+from app.services.conditional import (PreconditionFailedError,
+                                      VersionConflictError)
+from app.services.overdue_sweeper import OverdueSweeper, change_notifier
+from app.services.pagination import InvalidCursorError
+from app.services.task_cache import TaskCache
 
 logger = setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    cache = await create_cache(settings)
+    app.state.task_cache = (
+        TaskCache(
+            cache,
+            settings.cache_ttl,
+            settings.cache_list_ttl,
+            local=create_local_cache(settings, cache),
+            local_ttl=settings.local_cache_ttl,
+        )
+        if cache is not None
+        else None
+    )
+    app.state.event_broker = await create_broker(settings)
+
+    sweeper_task = None
+    app.state.overdue_sweeper = None
+    if settings.overdue_sweeper and settings.overdue_sweep_in_process:
+        app.state.overdue_sweeper = OverdueSweeper(
+            SessionLocal,
+            interval=settings.overdue_sweep_interval,
+            batch_size=settings.overdue_sweep_batch_size,
+            on_change=change_notifier(app.state.task_cache, app.state.event_broker),
+        )
+        sweeper_task = asyncio.create_task(app.state.overdue_sweeper.run())
+
+    yield
+
+    if sweeper_task is not None:
+        sweeper_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper_task
+    await app.state.event_broker.close()
+    if cache is not None:
+        await cache.close()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title=__title__,
     description=__description__,
     version=__version__,
@@ -21,6 +75,40 @@ app = FastAPI(
 
 app.include_router(task.router)
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    REGISTRY.register(
+        StatusCollector(
+            get_pool_status,
+            lambda: (
+                app.state.task_cache.stats()
+                if getattr(app.state, "task_cache", None)
+                else None
+            ),
+        )
+    )
+
+
+@app.exception_handler(InvalidCursorError)
+def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(PreconditionFailedError)
+def precondition_failed_handler(request: Request, exc: PreconditionFailedError):
+    return JSONResponse(
+        status_code=status.HTTP_412_PRECONDITION_FAILED, content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(VersionConflictError)
+def version_conflict_handler(request: Request, exc: VersionConflictError):
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)}
+    )
+
 
 @app.get("/", tags=["Home"], summary="Initial Route")
 def home():
@@ -39,6 +127,31 @@ def health_check(db: Session = Depends(get_db)):
         return {"status": "unhealthy", "db_connected": False}
 
 
+@app.get("/health/pool", tags=["Home"], summary="Connection Pool Metrics")
+def pool_health():
+    return get_pool_status()
+
+
+@app.get("/health/cache", tags=["Home"], summary="Cache Metrics (this worker)")
+def cache_health(request: Request):
+    task_cache = getattr(request.app.state, "task_cache", None)
+    stats = task_cache.stats() if task_cache is not None else {"backend": None}
+    return {"pid": os.getpid(), **stats}
+
+
+@app.get("/health/sweeper", tags=["Home"], summary="Overdue Sweeper Metrics")
+def sweeper_health(request: Request):
+    sweeper = request.app.state.overdue_sweeper
+    if sweeper is None:
+        return {"enabled": False}
+    return {"enabled": True, "pid": os.getpid(), **sweeper.metrics.snapshot()}
+
+
+@app.get("/metrics", tags=["Home"], summary="Prometheus Metrics")
+def metrics():
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/version", tags=["Home"], summary="API Version")
 def version():
     return {"version": __version__, "description": __description__, "title": __title__}
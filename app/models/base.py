@@ -15,7 +15,7 @@ class Base(DeclarativeBase):
     __abstract__ = True  # This class is not a table, but a base for other models
     __tablename__ = None  # No table name for the base class
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=utc_now
     )
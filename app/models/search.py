@@ -0,0 +1,49 @@
+from sqlalchemy import DDL, Table, column, event, table
+
+# Índice de busca textual do SQLite (FTS5), sincronizado com "tasks" por triggers
+tasks_fts = table("tasks_fts", column("rowid"), column("title"), column("description"))
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au "
+    "AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+]
+
+# Coluna tsvector gerada (título com peso maior) + índice GIN no Postgres
+POSTGRES_SEARCH_DDL = [
+    f"ALTER TABLE tasks ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+    ") STORED",
+    f"CREATE INDEX ix_tasks_search_vector ON tasks USING gin ({SEARCH_VECTOR_COLUMN})",
+]
+
+
+def register_search_ddl(tasks: Table) -> None:
+    """Create the full-text search structures together with the tasks table."""
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(tasks, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in POSTGRES_SEARCH_DDL:
+        event.listen(
+            tasks, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    event.listen(
+        tasks,
+        "before_drop",
+        DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"),
+    )
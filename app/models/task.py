@@ -1,10 +1,29 @@
 from datetime import datetime
+from typing import List
 
-from sqlalchemy import CheckConstraint, DateTime, String
+from sqlalchemy import (DDL, JSON, CheckConstraint, DateTime, Index, Integer,
+                        String, event, text)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 from .enums import TaskPriority, TaskStatus
+from .search import register_search_ddl
+
+# Array JSON de tags; JSONB no Postgres para o índice GIN (?| e ?&)
+TagsType = JSON().with_variant(JSONB(), "postgresql")
+POSTGRES_TAGS_INDEX_DDL = "CREATE INDEX ix_tasks_tags ON tasks USING gin (tags)"
+
+# Ordem semântica da prioridade (low < medium < high), com literais para que
+# o mesmo texto case com o índice de expressão
+PRIORITY_RANK_SQL = (
+    "CASE priority "
+    + " ".join(
+        f"WHEN '{priority.value}' THEN {rank}"
+        for rank, priority in enumerate(TaskPriority)
+    )
+    + " END"
+)
 
 
 class Task(Base):
@@ -13,6 +32,7 @@ class Task(Base):
     # Criar as listas de valores fora do f-string
     _status_values = ", ".join([f"'{status.value}'" for status in TaskStatus])
     _priority_values = ", ".join([f"'{priority.value}'" for priority in TaskPriority])
+    _open_tasks = text(f"status != '{TaskStatus.COMPLETED.value}'")
 
     __table_args__ = (
         CheckConstraint(
@@ -23,16 +43,51 @@ class Task(Base):
             f"priority IN ({_priority_values})",
             name="check_priority_values",
         ),
+        # Filtros por status e intervalo de vencimento
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+        Index("ix_tasks_assigned_to_status", "assigned_to", "status"),
+        # Tarefas em aberto por vencimento, na mesma ordem da paginação
+        # (overdue, due-soon, due-today)
+        Index(
+            "ix_tasks_open_due_date",
+            "due_date",
+            "id",
+            postgresql_where=_open_tasks,
+            sqlite_where=_open_tasks,
+        ),
+        # Ordenações do parâmetro sort=, com o id como desempate
+        Index("ix_tasks_title_id", "title", "id"),
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+        Index("ix_tasks_priority_rank_id", text(f"({PRIORITY_RANK_SQL})"), "id"),
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
     )
 
     title: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     description: Mapped[str] = mapped_column(String(500), nullable=True)
     status: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True, default=TaskStatus.PENDING.value
+        String(50), nullable=False, default=TaskStatus.PENDING.value
     )
     priority: Mapped[str] = mapped_column(
-        String(50), nullable=False, default=TaskPriority.MEDIUM.value
+        String(50), nullable=False, index=True, default=TaskPriority.MEDIUM.value
     )
     due_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     assigned_to: Mapped[str] = mapped_column(String(100), nullable=True)
-    tags: Mapped[str] = mapped_column(String(500), nullable=True, default="[]")
+    tags: Mapped[List[str]] = mapped_column(
+        TagsType, nullable=False, default=list, server_default=text("'[]'")
+    )
+    # Contador de versões: o ORM inclui "version = ?" no WHERE de UPDATE e
+    # DELETE e o incrementa a cada escrita (concorrência otimista)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
+    )
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+register_search_ddl(Task.__table__)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(POSTGRES_TAGS_INDEX_DDL).execute_if(dialect="postgresql"),
+)
@@ -1,22 +1,52 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import (BaseModel, ConfigDict, Field, field_validator,
+                      model_validator)
 
 from app.models.enums import TaskPriority, TaskStatus
 
+MAX_TAGS = 20
+MAX_TAG_LENGTH = 50
+# Tamanhos das colunas em app.models.task
+MAX_TITLE_LENGTH = 100
+MAX_DESCRIPTION_LENGTH = 500
+MAX_ASSIGNEE_LENGTH = 100
+
+# Texto sem espaços nas pontas e nunca vazio, como exige o schema de resposta
+INPUT_CONFIG = ConfigDict(str_strip_whitespace=True, str_min_length=1)
+
+
+def normalize_tags(tags: List[str]) -> List[str]:
+    """Strip, lowercase and de-duplicate tags, keeping their order."""
+    normalized: List[str] = []
+    for tag in tags:
+        tag = tag.strip().lower()
+        if not tag:
+            raise ValueError("Tags cannot be empty")
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Tags must be at most {MAX_TAG_LENGTH} characters")
+        if tag not in normalized:
+            normalized.append(tag)
+    if len(normalized) > MAX_TAGS:
+        raise ValueError(f"A task can have at most {MAX_TAGS} tags")
+    return normalized
+
 
 class TaskBase(BaseModel):
-    title: str
-    description: Optional[str] = None
+    title: str = Field(max_length=MAX_TITLE_LENGTH)
+    description: Optional[str] = Field(None, max_length=MAX_DESCRIPTION_LENGTH)
     status: TaskStatus = TaskStatus.PENDING
     priority: TaskPriority = TaskPriority.MEDIUM
     due_date: Optional[datetime] = None
-    assigned_to: Optional[str] = None
+    assigned_to: Optional[str] = Field(None, max_length=MAX_ASSIGNEE_LENGTH)
+    tags: List[str] = []
+
+    model_config = INPUT_CONFIG
 
     @field_validator("title")
     def validate_title(cls, value: str) -> str:
-        if not value and not value.strip():
+        if not value or not value.strip():
             raise ValueError("Title cannot be empty")
         return value.strip()
 
@@ -32,24 +62,59 @@ class TaskBase(BaseModel):
             raise ValueError(f"Invalid priority: {value}")
         return value
 
+    @field_validator("tags")
+    def validate_tags(cls, value: List[str]) -> List[str]:
+        return normalize_tags(value)
+
 
 class TaskCreate(TaskBase):
     pass
 
 
 class TaskUpdate(BaseModel):
-    title: Optional[str] = None
-    description: Optional[str] = None
+    title: Optional[str] = Field(None, max_length=MAX_TITLE_LENGTH)
+    description: Optional[str] = Field(None, max_length=MAX_DESCRIPTION_LENGTH)
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     due_date: Optional[datetime] = None
-    assigned_to: Optional[str] = None
+    assigned_to: Optional[str] = Field(None, max_length=MAX_ASSIGNEE_LENGTH)
+    tags: Optional[List[str]] = None
+    # Versão lida pelo cliente: se a tarefa já mudou, a escrita falha (409)
+    version: Optional[int] = None
+
+    model_config = INPUT_CONFIG
+
+    @field_validator("tags")
+    def validate_tags(cls, value: Optional[List[str]]) -> List[str]:
+        # Só roda quando o campo é enviado: null esvazia as tags (coluna NOT NULL)
+        return normalize_tags(value or [])
+
+    @model_validator(mode="after")
+    def reject_null_required(self) -> "TaskUpdate":
+        # Colunas NOT NULL: null só é aceito quando o campo não é enviado
+        for field in ("title", "status", "priority"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class TaskPatch(TaskUpdate):
+    """JSON Merge Patch (RFC 7386) of a task.
+
+    Members that are present are written; ``null`` clears a nullable field
+    (and empties ``tags``). Unknown members and ``null`` for a required
+    field are rejected. ``version`` is the expected version, not a field to
+    write.
+    """
+
+    model_config = ConfigDict(extra="forbid")
 
 
 class Task(TaskBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -58,3 +123,43 @@ class Task(TaskBase):
         str_min_length=1,
         str_max_length=500,
     )
+
+
+class TaskBulkUpdate(TaskUpdate):
+    id: int
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    success: bool
+    error: Optional[str] = None
+    task: Optional[Task] = None
+
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class TaskBatch(BaseModel):
+    tasks: List[Task]
+    missing: List[int]
+
+
+class AssigneeWorkload(BaseModel):
+    assigned_to: Optional[str] = None
+    total: int
+    open: int
+    overdue: int
+
+
+class TaskStats(BaseModel):
+    total: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    overdue: int
+    due_today: int
+    due_date_histogram: Dict[str, int]
+    workload: List[AssigneeWorkload]
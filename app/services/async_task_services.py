@@ -0,0 +1,199 @@
+from datetime import date
+from typing import (Any, AsyncIterator, Callable, Dict, Iterable, List,
+                    Optional, Sequence, TypeVar, Union)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from app.models.task import Task
+from app.schemas.task import BulkResult, TaskCreate, TaskStats, TaskUpdate
+from app.services.pagination import Page
+from app.services.task_cache import TaskCache
+from app.services.task_events import TaskEventType, deleted_event, task_event
+from app.services.task_services import EXPORT_BATCH_SIZE, TaskServices
+
+T = TypeVar("T")
+
+
+class AsyncTaskServices:
+    """Awaitable variant of TaskServices used by the async routes.
+
+    With an AsyncSession (asyncpg/aiosqlite) the sync service code runs via
+    ``AsyncSession.run_sync``, so database I/O is awaited on the event loop
+    instead of holding a threadpool worker. With a regular Session each call
+    is dispatched to the threadpool, matching the previous sync routes.
+    """
+
+    def __init__(
+        self,
+        db: Union[AsyncSession, Session],
+        cache: Optional[TaskCache] = None,
+        events=None,
+    ):
+        self.db = db
+        self.cache = cache
+        self.events = events
+
+    @property
+    def is_async(self) -> bool:
+        return isinstance(self.db, AsyncSession)
+
+    async def run(self, method: Callable[..., T], *args, **kwargs) -> T:
+        """Run a TaskServices method against the underlying session."""
+        if self.is_async:
+            return await self.db.run_sync(
+                lambda session: method(TaskServices(session), *args, **kwargs)
+            )
+        return await run_in_threadpool(method, TaskServices(self.db), *args, **kwargs)
+
+    async def _page(self, method: Callable[..., Page], *args, **kwargs) -> Page:
+        """Run a list/filter query through the read-through cache, if any."""
+        if self.cache is None:
+            return await self.run(method, *args, **kwargs)
+        return await self.cache.get_page(
+            method.__name__,
+            [args, kwargs],
+            lambda: self.run(method, *args, **kwargs),
+            fields=kwargs.get("fields"),
+        )
+
+    async def _changed(
+        self,
+        event_type: TaskEventType,
+        tasks: Iterable[Any] = (),
+        deleted_ids: Iterable[int] = (),
+    ) -> None:
+        """Invalidate cached reads and publish change events after a write."""
+        tasks, deleted_ids = list(tasks), list(deleted_ids)
+        if not tasks and not deleted_ids:
+            return
+        if self.cache is not None:
+            await self.cache.invalidate([task.id for task in tasks] + deleted_ids)
+        if self.events is not None:
+            for task in tasks:
+                await self.events.publish(task_event(event_type, task))
+            for task_id in deleted_ids:
+                await self.events.publish(deleted_event(task_id))
+
+    async def list_tasks(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.list_tasks, *args, **kwargs)
+
+    async def get_task(self, task_id: int) -> Union[Task, Dict[str, Any], None]:
+        if self.cache is None:
+            return await self.run(TaskServices.get_task, task_id)
+        return await self.cache.get_task(
+            task_id, lambda: self.run(TaskServices.get_task, task_id)
+        )
+
+    async def get_tasks(
+        self, task_ids: Sequence[int]
+    ) -> Dict[int, Union[Task, Dict[str, Any]]]:
+        if self.cache is None:
+            return await self.run(TaskServices.get_tasks, task_ids)
+        return await self.cache.get_tasks(
+            task_ids, lambda missing: self.run(TaskServices.get_tasks, missing)
+        )
+
+    async def create_task(self, task_data: TaskCreate) -> Task:
+        task = await self.run(TaskServices.create_task, task_data)
+        await self._changed(TaskEventType.CREATED, [task])
+        return task
+
+    async def update_task(
+        self, task_id: int, task_data: TaskUpdate, if_match: Optional[str] = None
+    ) -> Optional[Task]:
+        task = await self.run(TaskServices.update_task, task_id, task_data, if_match)
+        if task is not None:
+            await self._changed(TaskEventType.UPDATED, [task])
+        return task
+
+    async def delete_task(
+        self,
+        task_id: int,
+        if_match: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> bool:
+        deleted = await self.run(TaskServices.delete_task, task_id, if_match, version)
+        if deleted:
+            await self._changed(TaskEventType.DELETED, deleted_ids=[task_id])
+        return deleted
+
+    async def bulk_create_tasks(self, *args, **kwargs) -> BulkResult:
+        result = await self.run(TaskServices.bulk_create_tasks, *args, **kwargs)
+        await self._changed(TaskEventType.CREATED, _written(result))
+        return result
+
+    async def bulk_update_tasks(self, *args, **kwargs) -> BulkResult:
+        result = await self.run(TaskServices.bulk_update_tasks, *args, **kwargs)
+        await self._changed(TaskEventType.UPDATED, _written(result))
+        return result
+
+    async def bulk_delete_tasks(self, *args, **kwargs) -> BulkResult:
+        result = await self.run(TaskServices.bulk_delete_tasks, *args, **kwargs)
+        await self._changed(
+            TaskEventType.DELETED,
+            deleted_ids=[item.id for item in result.results if item.success],
+        )
+        return result
+
+    async def filter_tasks_by_status(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.filter_tasks_by_status, *args, **kwargs)
+
+    async def filter_tasks_by_priority(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.filter_tasks_by_priority, *args, **kwargs)
+
+    async def filter_tasks_by_assigned_to(self, *args, **kwargs) -> Page:
+        return await self._page(
+            TaskServices.filter_tasks_by_assigned_to, *args, **kwargs
+        )
+
+    async def get_overdue_tasks(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.get_overdue_tasks, *args, **kwargs)
+
+    async def get_tasks_due_soon(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.get_tasks_due_soon, *args, **kwargs)
+
+    async def get_tasks_due_today(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.get_tasks_due_today, *args, **kwargs)
+
+    async def search_tasks(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.search_tasks, *args, **kwargs)
+
+    async def filter_tasks_advanced(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.filter_tasks_advanced, *args, **kwargs)
+
+    async def query_tasks(self, *args, **kwargs) -> Page:
+        return await self._page(TaskServices.query_tasks, *args, **kwargs)
+
+    async def get_task_stats(self) -> Union[TaskStats, Dict[str, Any]]:
+        if self.cache is None:
+            return await self.run(TaskServices.get_task_stats)
+
+        async def load() -> Dict[str, Any]:
+            stats = await self.run(TaskServices.get_task_stats)
+            return stats.model_dump(mode="json")
+
+        # Os buckets de vencimento dependem do dia corrente
+        return await self.cache.get_value("stats", [date.today()], load)
+
+    async def export_tasks(
+        self, batch_size: int = EXPORT_BATCH_SIZE, **criteria
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream export batches without blocking the event loop."""
+        if self.is_async:
+            stmt = await self.run(TaskServices.export_statement, **criteria)
+            result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
+            async for partition in result.partitions():
+                yield [row._asdict() for row in partition]
+        else:
+            batches = TaskServices(self.db).export_tasks(
+                batch_size=batch_size, **criteria
+            )
+            async for rows in iterate_in_threadpool(batches):
+                yield rows
+
+
+def _written(result: BulkResult) -> List[Any]:
+    """Tasks successfully created/updated by a bulk operation."""
+    return [item.task for item in result.results if item.success]
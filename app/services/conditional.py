@@ -0,0 +1,118 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, List, Mapping, Optional, Union
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class PreconditionFailedError(Exception):
+    """Raised when an If-Match precondition does not hold."""
+
+
+class VersionConflictError(Exception):
+    """Raised when a write names a task version that is no longer current."""
+
+
+def _as_utc(value: Union[datetime, str]) -> datetime:
+    """Timestamps are stored naive in UTC; cached tasks carry ISO strings."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def task_etag(task_id: int, updated_at: Union[datetime, str]) -> str:
+    """Strong ETag of a single task: its id and updated_at in microseconds."""
+    # Aritmética inteira: o ETag precisa ser reversível (if_match_versions)
+    micros = (_as_utc(updated_at) - EPOCH) // MICROSECOND
+    return f'"{task_id}-{micros:x}"'
+
+
+def if_match_versions(header: str, task_id: int) -> Optional[List[datetime]]:
+    """The ``updated_at`` values an If-Match header accepts for a task.
+
+    Inverse of ``task_etag``, so the precondition can be checked by the
+    UPDATE/DELETE itself. None stands for ``*`` (any version); weak or
+    foreign ETags accept nothing.
+    """
+    if header.strip() == "*":
+        return None
+    versions = []
+    for candidate in (value.strip() for value in header.split(",")):
+        if len(candidate) < 2 or candidate[0] != '"' or candidate[-1] != '"':
+            continue
+        etag_id, _, micros = candidate[1:-1].rpartition("-")
+        try:
+            if int(etag_id) == task_id:
+                updated_at = EPOCH + int(micros, 16) * MICROSECOND
+                versions.append(updated_at.replace(tzinfo=None))
+        except ValueError:
+            continue
+    return versions
+
+
+def content_etag(body: bytes, *parts: Any) -> str:
+    """Weak ETag of a list page: a digest of the exact bytes being sent.
+
+    ``parts`` (e.g. the next cursor) cover what is returned outside the body.
+    """
+    digest = hashlib.sha1(body)
+    for part in parts:
+        digest.update(b"|" + str(part).encode())
+    return f'W/"{digest.hexdigest()[:20]}"'
+
+
+def http_date(value: Union[datetime, str]) -> str:
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(header: str, etag: str, weak: bool = False) -> bool:
+    """Whether an If-Match/If-None-Match header value matches ``etag``.
+
+    If-None-Match uses weak comparison; If-Match requires a strong match.
+    """
+    if header.strip() == "*":
+        return True
+    for candidate in (value.strip() for value in header.split(",")):
+        if weak and _opaque(candidate) == _opaque(etag):
+            return True
+        if not weak and candidate == etag and not etag.startswith("W/"):
+            return True
+    return False
+
+
+def is_not_modified(
+    headers: Mapping[str, str],
+    etag: str,
+    last_modified: Optional[Union[datetime, str]],
+) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag, weak=True)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[Union[datetime, str]]) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
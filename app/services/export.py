@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        # Tags: array JSON numa única célula
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def encode_ndjson(rows: List[Dict[str, Any]]) -> str:
+    """Encode a batch of rows as newline-delimited JSON."""
+    return "".join(
+        json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def encode_csv(
+    rows: List[Dict[str, Any]], columns: Sequence[str], header: bool = False
+) -> str:
+    """Encode a batch of rows as CSV, optionally preceded by the header."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    if header:
+        writer.writeheader()
+    writer.writerows(
+        {key: _csv_value(value) for key, value in row.items()} for row in rows
+    )
+    return buffer.getvalue()
+
+
+def encode_batch(
+    rows: List[Dict[str, Any]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    first: bool = False,
+) -> str:
+    """Encode one batch of rows in the requested export format."""
+    if export_format == ExportFormat.CSV:
+        return encode_csv(rows, columns, header=first)
+    return encode_ndjson(rows)
+
+
+async def encode_stream(
+    batches: AsyncIterator[List[Dict[str, Any]]],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+) -> AsyncIterator[str]:
+    """Encode batches as they arrive; CSV always carries its header line."""
+    first = True
+    async for rows in batches:
+        yield encode_batch(rows, export_format, columns, first=first)
+        first = False
+    if first and export_format == ExportFormat.CSV:
+        yield encode_csv([], columns, header=True)
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.core import settings
+from app.core.cache import create_cache
+from app.core.events import create_broker
+from app.database import SessionLocal
+from app.services.task_cache import TaskCache
+from app.services.task_events import TaskEventType, task_event
+from app.services.task_services import TaskServices
+
+logger = logging.getLogger(__name__)
+
+OnChange = Callable[[List[Any]], Awaitable[None]]
+
+
+class SweeperMetrics:
+    """Counters of the overdue sweeper in this process."""
+
+    def __init__(self):
+        self.runs = 0
+        self.errors = 0
+        self.marked = 0
+        self.cleared = 0
+        self.batches = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "tasks_marked_overdue": self.marked,
+            "tasks_cleared": self.cleared,
+            "batches": self.batches,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_seconds": round(self.last_duration, 6),
+        }
+
+
+class OverdueSweeper:
+    """Periodically maintains TaskStatus.OVERDUE in batched UPDATEs.
+
+    Pending tasks whose due date has passed become OVERDUE; OVERDUE tasks
+    whose due date was moved forward go back to PENDING. IN_PROGRESS tasks
+    are never touched. ``on_change`` receives each batch of updated rows
+    (cache invalidation, change events).
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        interval: float,
+        batch_size: int,
+        on_change: Optional[OnChange] = None,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.on_change = on_change
+        self.metrics = SweeperMetrics()
+
+    def _batch(self, method: Callable[[TaskServices, int], List[Any]]) -> List[Any]:
+        with self.session_factory() as db:
+            return method(TaskServices(db), self.batch_size)
+
+    async def _drain(self, method: Callable[[TaskServices, int], List[Any]]) -> int:
+        total = 0
+        while True:
+            rows = await run_in_threadpool(self._batch, method)
+            if rows:
+                self.metrics.batches += 1
+                total += len(rows)
+                if self.on_change is not None:
+                    await self.on_change(rows)
+            if len(rows) < self.batch_size:
+                return total
+
+    async def sweep(self) -> int:
+        """Run one full sweep; returns how many tasks changed status."""
+        start = time.perf_counter()
+        marked = await self._drain(TaskServices.mark_overdue_tasks)
+        cleared = await self._drain(TaskServices.clear_overdue_tasks)
+
+        self.metrics.runs += 1
+        self.metrics.marked += marked
+        self.metrics.cleared += cleared
+        self.metrics.last_run_at = datetime.now(timezone.utc)
+        self.metrics.last_duration = time.perf_counter() - start
+        if marked or cleared:
+            logger.info("Overdue sweep: %d marked, %d cleared", marked, cleared)
+        return marked + cleared
+
+    async def run(self) -> None:
+        """Sweep every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                await self.sweep()
+            except SQLAlchemyError:
+                self.metrics.errors += 1
+                logger.error("Overdue sweep failed", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+def change_notifier(task_cache=None, broker=None) -> OnChange:
+    """on_change callback invalidating the read cache and publishing events."""
+
+    async def notify(rows: List[Any]) -> None:
+        if task_cache is not None:
+            await task_cache.invalidate([row.id for row in rows])
+        if broker is not None:
+            for row in rows:
+                await broker.publish(task_event(TaskEventType.UPDATED, row))
+
+    return notify
+
+
+async def main() -> None:
+    """Standalone worker: ``python -m app.services.overdue_sweeper``."""
+    cache = await create_cache(settings)
+    broker = await create_broker(settings)
+    task_cache = (
+        TaskCache(cache, settings.cache_ttl, settings.cache_list_ttl)
+        if cache is not None
+        else None
+    )
+    sweeper = OverdueSweeper(
+        SessionLocal,
+        interval=settings.overdue_sweep_interval,
+        batch_size=settings.overdue_sweep_batch_size,
+        on_change=change_notifier(task_cache, broker),
+    )
+    try:
+        await sweeper.run()
+    finally:
+        await broker.close()
+        if cache is not None:
+            await cache.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,190 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Sequence, Union
+
+from sqlalchemy import and_, false, or_, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query, load_only
+from sqlalchemy.sql.elements import Label
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+# Colunas do modelo ou expressões rotuladas (ex.: relevância da busca)
+SortKey = Union[InstrumentedAttribute, Label]
+
+# Bancos em que NULL vem antes dos demais valores na ordem ascendente
+NULLS_FIRST_DIALECTS = {"sqlite", "mysql", "mariadb"}
+
+
+class Sort(NamedTuple):
+    """A sort key with its direction.
+
+    Bare keys passed to ``paginate`` are ascending and never NULL. NULLs of
+    ``nullable`` keys are placed where the database puts them by default
+    (first on SQLite, last on Postgres), so plain indexes serve the ORDER BY.
+    """
+
+    key: SortKey
+    descending: bool = False
+    nullable: bool = False
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    # ETag do corpo já codificado, quando conhecido (páginas em cache)
+    etag: Optional[str] = None
+
+
+def sort_tag(sorts: Sequence[Sort]) -> str:
+    """Short hash of the sort spec (key names and directions) of a cursor."""
+    spec = ",".join(
+        ("-" if sort.descending else "")
+        + (sort.key.name if isinstance(sort.key, Label) else sort.key.key)
+        for sort in sorts
+    )
+    return hashlib.sha1(spec.encode()).hexdigest()[:8]
+
+
+def encode_cursor(values: Sequence[Any], tag: str = "") -> str:
+    """Encode the sort key values of the last row into an opaque cursor.
+
+    ``tag`` identifies the sort that produced the values (see ``sort_tag``).
+    """
+    payload = {
+        "s": tag,
+        "v": [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey], tag: str = "") -> List[Any]:
+    """Decode a cursor back into typed values for the given sort keys.
+
+    Cursors produced under a different sort (another ``tag``) are rejected:
+    their values would be compared against the wrong columns.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, dict) or payload.get("s") != tag:
+            raise ValueError("cursor was produced by another sort")
+        values = payload.get("v")
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        return [
+            datetime.fromisoformat(value)
+            if key.type.python_type is datetime and value is not None
+            else value
+            for key, value in zip(keys, values)
+        ]
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from exc
+
+
+def paginate(
+    query: Query,
+    keys: Sequence[Union[SortKey, Sort]],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    columns: Optional[Sequence[InstrumentedAttribute]] = None,
+) -> Page:
+    """Apply keyset pagination over ``keys`` to ``query``.
+
+    Rows after the cursor are selected with a row-value comparison on the
+    sort keys, so every page is an index range scan regardless of depth.
+    Descending or nullable keys (see ``Sort``) use the equivalent expanded
+    comparison instead. Labeled expressions are added to the selected
+    columns so their values can be carried in the cursor; the page items
+    are still the entities.
+
+    With ``columns``, only those columns (plus the sort keys, needed for
+    the cursor) are loaded; the other attributes stay deferred.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    sorts = [key if isinstance(key, Sort) else Sort(key) for key in keys]
+    keys = [sort.key for sort in sorts]
+    tag = sort_tag(sorts)
+    labels = [key for key in keys if isinstance(key, Label)]
+    expressions = [key.element if isinstance(key, Label) else key for key in keys]
+
+    if columns:
+        key_columns = [key for key in keys if not isinstance(key, Label)]
+        query = query.options(load_only(*columns, *key_columns))
+
+    if cursor:
+        values = decode_cursor(cursor, keys, tag)
+        if any(sort.descending or sort.nullable for sort in sorts):
+            nulls_first = query.session.get_bind().dialect.name in NULLS_FIRST_DIALECTS
+            query = query.filter(_after(sorts, expressions, values, nulls_first))
+        elif len(keys) == 1:
+            query = query.filter(expressions[0] > values[0])
+        else:
+            query = query.filter(tuple_(*expressions) > tuple_(*values))
+
+    if labels:
+        query = query.add_columns(*labels)
+
+    order_by = [
+        expression.desc() if sort.descending else expression
+        for sort, expression in zip(sorts, expressions)
+    ]
+    # Busca um registro a mais para saber se existe próxima página
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(_key_values(rows[-1], keys, bool(labels)), tag)
+
+    if labels:
+        rows = [row[0] for row in rows]
+
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def _after(
+    sorts: Sequence[Sort],
+    expressions: Sequence[Any],
+    values: Sequence[Any],
+    nulls_first,
+):
+    """Rows strictly after ``values`` in the order given by ``sorts``.
+
+    Expands to ``k1 > v1 OR (k1 = v1 AND (k2 > v2 OR (...)))`` with the
+    comparison flipped for descending keys and NULLs placed where the
+    database sorts them.
+    """
+    condition = false()
+    for sort, expression, value in reversed(list(zip(sorts, expressions, values))):
+        # NULLs depois dos valores: NULLS LAST na ordem efetiva da chave
+        nulls_after = sort.descending == nulls_first
+        if value is None:
+            beyond = false() if nulls_after else expression.is_not(None)
+            equal = expression.is_(None)
+        else:
+            beyond = expression < value if sort.descending else expression > value
+            if sort.nullable and nulls_after:
+                beyond = or_(beyond, expression.is_(None))
+            equal = expression == value
+        condition = or_(beyond, and_(equal, condition))
+    return condition
+
+
+def _key_values(row: Any, keys: Sequence[SortKey], has_labels: bool) -> List[Any]:
+    entity = row[0] if has_labels else row
+    return [
+        getattr(row, key.name) if isinstance(key, Label) else getattr(entity, key.key)
+        for key in keys
+    ]
@@ -0,0 +1,100 @@
+import re
+from typing import List, Optional
+
+from sqlalchemy import (Double, Float, cast, false, func, literal_column, or_,
+                        type_coerce)
+from sqlalchemy.sql.elements import ColumnElement, Label
+
+from app.models.search import SEARCH_VECTOR_COLUMN, tasks_fts
+from app.models.task import Task
+
+# Palavras do termo de busca; o restante (operadores, aspas) é descartado
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def search_words(search_term: str) -> List[str]:
+    return WORD_PATTERN.findall(search_term.lower())
+
+
+class LikeSearch:
+    """Substring search with ILIKE; works everywhere but scans the table."""
+
+    def match(self, query, search_term: str):
+        search_pattern = f"%{search_term}%"
+        return query.filter(
+            or_(
+                Task.title.ilike(search_pattern),
+                Task.description.ilike(search_pattern),
+            )
+        )
+
+    def rank(self, search_term: str) -> Optional[Label]:
+        return None
+
+
+class SqliteSearch:
+    """FTS5 search over the ``tasks_fts`` external content table.
+
+    Every word is matched as a prefix and results are ranked with bm25,
+    weighting title matches above description matches.
+    """
+
+    fts = literal_column("tasks_fts")
+
+    def _fts_query(self, search_term: str) -> str:
+        return " ".join(f'"{word}"*' for word in search_words(search_term))
+
+    def match(self, query, search_term: str):
+        fts_query = self._fts_query(search_term)
+        if not fts_query:
+            return query.filter(false())
+        return query.join(tasks_fts, tasks_fts.c.rowid == Task.id).filter(
+            self.fts.op("MATCH")(fts_query)
+        )
+
+    def rank(self, search_term: str) -> Optional[Label]:
+        if not search_words(search_term):
+            return None
+        # bm25 é menor para resultados mais relevantes
+        return type_coerce(func.bm25(self.fts, 10.0, 1.0), Float).label("rank")
+
+
+class PostgresSearch:
+    """Full-text search on the generated ``search_vector`` column (GIN index).
+
+    Every word is matched as a prefix (``word:*``) and results are ranked
+    with ``ts_rank_cd``.
+    """
+
+    vector = literal_column(SEARCH_VECTOR_COLUMN)
+
+    def _ts_query(self, search_term: str) -> Optional[ColumnElement]:
+        words = search_words(search_term)
+        if not words:
+            return None
+        return func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+
+    def match(self, query, search_term: str):
+        ts_query = self._ts_query(search_term)
+        if ts_query is None:
+            return query.filter(false())
+        return query.filter(self.vector.op("@@")(ts_query))
+
+    def rank(self, search_term: str) -> Optional[Label]:
+        ts_query = self._ts_query(search_term)
+        if ts_query is None:
+            return None
+        # Negativo para que a ordenação ascendente traga os mais relevantes;
+        # double precision para o valor voltar idêntico no cursor
+        return cast(-func.ts_rank_cd(self.vector, ts_query), Double).label("rank")
+
+
+SEARCH_BACKENDS = {
+    "sqlite": SqliteSearch,
+    "postgresql": PostgresSearch,
+}
+
+
+def get_search_backend(dialect_name: str):
+    """Pick the full-text search backend for the current database."""
+    return SEARCH_BACKENDS.get(dialect_name, LikeSearch)()
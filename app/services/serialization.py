@@ -0,0 +1,62 @@
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from pydantic_core import to_json, to_jsonable_python
+
+from app.schemas.task import Task as TaskSchema
+
+# Mesma ordem de campos da resposta validada pelo schema
+TASK_FIELDS = tuple(TaskSchema.model_fields)
+
+
+def parse_fields(raw: Optional[str]) -> Optional[tuple]:
+    """Validate a ``fields=`` sparse fieldset, in response order.
+
+    ``id`` is always included; None (or an empty value) selects every field.
+    Raises ValueError naming any unknown field.
+    """
+    if not raw:
+        return None
+    requested = {field.strip() for field in raw.split(",") if field.strip()}
+    unknown = requested - set(TASK_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(TASK_FIELDS)}"
+        )
+    requested.add("id")
+    return tuple(field for field in TASK_FIELDS if field in requested)
+
+
+def task_fields(task: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Read the response fields of an ORM task (or project a cached dict)."""
+    if isinstance(task, dict):
+        return task if fields is None else {field: task[field] for field in fields}
+    return {field: getattr(task, field) for field in fields or TASK_FIELDS}
+
+
+def serialize_task(task: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """JSON-ready representation of a task, as returned by the API.
+
+    Rows come from the database, so the schema's input validators are not
+    run again; pydantic-core only converts datetimes and enums.
+    """
+    return to_jsonable_python(task_fields(task, fields))
+
+
+def dump_tasks(tasks: Iterable[Any], fields: Optional[Sequence[str]] = None) -> bytes:
+    """Encode ORM tasks and/or cached dicts as a JSON array in one pass."""
+    return to_json([task_fields(task, fields) for task in tasks])
+
+
+def dump_task_batch(
+    tasks: Iterable[Any],
+    missing: Sequence[int],
+    fields: Optional[Sequence[str]] = None,
+) -> bytes:
+    """Encode a lookup by ids: the tasks found, in order, and the missing ids."""
+    return to_json(
+        {
+            "tasks": [task_fields(task, fields) for task in tasks],
+            "missing": list(missing),
+        }
+    )
@@ -0,0 +1,69 @@
+from typing import Sequence
+
+from sqlalchemy import (and_, cast, distinct, exists, func, or_, select,
+                        type_coerce)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import Text
+
+from app.models.task import Task
+
+
+class JsonTags:
+    """Tag filters over SQLite's ``json_each``; correct but scans the table."""
+
+    def _values(self):
+        return func.json_each(Task.tags).table_valued("value")
+
+    def any(self, tags: Sequence[str]) -> ColumnElement:
+        values = self._values()
+        return exists(select(1).select_from(values).where(values.c.value.in_(tags)))
+
+    def all(self, tags: Sequence[str]) -> ColumnElement:
+        values = self._values()
+        matched = (
+            select(func.count(distinct(values.c.value)))
+            .where(values.c.value.in_(tags))
+            .scalar_subquery()
+        )
+        return matched == len(set(tags))
+
+
+class PostgresTags:
+    """Tag filters with the JSONB ``?|`` / ``?&`` operators (GIN index)."""
+
+    # A coluna é declarada como JSON com variante JSONB: expõe os operadores
+    tags = type_coerce(Task.tags, JSONB)
+
+    def _array(self, tags: Sequence[str]):
+        return cast(list(tags), ARRAY(Text))
+
+    def any(self, tags: Sequence[str]) -> ColumnElement:
+        return self.tags.has_any(self._array(tags))
+
+    def all(self, tags: Sequence[str]) -> ColumnElement:
+        return self.tags.has_all(self._array(tags))
+
+
+class LikeTags:
+    """Fallback matching on the serialized JSON text."""
+
+    def _contains(self, tag: str) -> ColumnElement:
+        return cast(Task.tags, Text).contains(f'"{tag}"')
+
+    def any(self, tags: Sequence[str]) -> ColumnElement:
+        return or_(*(self._contains(tag) for tag in tags))
+
+    def all(self, tags: Sequence[str]) -> ColumnElement:
+        return and_(*(self._contains(tag) for tag in tags))
+
+
+TAG_BACKENDS = {
+    "sqlite": JsonTags,
+    "postgresql": PostgresTags,
+}
+
+
+def get_tag_backend(dialect_name: str):
+    """Pick the tag filter implementation for the current database."""
+    return TAG_BACKENDS.get(dialect_name, LikeTags)()
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import uuid
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Optional,
+                    Sequence)
+
+from app.core.cache import MemoryCache
+from app.services.conditional import content_etag
+from app.services.pagination import Page
+from app.services.serialization import dump_tasks, serialize_task
+
+VERSION_KEY = "tasks:version"
+# Gerações por tarefa vivem mais que os itens; se expirarem ou forem
+# despejadas pelo LRU, a leitura cria um token novo (nunca reaproveitado)
+GENERATION_TTL_FACTOR = 2
+
+
+class LookupStats:
+    """Hits and misses of TaskCache lookups, counted whatever the backend."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hits: int = 0, misses: int = 0) -> None:
+        self.hits += hits
+        self.misses += misses
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class TaskCache:
+    """Read-through cache for task lookups and list/filter pages.
+
+    Single tasks are stored under ``tasks:item:<id>:<generation>``, where
+    the generation is a random token stored under ``tasks:gen:<id>`` and
+    replaced on every write to the task. A reader that loaded the row before
+    a write stores it under the old generation, which is no longer read, so
+    a stale row cannot be put back after the invalidation. List and filter
+    pages are stored under keys that embed a global version token, replaced
+    on every write, so all cached pages become unreachable at once and
+    simply expire by TTL.
+
+    Tokens are never reused: when a generation or the version is missing
+    (expired, or evicted by an LRU backend), the reader stores a new token
+    before loading, and the lookup is a miss.
+
+    An optional ``local`` in-process cache sits in front of the backend for
+    single-task lookups. Writes in this process clear it immediately; writes
+    in other workers are picked up once ``local_ttl`` expires.
+    """
+
+    def __init__(
+        self,
+        backend,
+        ttl: int,
+        list_ttl: int,
+        local: Optional[MemoryCache] = None,
+        local_ttl: int = 5,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.list_ttl = list_ttl
+        self.local = local
+        self.local_ttl = local_ttl
+        # Tarefas (por id) e páginas/agregados, servidas pelo cache ou não
+        self.task_lookups = LookupStats()
+        self.page_lookups = LookupStats()
+
+    @staticmethod
+    def item_key(task_id: int, generation: Optional[str] = None) -> str:
+        """Key of a task; the local cache leaves out the generation."""
+        if generation is None:
+            return f"tasks:item:{task_id}"
+        return f"tasks:item:{task_id}:{generation}"
+
+    @staticmethod
+    def generation_key(task_id: int) -> str:
+        return f"tasks:gen:{task_id}"
+
+    async def shared_keys(self, task_ids: Sequence[int]) -> Dict[int, str]:
+        """Backend keys of the tasks at their current generation (one MGET).
+
+        Tasks without a generation get a new one, stored before the caller
+        loads them; their keys are new, so the lookup is a miss.
+        """
+        generations = dict(
+            zip(
+                task_ids,
+                await self.backend.get_many(
+                    [self.generation_key(task_id) for task_id in task_ids]
+                ),
+            )
+        )
+        missing = [task_id for task_id, gen in generations.items() if gen is None]
+        if missing:
+            generation = uuid.uuid4().hex
+            await self.backend.set_many(
+                {self.generation_key(task_id): generation for task_id in missing},
+                self.ttl * GENERATION_TTL_FACTOR,
+            )
+            generations.update(dict.fromkeys(missing, generation))
+        return {
+            task_id: self.item_key(task_id, generation)
+            for task_id, generation in generations.items()
+        }
+
+    async def version(self) -> str:
+        """Current list version token; a missing one is replaced first."""
+        version = await self.backend.get(VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            await self.backend.set(VERSION_KEY, version)
+        return version
+
+    @staticmethod
+    def page_key(version: str, name: str, params: Any) -> str:
+        raw = json.dumps(params, default=str, sort_keys=True)
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return f"tasks:v{version}:{name}:{digest}"
+
+    async def get_task(
+        self, task_id: int, loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        key = self.item_key(task_id)
+        if self.local is not None:
+            cached = await self.local.get(key)
+            if cached is not None:
+                self.task_lookups.record(hits=1)
+                return cached
+
+        (shared_key,) = (await self.shared_keys([task_id])).values()
+        cached = await self.backend.get(shared_key)
+        self.task_lookups.record(hits=cached is not None, misses=cached is None)
+        if cached is None:
+            task = await loader()
+            if task is None:
+                return None
+            cached = serialize_task(task)
+            await self.backend.set(shared_key, cached, self.ttl)
+
+        if self.local is not None:
+            await self.local.set(key, cached, self.local_ttl)
+        return cached
+
+    async def get_tasks(
+        self,
+        task_ids: Sequence[int],
+        loader: Callable[[List[int]], Awaitable[Dict[int, Any]]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Cached tasks by id; ``loader`` fetches the misses in one call.
+
+        Looks in the local cache, then the backend with two multi-gets
+        (generations, then items), and loads only the remaining ids. Ids
+        that do not exist are absent from the result.
+        """
+        found: Dict[int, Dict[str, Any]] = {}
+        if self.local is not None:
+            found.update(
+                await self._get_many(
+                    self.local,
+                    {task_id: self.item_key(task_id) for task_id in task_ids},
+                )
+            )
+
+        remaining = [task_id for task_id in task_ids if task_id not in found]
+        keys = await self.shared_keys(remaining) if remaining else {}
+        shared = await self._get_many(self.backend, keys) if keys else {}
+
+        missing = [task_id for task_id in remaining if task_id not in shared]
+        self.task_lookups.record(hits=len(task_ids) - len(missing), misses=len(missing))
+        loaded = {}
+        if missing:
+            tasks = await loader(missing)
+            loaded = {task_id: serialize_task(task) for task_id, task in tasks.items()}
+            if loaded:
+                await self.backend.set_many(
+                    {keys[task_id]: task for task_id, task in loaded.items()},
+                    self.ttl,
+                )
+
+        fetched = {**shared, **loaded}
+        if self.local is not None and fetched:
+            await self.local.set_many(
+                {self.item_key(task_id): task for task_id, task in fetched.items()},
+                self.local_ttl,
+            )
+        found.update(fetched)
+        return found
+
+    async def _get_many(self, cache, keys: Dict[int, str]) -> Dict[int, Any]:
+        values = await cache.get_many(list(keys.values()))
+        return {
+            task_id: value for task_id, value in zip(keys, values) if value is not None
+        }
+
+    async def get_page(
+        self,
+        name: str,
+        params: Any,
+        loader: Callable[[], Awaitable[Page]],
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Cached page; ``fields`` (part of ``params``) is its sparse fieldset.
+
+        The entry keeps the ETag of the encoded page, so a revalidation hit
+        can be answered without encoding the items again.
+        """
+        key = self.page_key(await self.version(), name, params)
+        cached = await self.backend.get(key)
+        self.page_lookups.record(hits=cached is not None, misses=cached is None)
+        if cached is not None:
+            return Page(
+                items=cached["items"],
+                next_cursor=cached["next_cursor"],
+                etag=cached.get("etag"),
+            )
+
+        page = await loader()
+        items = [serialize_task(task, fields) for task in page.items]
+        etag = content_etag(dump_tasks(items), page.next_cursor)
+        await self.backend.set(
+            key,
+            {"items": items, "next_cursor": page.next_cursor, "etag": etag},
+            self.list_ttl,
+        )
+        return Page(items=items, next_cursor=page.next_cursor, etag=etag)
+
+    async def get_value(
+        self, name: str, params: Any, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Cache a JSON-ready aggregate (e.g. stats) until the next write."""
+        key = self.page_key(await self.version(), name, params)
+        cached = await self.backend.get(key)
+        self.page_lookups.record(hits=cached is not None, misses=cached is None)
+        if cached is not None:
+            return cached
+
+        value = await loader()
+        await self.backend.set(key, value, self.list_ttl)
+        return value
+
+    async def invalidate(self, task_ids: Iterable[int] = ()) -> None:
+        """Drop the given tasks and every cached list/filter page."""
+        task_ids = list(task_ids)
+        if self.local is not None:
+            await self.local.delete(*[self.item_key(task_id) for task_id in task_ids])
+        if task_ids:
+            # Nova geração: os itens antigos ficam inalcançáveis e expiram
+            generation = uuid.uuid4().hex
+            await self.backend.set_many(
+                {self.generation_key(task_id): generation for task_id in task_ids},
+                self.ttl * GENERATION_TTL_FACTOR,
+            )
+        await self.backend.set(VERSION_KEY, uuid.uuid4().hex)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters of this worker, plus its in-process caches.
+
+        ``tasks`` and ``pages`` count lookups served by any layer, so the hit
+        ratio is available with the Redis backend too.
+        """
+        stats: Dict[str, Any] = {
+            "backend": type(self.backend).__name__,
+            "tasks": self.task_lookups.snapshot(),
+            "pages": self.page_lookups.snapshot(),
+        }
+        if isinstance(self.backend, MemoryCache):
+            stats["memory"] = self.backend.snapshot()
+        if self.local is not None:
+            stats["local"] = self.local.snapshot()
+        return stats
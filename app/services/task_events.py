@@ -0,0 +1,71 @@
+import asyncio
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from app.models.enums import TaskPriority, TaskStatus
+from app.services.serialization import serialize_task
+
+
+class TaskEventType(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+def task_event(event_type: TaskEventType, task: Any) -> Dict[str, Any]:
+    """Event payload for a created/updated task (full body)."""
+    return {"type": event_type.value, "task": serialize_task(task)}
+
+
+def deleted_event(task_id: int) -> Dict[str, Any]:
+    return {"type": TaskEventType.DELETED.value, "task": {"id": task_id}}
+
+
+def matches(
+    event: Dict[str, Any],
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    assigned_to: Optional[str] = None,
+) -> bool:
+    """Server-side stream filter.
+
+    Deletions only carry the task id, so they are sent to every subscriber;
+    clients drop ids they do not hold.
+    """
+    if event["type"] == TaskEventType.DELETED.value:
+        return True
+    task = event["task"]
+    return (
+        (status is None or task["status"] == status.value)
+        and (priority is None or task["priority"] == priority.value)
+        and (assigned_to is None or task["assigned_to"] == assigned_to)
+    )
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    data = json.dumps(event["task"], ensure_ascii=False)
+    return f"event: {event['type']}\ndata: {data}\n\n"
+
+
+async def event_stream(
+    broker,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat: float,
+    **filters,
+) -> AsyncIterator[str]:
+    """Server-Sent Events for the broker's task events matching ``filters``.
+
+    A comment line is sent every ``heartbeat`` seconds without events so
+    proxies keep the connection open and disconnects are noticed.
+    """
+    async with broker.subscribe() as queue:
+        yield ": connected\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if matches(event, **filters):
+                yield format_sse(event)
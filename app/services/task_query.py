@@ -0,0 +1,258 @@
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from operator import ge, gt, le, lt
+from typing import (Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional,
+                    Tuple, Union)
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import and_, bindparam, false, func, not_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.enums import TaskPriority, TaskStatus
+from app.models.task import Task
+from app.schemas.task import normalize_tags
+from app.services.tags import get_tag_backend
+
+# Limites de uma expressão de filtro (POST /tasks/query)
+MAX_FILTER_DEPTH = 8
+MAX_FILTER_CONDITIONS = 100
+MAX_IN_VALUES = 1000
+
+EQUALITY = frozenset({"eq", "ne", "in", "not_in"})
+RANGE = frozenset({"gt", "gte", "lt", "lte"})
+NULL_CHECK = frozenset({"is_null"})
+TAG_MATCH = frozenset({"any", "all"})
+
+# Operadores cujo valor vira parâmetro; os demais fazem parte da estrutura
+BOUND_OPERATORS = EQUALITY | RANGE
+LIST_OPERATORS = frozenset({"in", "not_in", "any", "all"})
+COMPARISONS = {"gt": gt, "gte": ge, "lt": lt, "lte": le}
+
+
+class FilterField(NamedTuple):
+    column: Any
+    operators: FrozenSet[str]
+    parse: Callable[[Any], Any]
+    nullable: bool = False
+
+
+def _adapter(type_: Any) -> Callable[[Any], Any]:
+    return TypeAdapter(type_).validate_python
+
+
+def _enum_value(enum: Any) -> Callable[[Any], str]:
+    parse = _adapter(enum)
+    return lambda value: parse(value).value
+
+
+_timestamp = _adapter(Union[datetime, date])
+
+
+def _utc_naive(value: Any) -> datetime:
+    """Timestamps are stored naive in UTC; aware inputs are converted.
+
+    A bare date means midnight of that day.
+    """
+    value = _timestamp(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError("expected a string")
+    return value
+
+
+FILTER_FIELDS: Dict[str, FilterField] = {
+    "id": FilterField(Task.id, EQUALITY | RANGE, _adapter(int)),
+    "title": FilterField(Task.title, EQUALITY, _text),
+    "description": FilterField(
+        Task.description, EQUALITY | NULL_CHECK, _text, nullable=True
+    ),
+    "status": FilterField(Task.status, EQUALITY, _enum_value(TaskStatus)),
+    "priority": FilterField(Task.priority, EQUALITY, _enum_value(TaskPriority)),
+    "assigned_to": FilterField(
+        Task.assigned_to, EQUALITY | NULL_CHECK, _text, nullable=True
+    ),
+    "due_date": FilterField(
+        Task.due_date, RANGE | NULL_CHECK, _utc_naive, nullable=True
+    ),
+    "created_at": FilterField(Task.created_at, RANGE, _utc_naive),
+    "updated_at": FilterField(Task.updated_at, RANGE, _utc_naive),
+    "tags": FilterField(Task.tags, TAG_MATCH, _text),
+}
+
+# Nós da árvore normalizada (tuplas, para servir de chave de cache):
+#   ("and", filhos) | ("or", filhos) | ("not", filho)
+#   ("field", campo, operador, valor)
+Node = Tuple[Any, ...]
+
+
+def parse_filter(raw: Any) -> Optional[Node]:
+    """Validate a JSON filter expression into a normalized, hashable tree.
+
+    An object ANDs its keys. Keys are either ``and``/``or`` (a list of
+    objects), ``not`` (an object) or a field name mapped to operators, e.g.
+    ``{"priority": {"in": ["high", "medium"]}, "not": {"status": "completed"}}``.
+    A bare value is shorthand for ``eq`` (``null`` for ``is_null``).
+
+    An empty object (no filter) returns None. Raises ValueError describing
+    the first invalid part.
+    """
+    if raw == {}:
+        return None
+    return _parse_node(raw, 1, [0])
+
+
+def _parse_node(raw: Any, depth: int, counter: List[int]) -> Node:
+    if depth > MAX_FILTER_DEPTH:
+        raise ValueError(f"Filters can be nested at most {MAX_FILTER_DEPTH} levels")
+    if not isinstance(raw, dict):
+        raise ValueError("Each filter must be a JSON object")
+
+    children: List[Node] = []
+    for key, value in raw.items():
+        if key in ("and", "or"):
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"'{key}' expects a non-empty list of filters")
+            group = tuple(_parse_node(item, depth + 1, counter) for item in value)
+            children.append((key, group) if len(group) > 1 else group[0])
+        elif key == "not":
+            children.append(("not", _parse_node(value, depth + 1, counter)))
+        elif key in FILTER_FIELDS:
+            children.extend(_parse_field(key, value, counter))
+        else:
+            raise ValueError(
+                f"Unknown filter field: {key}. "
+                f"Available: and, or, not, {', '.join(FILTER_FIELDS)}"
+            )
+
+    if not children:
+        raise ValueError("Filters cannot be empty objects")
+    return children[0] if len(children) == 1 else ("and", tuple(children))
+
+
+def _parse_field(name: str, raw: Any, counter: List[int]) -> List[Node]:
+    spec = FILTER_FIELDS[name]
+    if not isinstance(raw, dict):
+        # Atalho: {"status": "pending"} ou {"assigned_to": null}
+        raw = {"is_null": True} if raw is None else {"eq": raw}
+    if not raw:
+        raise ValueError(f"No operator given for '{name}'")
+
+    conditions = []
+    for operator, value in raw.items():
+        if operator not in spec.operators:
+            raise ValueError(
+                f"Operator '{operator}' is not supported for '{name}'. "
+                f"Available: {', '.join(sorted(spec.operators))}"
+            )
+        counter[0] += 1
+        if counter[0] > MAX_FILTER_CONDITIONS:
+            raise ValueError(
+                f"A filter can have at most {MAX_FILTER_CONDITIONS} conditions"
+            )
+        conditions.append(
+            ("field", name, operator, _parse_value(spec, name, operator, value))
+        )
+    return conditions
+
+
+def _parse_value(spec: FilterField, name: str, operator: str, value: Any) -> Any:
+    if operator == "is_null":
+        if not isinstance(value, bool):
+            raise ValueError(f"'{name}.is_null' expects true or false")
+        return value
+    if operator in LIST_OPERATORS:
+        if not isinstance(value, list) or not value:
+            raise ValueError(f"'{name}.{operator}' expects a non-empty list")
+        if len(value) > MAX_IN_VALUES:
+            raise ValueError(
+                f"'{name}.{operator}' accepts at most {MAX_IN_VALUES} values"
+            )
+        values = [_coerce(spec, name, item) for item in value]
+        if operator in TAG_MATCH:
+            return tuple(normalize_tags(values))
+        return tuple(dict.fromkeys(values))
+    return _coerce(spec, name, value)
+
+
+def _coerce(spec: FilterField, name: str, value: Any) -> Any:
+    if value is None:
+        raise ValueError(f"Use is_null to compare '{name}' with null")
+    try:
+        return spec.parse(value)
+    except (ValidationError, ValueError):
+        raise ValueError(f"Invalid value for '{name}': {value!r}") from None
+
+
+def compile_filter(tree: Node, dialect_name: str) -> Tuple[ColumnElement, Dict]:
+    """WHERE clause for a parsed filter, plus the values of its parameters.
+
+    Values are moved out of the tree into named bind parameters (IN lists
+    are expanding parameters), so every filter with the same shape shares
+    one clause object and one entry in SQLAlchemy's compiled SQL cache.
+    """
+    values: List[Any] = []
+    shape = _shape(tree, values)
+    params = {_param_name(index): value for index, value in enumerate(values)}
+    return _compile_shape(shape, dialect_name), params
+
+
+def _shape(node: Node, values: List[Any]) -> Node:
+    kind = node[0]
+    if kind in ("and", "or"):
+        return (kind, tuple(_shape(child, values) for child in node[1]))
+    if kind == "not":
+        return (kind, _shape(node[1], values))
+    _, name, operator, value = node
+    if operator not in BOUND_OPERATORS:
+        # is_null e tags: os backends de tags expandem os valores no SQL
+        return node
+    values.append(list(value) if operator in LIST_OPERATORS else value)
+    return ("field", name, operator, len(values) - 1)
+
+
+def _param_name(index: int) -> str:
+    return f"where_{index}"
+
+
+@lru_cache(maxsize=256)
+def _compile_shape(shape: Node, dialect_name: str) -> ColumnElement:
+    kind = shape[0]
+    if kind == "and":
+        return and_(*(_compile_shape(child, dialect_name) for child in shape[1]))
+    if kind == "or":
+        return or_(*(_compile_shape(child, dialect_name) for child in shape[1]))
+    if kind == "not":
+        # NOT de uma comparação com NULL seria NULL: "não casa" inclui a linha
+        return not_(func.coalesce(_compile_shape(shape[1], dialect_name), false()))
+    _, name, operator, value = shape
+    return _condition(FILTER_FIELDS[name], operator, value, dialect_name)
+
+
+def _condition(
+    spec: FilterField, operator: str, value: Any, dialect_name: str
+) -> ColumnElement:
+    column = spec.column
+    if operator == "is_null":
+        return column.is_(None) if value else column.is_not(None)
+    if operator == "any":
+        return get_tag_backend(dialect_name).any(value)
+    if operator == "all":
+        return get_tag_backend(dialect_name).all(value)
+
+    param = bindparam(_param_name(value), expanding=operator in LIST_OPERATORS)
+    if operator == "eq":
+        return column == param
+    if operator == "in":
+        return column.in_(param)
+    if operator in ("ne", "not_in"):
+        condition = column != param if operator == "ne" else column.not_in(param)
+        # Diferente de um valor inclui as linhas sem valor
+        return or_(condition, column.is_(None)) if spec.nullable else condition
+    return COMPARISONS[operator](column, param)
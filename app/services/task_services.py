@@ -1,117 +1,525 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Sequence)
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import (Integer, Select, and_, any_, bindparam, case, delete,
+                        func, insert, literal_column, or_, select, type_coerce,
+                        update)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core import settings
+from app.models.base import utc_now
 from app.models.enums import TaskPriority, TaskStatus
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.models.task import PRIORITY_RANK_SQL, Task
+from app.schemas.task import AssigneeWorkload, BulkItemResult, BulkResult
+from app.schemas.task import Task as TaskSchema
+from app.schemas.task import TaskBulkUpdate, TaskCreate, TaskStats, TaskUpdate
+from app.services.conditional import (PreconditionFailedError,
+                                      VersionConflictError, etag_matches,
+                                      if_match_versions, task_etag)
+from app.services.pagination import DEFAULT_PAGE_SIZE, Page, Sort, paginate
+from app.services.search import get_search_backend
+from app.services.tags import get_tag_backend
+from app.services.task_query import Node, compile_filter
+
+# Chaves de ordenação usadas na paginação por cursor (keyset)
+ID_KEYS = (Task.id,)
+DUE_DATE_KEYS = (Task.due_date, Task.id)
+
+# Campos aceitos em sort=; cada um tem um índice (campo, id) correspondente
+PRIORITY_RANK = type_coerce(literal_column(PRIORITY_RANK_SQL), Integer).label(
+    "priority_rank"
+)
+SORT_KEYS = {
+    "id": Task.id,
+    "title": Task.title,
+    "priority": PRIORITY_RANK,
+    "due_date": Task.due_date,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+}
+NULLABLE_SORT_KEYS = {"due_date"}
+
+# Colunas exportadas (mesmos campos do schema Task)
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.assigned_to,
+    Task.tags,
+    Task.created_at,
+    Task.updated_at,
+    Task.version,
+)
+EXPORT_BATCH_SIZE = 1000
+
+# Limite de itens por requisição nas operações em lote
+MAX_BULK_ITEMS = 1000
+TASK_COLUMNS = tuple(Task.__table__.c)
 
 
 class TaskServices:
     def __init__(self, db: Session):
         self.db = db
 
-    def list_tasks(self) -> List[Task]:
-        """List all tasks from database."""
-        return self.db.query(Task).all()
+    def list_tasks(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """List one page of tasks from database."""
+        return paginate(
+            self.tasks_query(), _sort_keys(sort), cursor, limit, _columns(fields)
+        )
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID."""
         return self.db.query(Task).filter(Task.id == task_id).first()
 
-    def create_task(self, task_data: TaskCreate) -> Task:
-        """Create a new task."""
+    def get_tasks(self, task_ids: Sequence[int]) -> Dict[int, Task]:
+        """Tasks by id in one query; ids that do not exist are left out."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Um único parâmetro (array) em vez de um por id
+            condition = Task.id == any_(
+                bindparam("task_ids", list(task_ids), type_=ARRAY(Integer))
+            )
+        else:
+            condition = Task.id.in_(task_ids)
+        return {
+            task.id: task for task in self.db.scalars(select(Task).where(condition))
+        }
+
+    def _supports_returning(self) -> bool:
+        dialect = self.db.get_bind().dialect
+        return (
+            dialect.insert_returning
+            and dialect.update_returning
+            and dialect.delete_returning
+        )
+
+    def _check_precondition(self, task: Task, if_match: Optional[str]) -> None:
+        if if_match is not None and not etag_matches(
+            if_match, task_etag(task.id, task.updated_at)
+        ):
+            raise PreconditionFailedError(f"Task with ID {task.id} has been modified")
+
+    def _check_version(self, task: Task, version: Optional[int]) -> None:
+        if version is not None and task.version != version:
+            raise VersionConflictError(_conflict(task.id, task.version, version))
+
+    def _current(
+        self, task_id: int, if_match: Optional[str], version: Optional[int] = None
+    ) -> List[Any]:
+        """WHERE conditions for a task, at a version If-Match accepts."""
+        conditions = [Task.id == task_id]
+        versions = if_match_versions(if_match, task_id) if if_match else None
+        if versions is not None:
+            conditions.append(Task.updated_at.in_(versions))
+        if version is not None:
+            conditions.append(Task.version == version)
+        return conditions
+
+    def _not_written(
+        self, task_id: int, if_match: Optional[str], version: Optional[int] = None
+    ) -> None:
+        """Tell a missing task from a failed precondition after a 0-row write."""
+        if if_match is None and version is None:
+            return
+        current = self.db.scalar(select(Task.version).where(Task.id == task_id))
+        if current is None:
+            return
+        if version is not None and current != version:
+            raise VersionConflictError(_conflict(task_id, current, version))
+        raise PreconditionFailedError(f"Task with ID {task_id} has been modified")
+
+    def create_task(self, task_data: TaskCreate) -> Any:
+        """Create a new task with a single INSERT ... RETURNING."""
+        if not self._supports_returning():
+            return self._create_task_orm(task_data)
+        task = self.db.execute(
+            insert(Task).values(**task_data.model_dump()).returning(*TASK_COLUMNS)
+        ).one()
+        self.db.commit()
+        return task
+
+    def update_task(
+        self, task_id: int, task_data: TaskUpdate, if_match: Optional[str] = None
+    ) -> Optional[Any]:
+        """Update a task with a single UPDATE ... RETURNING.
+
+        The If-Match precondition and the expected ``version`` are part of
+        the WHERE clause, and the version is incremented by the same
+        statement. Only when no row matches does a second query tell a
+        missing task (None) from a stale ETag (PreconditionFailedError) or a
+        stale version (VersionConflictError).
+        """
+        if not self._supports_returning():
+            return self._update_task_orm(task_id, task_data, if_match)
+        values = task_data.model_dump(exclude_unset=True, exclude={"version"})
+        conditions = self._current(task_id, if_match, task_data.version)
+        if values:
+            stmt = (
+                update(Task)
+                .where(*conditions)
+                .values(**values, version=Task.version + 1)
+                .returning(*TASK_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            # Nada a alterar: updated_at, a versão e o ETag permanecem iguais
+            stmt = select(*TASK_COLUMNS).where(*conditions)
+        task = self.db.execute(stmt).one_or_none()
+        self.db.commit()
+        if task is None:
+            self._not_written(task_id, if_match, task_data.version)
+        return task
+
+    def delete_task(
+        self,
+        task_id: int,
+        if_match: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Delete a task with a single DELETE ... RETURNING."""
+        if not self._supports_returning():
+            return self._delete_task_orm(task_id, if_match, version)
+        deleted = self.db.scalar(
+            delete(Task)
+            .where(*self._current(task_id, if_match, version))
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        if deleted is None:
+            self._not_written(task_id, if_match, version)
+            return False
+        return True
+
+    # Sem RETURNING (ex.: SQLite < 3.35): lê, altera e recarrega pelo ORM. O
+    # version_id_col do modelo põe a versão lida no WHERE do UPDATE/DELETE;
+    # uma escrita concorrente entre a leitura e o commit vira StaleDataError
+
+    def _create_task_orm(self, task_data: TaskCreate) -> Task:
         task = Task(**task_data.model_dump())
         self.db.add(task)
         self.db.commit()
         self.db.refresh(task)
         return task
 
-    def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
-        """Update an existing task."""
+    def _update_task_orm(
+        self, task_id: int, task_data: TaskUpdate, if_match: Optional[str] = None
+    ) -> Optional[Task]:
         task = self.get_task(task_id)
         if task:
-            update_data = task_data.model_dump(exclude_unset=True)
+            self._check_precondition(task, if_match)
+            self._check_version(task, task_data.version)
+            update_data = task_data.model_dump(exclude_unset=True, exclude={"version"})
             for key, value in update_data.items():
                 setattr(task, key, value)
-            self.db.commit()
+            self._commit_versioned(task_id)
             self.db.refresh(task)
         return task
 
-    def delete_task(self, task_id: int) -> bool:
-        """Delete a task."""
+    def _delete_task_orm(
+        self,
+        task_id: int,
+        if_match: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> bool:
         task = self.get_task(task_id)
         if task:
+            self._check_precondition(task, if_match)
+            self._check_version(task, version)
             self.db.delete(task)
-            self.db.commit()
+            self._commit_versioned(task_id)
             return True
         return False
 
-    def filter_tasks_by_status(self, status: TaskStatus) -> List[Task]:
-        """Filter tasks by status."""
-        return self.db.query(Task).filter(Task.status == status.value).all()
+    def _commit_versioned(self, task_id: int) -> None:
+        try:
+            self.db.commit()
+        except StaleDataError:
+            self.db.rollback()
+            raise VersionConflictError(
+                f"Task with ID {task_id} was modified concurrently"
+            ) from None
 
-    def filter_tasks_by_priority(self, priority: TaskPriority) -> List[Task]:
-        """Filter tasks by priority."""
-        return self.db.query(Task).filter(Task.priority == priority.value).all()
+    def bulk_create_tasks(self, items: List[TaskCreate]) -> BulkResult:
+        """Create many tasks with a single INSERT ... RETURNING and one commit."""
+        rows = dict(enumerate(item.model_dump() for item in items))
+        stmt = insert(Task).returning(*TASK_COLUMNS, sort_by_parameter_order=True)
 
-    def filter_tasks_by_assigned_to(self, assigned_to: str) -> List[Task]:
-        """Filter tasks by assigned person."""
-        return self.db.query(Task).filter(Task.assigned_to == assigned_to).all()
+        try:
+            created = self.db.execute(stmt, list(rows.values())).all()
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            results = self._write_per_item(
+                rows, lambda row: self.db.execute(stmt, row).one()
+            )
+        else:
+            results = {index: _success(index, row) for index, row in enumerate(created)}
 
-    def get_overdue_tasks(self) -> List[Task]:
-        """Get all overdue tasks (due_date < today and status != completed)."""
-        # Usar apenas a data (sem horário) para comparação
-        today = datetime.now().date()
-        today_start = datetime.combine(today, datetime.min.time())  # 00:00:00 de hoje
+        return _bulk_result([results[index] for index in rows])
 
-        return (
-            self.db.query(Task)
-            .filter(
-                and_(
-                    Task.due_date < today_start,  # Antes de hoje (00:00:00)
-                    Task.status != TaskStatus.COMPLETED.value,
+    def bulk_update_tasks(self, items: List[TaskBulkUpdate]) -> BulkResult:
+        """Update many tasks with batched UPDATEs and one commit.
+
+        Current versions are read in one query; items whose ``version`` is
+        stale fail without being written. The others are written with one
+        executemany UPDATE per set of columns sent, each row guarded by its
+        expected version and incrementing it. If any row of a batch is not
+        matched (a concurrent write), the batch is rolled back and every row
+        is written on its own, so each item reports its own result.
+        """
+        ids = [item.id for item in items]
+        versions = dict(
+            self.db.execute(select(Task.id, Task.version).where(Task.id.in_(ids))).all()
+        )
+        existing = set(versions)
+
+        now = utc_now()
+        rows = {}
+        conflicts = {}
+        for index, item in enumerate(items):
+            if item.id not in versions:
+                continue
+            if item.version is not None and item.version != versions[item.id]:
+                conflicts[index] = BulkItemResult(
+                    index=index,
+                    id=item.id,
+                    success=False,
+                    error=_conflict(item.id, versions[item.id], item.version),
+                )
+                continue
+            values = item.model_dump(exclude_unset=True, exclude={"version"})
+            rows[index] = {**values, "version": versions[item.id], "updated_at": now}
+            # Ids repetidos: o item seguinte parte da versão já incrementada
+            versions[item.id] += 1
+
+        try:
+            if not self._update_batches(rows.values()):
+                raise StaleDataError("Batch matched fewer rows than it updates")
+            updated = {
+                row.id: row
+                for row in self.db.execute(
+                    select(*TASK_COLUMNS).where(Task.id.in_(existing))
                 )
+            }
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            results = self._write_per_item(rows, self._update_row)
+        else:
+            results = {
+                index: _success(index, updated[row["id"]])
+                for index, row in rows.items()
+            }
+        results.update(conflicts)
+
+        return _bulk_result(
+            [
+                results.get(index) or _not_found(index, item.id)
+                for index, item in enumerate(items)
+            ]
+        )
+
+    def _update_batches(self, rows: Iterable[Dict[str, Any]]) -> bool:
+        """One executemany UPDATE per set of columns, guarded by the version.
+
+        The n-th occurrence of an id goes in the n-th round of batches, so
+        writes to the same task run in request order. Returns False when a
+        batch matched fewer rows than it has (or the driver cannot tell).
+
+        Core statements on the table: the ORM's bulk UPDATE would check
+        ``version_id_col`` with one statement per row.
+        """
+        table = Task.__table__
+        rounds: List[Dict[frozenset, List[Dict[str, Any]]]] = []
+        occurrences: Dict[int, int] = {}
+        for row in rows:
+            params = {
+                key: value for key, value in row.items() if key not in ("id", "version")
+            }
+            params.update(task_id=row["id"], expected_version=row["version"])
+            number = occurrences.get(row["id"], 0)
+            occurrences[row["id"]] = number + 1
+            if number == len(rounds):
+                rounds.append({})
+            rounds[number].setdefault(frozenset(params), []).append(params)
+
+        stmt = (
+            update(table)
+            .where(
+                table.c.id == bindparam("task_id"),
+                table.c.version == bindparam("expected_version"),
             )
-            .all()
+            .values(version=table.c.version + 1)
         )
+        sane_rowcount = self.db.get_bind().dialect.supports_sane_multi_rowcount
+        for batches in rounds:
+            for batch in batches.values():
+                result = self.db.execute(stmt, batch)
+                # Cada linha do lote é um id distinto: rowcount menor = conflito
+                if not sane_rowcount or result.rowcount != len(batch):
+                    return False
+        return True
 
-    def get_tasks_due_soon(self, days: int = 7) -> List[Task]:
-        """Get tasks due within the next N days."""
-        now = datetime.now()
-        future_date = now + timedelta(days=days)
-        return (
-            self.db.query(Task)
-            .filter(
-                and_(
-                    Task.due_date.between(now, future_date),
-                    Task.status != TaskStatus.COMPLETED.value,
-                )
+    def bulk_delete_tasks(self, ids: List[int]) -> BulkResult:
+        """Delete many tasks with a single DELETE ... RETURNING and one commit."""
+        deleted = set(
+            self.db.scalars(
+                delete(Task)
+                .where(Task.id.in_(ids))
+                .returning(Task.id)
+                .execution_options(synchronize_session=False)
             )
-            .all()
         )
+        self.db.commit()
 
-    def get_tasks_due_today(self) -> List[Task]:
-        """Get tasks due today."""
-        today = datetime.now().date()
-        return (
-            self.db.query(Task)
-            .filter(
-                and_(
-                    Task.due_date >= datetime.combine(today, datetime.min.time()),
-                    Task.due_date
-                    < datetime.combine(today + timedelta(days=1), datetime.min.time()),
-                    Task.status != TaskStatus.COMPLETED.value,
+        return _bulk_result(
+            [
+                BulkItemResult(index=index, id=task_id, success=True)
+                if task_id in deleted
+                else _not_found(index, task_id)
+                for index, task_id in enumerate(ids)
+            ]
+        )
+
+    def _update_row(self, row: Dict[str, Any]):
+        values = {
+            key: value for key, value in row.items() if key not in ("id", "version")
+        }
+        stmt = (
+            update(Task)
+            .where(Task.id == row["id"], Task.version == row["version"])
+            .values(**values, version=Task.version + 1)
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        task = self.db.execute(stmt).one_or_none()
+        if task is None:
+            raise StaleDataError(f"Task with ID {row['id']} was modified concurrently")
+        return task
+
+    def _write_per_item(
+        self, rows: Dict[int, Dict[str, Any]], write: Callable[[Dict[str, Any]], Any]
+    ) -> Dict[int, BulkItemResult]:
+        """Fallback after a failed batch: write each row in its own savepoint.
+
+        Rows that succeed are still committed together; rows that fail are
+        reported individually instead of failing the whole batch.
+        """
+        results = {}
+        for index, row in rows.items():
+            try:
+                with self.db.begin_nested():
+                    results[index] = _success(index, write(row))
+            except SQLAlchemyError as exc:
+                error = str(getattr(exc, "orig", None) or exc).splitlines()[0]
+                results[index] = BulkItemResult(
+                    index=index, id=row.get("id"), success=False, error=error
                 )
-            )
-            .all()
+        self.db.commit()
+        return results
+
+    def filter_tasks_by_status(
+        self,
+        status: TaskStatus,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Filter tasks by status."""
+        return paginate(
+            self.status_query(status), _sort_keys(sort), cursor, limit, _columns(fields)
+        )
+
+    def filter_tasks_by_priority(
+        self,
+        priority: TaskPriority,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Filter tasks by priority."""
+        return paginate(
+            self.priority_query(priority),
+            _sort_keys(sort),
+            cursor,
+            limit,
+            _columns(fields),
+        )
+
+    def filter_tasks_by_assigned_to(
+        self,
+        assigned_to: str,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Filter tasks by assigned person."""
+        return paginate(
+            self.assigned_to_query(assigned_to),
+            _sort_keys(sort),
+            cursor,
+            limit,
+            _columns(fields),
+        )
+
+    def get_overdue_tasks(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Get overdue tasks (due_date < today and status != completed)."""
+        return paginate(
+            self.overdue_query(), DUE_DATE_KEYS, cursor, limit, _columns(fields)
+        )
+
+    def get_tasks_due_soon(
+        self,
+        days: int = 7,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Get tasks due within the next N days."""
+        return paginate(
+            self.due_soon_query(days), DUE_DATE_KEYS, cursor, limit, _columns(fields)
+        )
+
+    def get_tasks_due_today(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Get tasks due today."""
+        return paginate(
+            self.due_today_query(), DUE_DATE_KEYS, cursor, limit, _columns(fields)
         )
 
     def filter_tasks_by_date_range(
-        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
-    ) -> List[Task]:
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
         """Filter tasks by date range."""
         query = self.db.query(Task)
 
@@ -120,20 +528,20 @@ class TaskServices:
         if end_date:
             query = query.filter(Task.due_date <= end_date)
 
-        return query.all()
+        return paginate(query, ID_KEYS, cursor, limit, _columns(fields))
 
-    def search_tasks(self, search_term: str) -> List[Task]:
-        """Search tasks by title or description."""
-        search_pattern = f"%{search_term}%"
-        return (
-            self.db.query(Task)
-            .filter(
-                or_(
-                    Task.title.ilike(search_pattern),
-                    Task.description.ilike(search_pattern),
-                )
-            )
-            .all()
+    def search_tasks(
+        self,
+        search_term: str,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Search tasks by title or description, most relevant first."""
+        rank = self._search_backend().rank(search_term)
+        keys = (rank, Task.id) if rank is not None else ID_KEYS
+        return paginate(
+            self.search_query(search_term), keys, cursor, limit, _columns(fields)
         )
 
     def filter_tasks_advanced(
@@ -144,10 +552,288 @@ class TaskServices:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         search_term: Optional[str] = None,
-    ) -> List[Task]:
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+        tags_any: Optional[Sequence[str]] = None,
+        tags_all: Optional[Sequence[str]] = None,
+    ) -> Page:
         """Advanced filtering with multiple criteria."""
+        query = self.advanced_query(
+            status=status,
+            priority=priority,
+            assigned_to=assigned_to,
+            start_date=start_date,
+            end_date=end_date,
+            search_term=search_term,
+            tags_any=tags_any,
+            tags_all=tags_all,
+        )
+        return paginate(query, _sort_keys(sort), cursor, limit, _columns(fields))
+
+    def query_tasks(
+        self,
+        where: Optional[Node] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+        sort: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Filter with a compound expression parsed by ``parse_filter``."""
+        return paginate(
+            self.where_query(where), _sort_keys(sort), cursor, limit, _columns(fields)
+        )
+
+    def export_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        search_term: Optional[str] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        tags_any: Optional[Sequence[str]] = None,
+        tags_all: Optional[Sequence[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream every task matching the advanced filter criteria.
+
+        Selects plain columns instead of ORM entities and fetches them in
+        batches of ``batch_size`` from a server-side cursor, so memory use
+        stays flat regardless of how many rows match.
+        """
+        stmt = self.export_statement(
+            status=status,
+            priority=priority,
+            assigned_to=assigned_to,
+            start_date=start_date,
+            end_date=end_date,
+            search_term=search_term,
+            tags_any=tags_any,
+            tags_all=tags_all,
+        )
+        result = self.db.execute(stmt.execution_options(yield_per=batch_size))
+        for partition in result.partitions():
+            yield [row._asdict() for row in partition]
+
+    def export_statement(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        search_term: Optional[str] = None,
+        tags_any: Optional[Sequence[str]] = None,
+        tags_all: Optional[Sequence[str]] = None,
+    ) -> Select:
+        """Column-only SELECT used by the export, ordered by id."""
+        return self._apply_advanced_filters(
+            select(*EXPORT_COLUMNS),
+            status=status,
+            priority=priority,
+            assigned_to=assigned_to,
+            start_date=start_date,
+            end_date=end_date,
+            search_term=search_term,
+            tags_any=tags_any,
+            tags_all=tags_all,
+        ).order_by(Task.id)
+
+    def mark_overdue_tasks(self, batch_size: int) -> List[Any]:
+        """Move up to ``batch_size`` pending tasks past their due date to OVERDUE.
+
+        Only PENDING tasks are swept, so ``clear_overdue_tasks`` can restore
+        them exactly; IN_PROGRESS tasks are matched by ``overdue_query``
+        through their due date instead. One UPDATE ... RETURNING per call,
+        committed on its own; candidates come from ``ix_tasks_status_due_date``
+        with SKIP LOCKED on Postgres, so concurrent sweepers take disjoint
+        batches.
+        """
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+        candidates = (
+            select(Task.id)
+            .where(
+                Task.status == TaskStatus.PENDING.value,
+                Task.due_date < today_start,
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return self._set_status(candidates, TaskStatus.OVERDUE)
+
+    def clear_overdue_tasks(self, batch_size: int) -> List[Any]:
+        """Return OVERDUE tasks whose due date moved forward to PENDING."""
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+        candidates = (
+            select(Task.id)
+            .where(
+                Task.status == TaskStatus.OVERDUE.value,
+                or_(Task.due_date.is_(None), Task.due_date >= today_start),
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return self._set_status(candidates, TaskStatus.PENDING)
+
+    def _set_status(self, candidates: Select, status: TaskStatus) -> List[Any]:
+        stmt = (
+            update(Task)
+            .where(Task.id.in_(candidates.scalar_subquery()))
+            .values(status=status.value, updated_at=utc_now(), version=Task.version + 1)
+            .returning(*TASK_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        rows = self.db.execute(stmt).all()
+        self.db.commit()
+        return rows
+
+    def get_task_stats(self) -> TaskStats:
+        """Counts per status/priority/assignee and a due-date histogram.
+
+        Three aggregate queries, independent of how many rows match: one
+        GROUP BY status, priority; one GROUP BY assigned_to; and one pass of
+        conditional sums over open tasks for the due-date buckets.
+        """
+        today_start = datetime.combine(datetime.now().date(), datetime.min.time())
+        is_open = Task.status != TaskStatus.COMPLETED.value
+        is_overdue = and_(is_open, Task.due_date < today_start)
+
+        by_status = {status.value: 0 for status in TaskStatus}
+        by_priority = {priority.value: 0 for priority in TaskPriority}
+        for status, priority, count in self.db.execute(
+            select(Task.status, Task.priority, func.count()).group_by(
+                Task.status, Task.priority
+            )
+        ):
+            by_status[status] += count
+            by_priority[priority] += count
+
+        workload = [
+            AssigneeWorkload(
+                assigned_to=row.assigned_to,
+                total=row.total,
+                open=row.open or 0,
+                overdue=row.overdue or 0,
+            )
+            for row in self.db.execute(
+                select(
+                    Task.assigned_to,
+                    func.count().label("total"),
+                    func.sum(case((is_open, 1), else_=0)).label("open"),
+                    func.sum(case((is_overdue, 1), else_=0)).label("overdue"),
+                )
+                .group_by(Task.assigned_to)
+                .order_by(Task.assigned_to)
+            )
+        ]
+
+        buckets = {
+            name: func.sum(case((condition, 1), else_=0)).label(name)
+            for name, condition in _due_date_buckets(today_start).items()
+        }
+        histogram = (
+            self.db.execute(select(*buckets.values()).where(is_open)).one()._asdict()
+        )
+        histogram = {name: count or 0 for name, count in histogram.items()}
+
+        return TaskStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_priority=by_priority,
+            overdue=histogram["overdue"],
+            due_today=histogram["today"],
+            due_date_histogram=histogram,
+            workload=workload,
+        )
+
+    # === CONSULTAS (sem ordenação/paginação) ===
+
+    def tasks_query(self) -> Query:
+        return self.db.query(Task)
+
+    def status_query(self, status: TaskStatus) -> Query:
+        return self.db.query(Task).filter(Task.status == status.value)
+
+    def priority_query(self, priority: TaskPriority) -> Query:
+        return self.db.query(Task).filter(Task.priority == priority.value)
+
+    def assigned_to_query(self, assigned_to: str) -> Query:
+        return self.db.query(Task).filter(Task.assigned_to == assigned_to)
+
+    def overdue_query(self) -> Query:
+        # Usar apenas a data (sem horário) para comparação
+        today = datetime.now().date()
+        today_start = datetime.combine(today, datetime.min.time())  # 00:00:00 de hoje
+
+        if settings.overdue_sweeper:
+            # Pendentes marcadas pelo sweeper, mais as em andamento (que ele
+            # não altera); os dois ramos usam ix_tasks_status_due_date
+            return self.db.query(Task).filter(
+                or_(
+                    Task.status == TaskStatus.OVERDUE.value,
+                    and_(
+                        Task.status == TaskStatus.IN_PROGRESS.value,
+                        Task.due_date < today_start,
+                    ),
+                )
+            )
+
+        return self.db.query(Task).filter(
+            and_(
+                Task.due_date < today_start,  # Antes de hoje (00:00:00)
+                Task.status != TaskStatus.COMPLETED.value,
+            )
+        )
+
+    def due_soon_query(self, days: int = 7) -> Query:
+        now = datetime.now()
+        future_date = now + timedelta(days=days)
+        return self.db.query(Task).filter(
+            and_(
+                Task.due_date.between(now, future_date),
+                Task.status != TaskStatus.COMPLETED.value,
+            )
+        )
+
+    def due_today_query(self) -> Query:
+        today = datetime.now().date()
+        return self.db.query(Task).filter(
+            and_(
+                Task.due_date >= datetime.combine(today, datetime.min.time()),
+                Task.due_date
+                < datetime.combine(today + timedelta(days=1), datetime.min.time()),
+                Task.status != TaskStatus.COMPLETED.value,
+            )
+        )
+
+    def search_query(self, search_term: str) -> Query:
+        return self._search_backend().match(self.db.query(Task), search_term)
+
+    def advanced_query(self, **criteria) -> Query:
+        return self._apply_advanced_filters(self.db.query(Task), **criteria)
+
+    def where_query(self, where: Optional[Node]) -> Query:
         query = self.db.query(Task)
+        if where is None:
+            return query
+        criterion, params = compile_filter(where, self.db.get_bind().dialect.name)
+        return query.filter(criterion).params(params)
 
+    def _apply_advanced_filters(
+        self,
+        query,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        assigned_to: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        search_term: Optional[str] = None,
+        tags_any: Optional[Sequence[str]] = None,
+        tags_all: Optional[Sequence[str]] = None,
+    ):
+        """Apply the advanced filter criteria to a Query or Select."""
         if status:
             query = query.filter(Task.status == status.value)
         if priority:
@@ -159,12 +845,111 @@ class TaskServices:
         if end_date:
             query = query.filter(Task.due_date <= end_date)
         if search_term:
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Task.title.ilike(search_pattern),
-                    Task.description.ilike(search_pattern),
-                )
+            query = self._search_backend().match(query, search_term)
+        if tags_any:
+            query = query.filter(self._tag_backend().any(tags_any))
+        if tags_all:
+            query = query.filter(self._tag_backend().all(tags_all))
+
+        return query
+
+    def _search_backend(self):
+        return get_search_backend(self.db.get_bind().dialect.name)
+
+    def _tag_backend(self):
+        return get_tag_backend(self.db.get_bind().dialect.name)
+
+
+def parse_sort(raw: Optional[str]) -> Optional[tuple]:
+    """Validate a ``sort=`` value such as ``due_date,-priority``.
+
+    Raises ValueError for unknown or repeated fields; None keeps id order.
+    """
+    if not raw:
+        return None
+    sort = tuple(field.strip() for field in raw.split(",") if field.strip())
+    names = [field.lstrip("-") for field in sort]
+    unknown = [name for name in names if name not in SORT_KEYS]
+    if unknown:
+        raise ValueError(
+            f"Cannot sort by: {', '.join(unknown)}. "
+            f"Available: {', '.join(SORT_KEYS)}"
+        )
+    if len(set(names)) != len(names):
+        raise ValueError("Each sort field can only appear once")
+    return sort or None
+
+
+def _sort_keys(sort: Optional[Sequence[str]]) -> Sequence[Any]:
+    """Keyset sort keys for a parsed ``sort=``, ending with the id.
+
+    The id tiebreaker follows the direction of the last field, so a
+    descending sort is a backward scan of the same (field, id) index.
+    """
+    if not sort:
+        return ID_KEYS
+    keys = []
+    for field in sort:
+        name = field.lstrip("-")
+        keys.append(
+            Sort(
+                SORT_KEYS[name],
+                descending=field.startswith("-"),
+                nullable=name in NULLABLE_SORT_KEYS,
             )
+        )
+        if name == "id":
+            return keys
+    keys.append(Sort(Task.id, descending=keys[-1].descending))
+    return keys
+
+
+def _columns(fields: Optional[Sequence[str]]) -> Optional[List[Any]]:
+    """Task columns for a sparse fieldset (None loads every column)."""
+    if not fields:
+        return None
+    return [getattr(Task, field) for field in fields]
+
+
+def _due_date_buckets(today_start: datetime) -> Dict[str, Any]:
+    """Due-date histogram buckets, relative to the start of today."""
+    tomorrow = today_start + timedelta(days=1)
+    return {
+        "overdue": Task.due_date < today_start,
+        "today": and_(Task.due_date >= today_start, Task.due_date < tomorrow),
+        "next_7_days": and_(
+            Task.due_date >= tomorrow, Task.due_date < tomorrow + timedelta(days=7)
+        ),
+        "next_30_days": and_(
+            Task.due_date >= tomorrow + timedelta(days=7),
+            Task.due_date < tomorrow + timedelta(days=30),
+        ),
+        "later": Task.due_date >= tomorrow + timedelta(days=30),
+        "no_due_date": Task.due_date.is_(None),
+    }
+
+
+def _success(index: int, row) -> BulkItemResult:
+    return BulkItemResult(
+        index=index, id=row.id, success=True, task=TaskSchema.model_validate(row)
+    )
+
+
+def _conflict(task_id: int, current: int, expected: int) -> str:
+    return f"Task with ID {task_id} is at version {current}, not {expected}"
+
+
+def _not_found(index: int, task_id: int) -> BulkItemResult:
+    return BulkItemResult(
+        index=index,
+        id=task_id,
+        success=False,
+        error=f"Task with ID {task_id} not found",
+    )
+
 
-        return query.all()
+def _bulk_result(results: List[BulkItemResult]) -> BulkResult:
+    succeeded = sum(1 for result in results if result.success)
+    return BulkResult(
+        succeeded=succeeded, failed=len(results) - succeeded, results=results
+    )
@@ -1,17 +1,25 @@
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Definir ambiente de teste é a primeira coisa a se fazer
 os.environ["TESTING"] = "True"
+# Cache em memória: um novo a cada TestClient, sem depender de Redis
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["EVENT_BROKER"] = "memory"
+# Sem sweeper em segundo plano: os testes o executam explicitamente
+os.environ["OVERDUE_SWEEPER"] = "False"
 
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
-from app.database import engine
+from app.core.metrics import count_queries
+from app.database import async_engine, engine
 from app.main import app
 # Agora importamos o engine e a Base do módulo que já sabe sobre o ambiente de teste
 from app.models.base import Base
@@ -27,3 +35,49 @@ def client():
 
     # Limpa o banco de dados depois que o teste termina
     Base.metadata.drop_all(bind=engine)
+
+
+# Com ASYNC_DATABASE=True as rotas usam o engine assíncrono
+QUERY_ENGINES = [engine] + ([async_engine.sync_engine] if async_engine else [])
+
+
+@pytest.fixture
+def listen_app_engines():
+    """Registra ``fn`` para o evento em todos os engines durante o bloco."""
+
+    @contextmanager
+    def listen(identifier, fn):
+        for target in QUERY_ENGINES:
+            event.listen(target, identifier, fn)
+        try:
+            yield
+        finally:
+            for target in QUERY_ENGINES:
+                event.remove(target, identifier, fn)
+
+    return listen
+
+
+@pytest.fixture
+def count_app_queries():
+    """Conta os statements SQL do bloco em todos os engines da aplicação."""
+    return lambda: count_queries(*QUERY_ENGINES)
+
+
+@pytest.fixture
+def assert_max_queries(count_app_queries):
+    """Falha quando o bloco executa mais de ``limit`` statements SQL.
+
+    Uso: ``with assert_max_queries(2): client.get("/tasks/1")``
+    """
+
+    @contextmanager
+    def check(limit):
+        with count_app_queries() as counter:
+            yield counter
+        assert counter.count <= limit, (
+            f"{counter.count} SQL statements, expected at most {limit}:\n"
+            + counter.report()
+        )
+
+    return check
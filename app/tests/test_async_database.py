@@ -0,0 +1,81 @@
+import pytest
+from fastapi import status
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.database import (SQLALCHEMY_DATABASE_URL, async_database_url,
+                          get_session)
+from app.main import app
+
+
+class TestAsyncDatabase:
+    """Testes para o modo assíncrono (AsyncSession + aiosqlite)."""
+
+    @pytest.fixture
+    def async_client(self, client):
+        """Cliente cujas rotas usam AsyncSession em vez de Session."""
+        engine = create_async_engine(
+            async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+        )
+        session_factory = async_sessionmaker(
+            engine, autoflush=False, expire_on_commit=False
+        )
+
+        async def get_async_session():
+            async with session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_session] = get_async_session
+        yield client
+        app.dependency_overrides.pop(get_session)
+
+    def test_async_database_url(self):
+        """Testa a conversão da URL para o driver assíncrono."""
+        assert (
+            async_database_url("sqlite:///./tasks.db")
+            == "sqlite+aiosqlite:///./tasks.db"
+        )
+        assert (
+            async_database_url("postgresql://user:pass@db:5432/tasks")
+            == "postgresql+asyncpg://user:pass@db:5432/tasks"
+        )
+
+    def test_async_database_url_unsupported(self):
+        """Testa backend sem driver assíncrono configurado."""
+        with pytest.raises(ValueError):
+            async_database_url("mysql://user:pass@db/tasks")
+
+    def test_crud_with_async_session(self, async_client):
+        """Testa o ciclo CRUD completo com AsyncSession."""
+        response = async_client.post("/tasks/", json={"title": "Assíncrona"})
+        assert response.status_code == status.HTTP_201_CREATED
+        task_id = response.json()["id"]
+
+        response = async_client.put(f"/tasks/{task_id}", json={"status": "completed"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "completed"
+
+        response = async_client.get(f"/tasks/{task_id}")
+        assert response.json()["title"] == "Assíncrona"
+
+        response = async_client.delete(f"/tasks/{task_id}")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert async_client.get(f"/tasks/{task_id}").status_code == 404
+
+    def test_list_search_and_export_with_async_session(self, async_client):
+        """Testa paginação, busca e exportação com AsyncSession."""
+        async_client.post(
+            "/tasks/bulk",
+            json=[{"title": f"Relatório {i}"} for i in range(3)],
+        )
+
+        response = async_client.get("/tasks/?limit=2")
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" in response.headers
+
+        response = async_client.get("/tasks/search?q=relat")
+        assert len(response.json()) == 3
+
+        response = async_client.get("/tasks/export?format=csv")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.text.splitlines()) == 4  # cabeçalho + 3 linhas
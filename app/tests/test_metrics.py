@@ -0,0 +1,74 @@
+import logging
+
+from fastapi import status
+
+from app.core import settings
+from app.core.metrics import REGISTRY
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetrics:
+    """Testes para a instrumentação de requisições e queries SQL."""
+
+    def test_metrics_endpoint(self, client):
+        """Testa a exposição no formato texto do Prometheus."""
+        client.get("/tasks/")
+        response = client.get("/metrics")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+
+        body = response.text
+        assert "http_request_duration_seconds_bucket" in body
+        assert "http_requests_in_flight" in body
+        assert "db_queries_per_request_bucket" in body
+        assert 'db_pool_checked_out{engine="sync"}' in body
+        assert 'cache_hit_ratio{cache="memory"}' in body
+        assert 'cache_hit_ratio{cache="tasks"}' in body
+        assert 'cache_misses{cache="pages"}' in body
+
+    def test_request_latency_by_route_template(self, client):
+        """Testa que a rota é rotulada pelo template, não pelo caminho."""
+        task_id = client.post("/tasks/", json={"title": "Métrica"}).json()["id"]
+        labels = {"method": "GET", "route": "/tasks/{task_id}", "status": "200"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+
+        client.get(f"/tasks/{task_id}")
+        client.get(f"/tasks/{task_id}")
+
+        after = _sample("http_request_duration_seconds_count", **labels)
+        assert after - before == 2
+
+    def test_queries_counted_per_request(self, client):
+        """Testa a contagem de queries SQL por requisição."""
+        labels = {"route": "/tasks/"}
+        count_before = _sample("db_queries_per_request_count", **labels)
+        sum_before = _sample("db_queries_per_request_sum", **labels)
+
+        client.get("/tasks/")
+
+        assert _sample("db_queries_per_request_count", **labels) - count_before == 1
+        assert _sample("db_queries_per_request_sum", **labels) - sum_before >= 1
+
+    def test_slow_query_log(self, client, caplog, monkeypatch):
+        """Testa o log de queries lentas com a rota e o statement."""
+        monkeypatch.setattr(settings, "slow_query_ms", 1e-9)
+        before = _sample("db_slow_queries_total", route="/tasks/")
+
+        with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+            client.get("/tasks/")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("/tasks/" in m and "SELECT" in m for m in messages)
+        assert _sample("db_slow_queries_total", route="/tasks/") > before
+
+    def test_slow_query_log_disabled(self, client, caplog, monkeypatch):
+        """Testa que SLOW_QUERY_MS=0 desativa o log."""
+        monkeypatch.setattr(settings, "slow_query_ms", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+            client.get("/tasks/")
+
+        assert not [r for r in caplog.records if r.name == "app.core.metrics"]
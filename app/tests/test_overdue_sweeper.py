@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.core import settings
+from app.database import SessionLocal
+from app.main import app
+from app.services.overdue_sweeper import OverdueSweeper, change_notifier
+
+
+def _days(days):
+    return (datetime.now() + timedelta(days=days)).isoformat()
+
+
+class TestOverdueSweeper:
+    """Testes para o sweeper que mantém o status OVERDUE."""
+
+    def _sweeper(self, batch_size=1000):
+        return OverdueSweeper(
+            SessionLocal,
+            interval=60,
+            batch_size=batch_size,
+            on_change=change_notifier(app.state.task_cache, app.state.event_broker),
+        )
+
+    def _create(self, client, **data):
+        return client.post("/tasks/", json={"title": "Sweep", **data}).json()["id"]
+
+    def test_marks_overdue_in_batches(self, client):
+        """Testa a transição para OVERDUE em lotes."""
+        late = [self._create(client, due_date=_days(-3)) for _ in range(3)]
+        done = self._create(client, due_date=_days(-3), status="completed")
+        future = self._create(client, due_date=_days(3))
+        for task_id in late:
+            client.get(f"/tasks/{task_id}")  # popula o cache
+
+        sweeper = self._sweeper(batch_size=2)
+        assert asyncio.run(sweeper.sweep()) == 3
+
+        for task_id in late:
+            assert client.get(f"/tasks/{task_id}").json()["status"] == "overdue"
+        assert client.get(f"/tasks/{done}").json()["status"] == "completed"
+        assert client.get(f"/tasks/{future}").json()["status"] == "pending"
+
+        metrics = sweeper.metrics.snapshot()
+        assert metrics["runs"] == 1
+        assert metrics["tasks_marked_overdue"] == 3
+        assert metrics["batches"] == 2
+
+        assert asyncio.run(sweeper.sweep()) == 0
+
+    def test_clears_rescheduled_tasks(self, client):
+        """Testa que tarefa reagendada volta para PENDING."""
+        task_id = self._create(client, due_date=_days(-1))
+        sweeper = self._sweeper()
+        asyncio.run(sweeper.sweep())
+
+        client.put(f"/tasks/{task_id}", json={"due_date": _days(2)})
+        asyncio.run(sweeper.sweep())
+
+        assert client.get(f"/tasks/{task_id}").json()["status"] == "pending"
+        assert sweeper.metrics.snapshot()["tasks_cleared"] == 1
+
+    def test_keeps_in_progress_status(self, client, monkeypatch):
+        """Testa que tarefas em andamento não viram OVERDUE, mas aparecem em /overdue."""
+        monkeypatch.setattr(settings, "overdue_sweeper", True)
+        task_id = self._create(client, due_date=_days(-2), status="in_progress")
+
+        assert asyncio.run(self._sweeper().sweep()) == 0
+        assert client.get(f"/tasks/{task_id}").json()["status"] == "in_progress"
+        assert [task["id"] for task in client.get("/tasks/overdue").json()] == [task_id]
+
+        client.put(f"/tasks/{task_id}", json={"due_date": _days(2)})
+        asyncio.run(self._sweeper().sweep())
+        assert client.get(f"/tasks/{task_id}").json()["status"] == "in_progress"
+        assert client.get("/tasks/overdue").json() == []
+
+    def test_overdue_endpoint_uses_status(self, client, monkeypatch):
+        """Testa /tasks/overdue por igualdade de status com o sweeper ativo."""
+        monkeypatch.setattr(settings, "overdue_sweeper", True)
+        self._create(client, due_date=_days(-2))
+
+        assert client.get("/tasks/overdue").json() == []
+
+        asyncio.run(self._sweeper().sweep())
+
+        tasks = client.get("/tasks/overdue").json()
+        assert len(tasks) == 1
+        assert tasks[0]["status"] == "overdue"
+
+    def test_sweeper_health(self, client):
+        """Testa o endpoint de métricas com o sweeper desativado nos testes."""
+        assert client.get("/health/sweeper").json() == {"enabled": False}
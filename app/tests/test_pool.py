@@ -0,0 +1,95 @@
+import logging
+
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import Settings
+from app.core.pool import (InstrumentedAsyncQueuePool, InstrumentedNullPool,
+                           InstrumentedQueuePool, engine_options, pool_status)
+
+
+class TestConnectionPool:
+    """Testes para a configuração e as métricas do pool de conexões."""
+
+    def test_engine_options_postgres(self):
+        """Testa opções de pool e statement timeout no Postgres."""
+        settings = Settings(
+            db_pool_size=20, db_max_overflow=5, db_statement_timeout_ms=5000
+        )
+
+        options = engine_options("postgresql://u:p@db/tasks", settings)
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["connect_args"]["options"] == "-c statement_timeout=5000"
+
+        options = engine_options(
+            "postgresql+asyncpg://u:p@db/tasks", settings, is_async=True
+        )
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert options["connect_args"]["server_settings"] == {
+            "statement_timeout": "5000"
+        }
+
+    def test_engine_options_external_pooler(self):
+        """Testa o modo compatível com PgBouncer (transaction pooling)."""
+        settings = Settings(db_external_pooler=True, db_statement_timeout_ms=5000)
+
+        options = engine_options(
+            "postgresql+asyncpg://u:p@pgbouncer/tasks", settings, is_async=True
+        )
+        assert options["poolclass"] is InstrumentedNullPool
+        assert "pool_size" not in options
+        assert options["connect_args"]["statement_cache_size"] == 0
+        assert "server_settings" not in options["connect_args"]
+
+    def test_engine_options_sqlite_memory(self):
+        """Testa que SQLite em memória mantém o pool padrão."""
+        options = engine_options("sqlite://", Settings())
+        assert "poolclass" not in options
+        assert options["connect_args"] == {"check_same_thread": False}
+
+    def test_pool_timeout_is_recorded(self, tmp_path):
+        """Testa as métricas de espera e timeout do pool."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path}/pool.db",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+
+        with engine.connect():
+            assert pool_status(engine.pool)["checked_out"] == 1
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        metrics = pool_status(engine.pool)
+        assert metrics["checkouts"] == 1
+        assert metrics["timeouts"] == 1
+        assert metrics["wait_seconds_max"] >= 0.05
+        engine.dispose()
+
+    @pytest.mark.parametrize(
+        "pool_class",
+        [InstrumentedQueuePool, InstrumentedAsyncQueuePool, InstrumentedNullPool],
+    )
+    def test_pool_logger_stays_under_sqlalchemy(self, pool_class):
+        """Testa que o log do pool segue o nível de sqlalchemy.pool (não o root)."""
+        pool = pool_class(lambda: None)
+        assert pool.logger.name.startswith("sqlalchemy.pool.")
+        assert not pool.logger.isEnabledFor(logging.DEBUG)
+
+    def test_pool_health_endpoint(self, client):
+        """Testa o endpoint de métricas do pool."""
+        client.get("/tasks/")
+
+        response = client.get("/health/pool")
+        assert response.status_code == status.HTTP_200_OK
+
+        sync_pool = response.json()["sync"]
+        assert sync_pool["pool_class"] == "InstrumentedQueuePool"
+        assert sync_pool["checkouts"] >= 1
+        assert sync_pool["checked_out"] == 0
@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+
+from app.core import settings
+
+
+class TestQueryBudget:
+    """Testes do número máximo de queries SQL por endpoint."""
+
+    @pytest.fixture
+    def task_id(self, client):
+        return client.post("/tasks/", json={"title": "Orçamento"}).json()["id"]
+
+    def test_create_task(self, client, assert_max_queries):
+        """Testa POST /tasks/: um INSERT ... RETURNING."""
+        with assert_max_queries(1):
+            client.post("/tasks/", json={"title": "Nova"})
+
+    def test_get_task(self, client, assert_max_queries, task_id):
+        """Testa GET /tasks/{id}: um SELECT, nenhum quando em cache."""
+        with assert_max_queries(1):
+            client.get(f"/tasks/{task_id}")
+        with assert_max_queries(0):
+            client.get(f"/tasks/{task_id}")
+
+    def test_update_task(self, client, assert_max_queries, task_id):
+        """Testa PUT /tasks/{id}: um UPDATE ... RETURNING, com ou sem If-Match."""
+        with assert_max_queries(1):
+            response = client.put(f"/tasks/{task_id}", json={"title": "Alterada"})
+        with assert_max_queries(1):
+            client.put(
+                f"/tasks/{task_id}",
+                json={"title": "De novo"},
+                headers={"If-Match": response.headers["ETag"]},
+            )
+
+    def test_patch_task(self, client, assert_max_queries, task_id):
+        """Testa PATCH /tasks/{id}: um UPDATE só das colunas enviadas."""
+        with assert_max_queries(1):
+            client.patch(f"/tasks/{task_id}", json={"status": "completed"})
+
+    def test_delete_task(self, client, assert_max_queries, task_id):
+        """Testa DELETE /tasks/{id}: um DELETE ... RETURNING."""
+        with assert_max_queries(1):
+            client.delete(f"/tasks/{task_id}")
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/tasks/",
+            "/tasks/filter?status=pending",
+            "/tasks/filter/priority/high",
+            "/tasks/search?q=orçamento",
+            "/tasks/overdue",
+        ],
+    )
+    def test_list_routes(self, client, assert_max_queries, task_id, url):
+        """Testa listas: uma página, com o ETag calculado do próprio corpo."""
+        with assert_max_queries(1):
+            client.get(url)
+
+    def test_stats(self, client, assert_max_queries, task_id):
+        """Testa GET /tasks/stats: três agregações."""
+        with assert_max_queries(3):
+            client.get("/tasks/stats")
+
+    def test_fixture_reports_statements(self, client, assert_max_queries, task_id):
+        """Testa que o fixture falha e lista os statements executados."""
+        with pytest.raises(AssertionError, match="SELECT"):
+            with assert_max_queries(0):
+                client.get(f"/tasks/{task_id}")
+
+    def test_budget_warning(self, client, caplog, monkeypatch, task_id):
+        """Testa o aviso de desenvolvimento quando o orçamento é excedido."""
+        monkeypatch.setattr(settings, "query_budget", 1)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+            client.get("/tasks/stats")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(
+            "GET /tasks/stats ran 3 SQL statements (budget 1" in m for m in messages
+        )
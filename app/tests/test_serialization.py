@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+
+from fastapi import status
+
+from app.database import SessionLocal
+from app.models.task import Task
+from app.schemas.task import Task as TaskSchema
+from app.services.serialization import dump_tasks, serialize_task
+
+
+class TestSerialization:
+    """Testes para a serialização rápida das listagens."""
+
+    def _tasks(self, client):
+        client.post(
+            "/tasks/",
+            json={
+                "title": "Com data",
+                "due_date": "2030-01-02T03:04:05.678901",
+                "priority": "high",
+                "assigned_to": "ana",
+            },
+        )
+        client.post("/tasks/", json={"title": "Sem data", "status": "in_progress"})
+        with SessionLocal() as db:
+            return db.query(Task).order_by(Task.id).all()
+
+    def test_matches_schema_output(self, client):
+        """Testa que a saída é idêntica à validação pelo schema."""
+        tasks = self._tasks(client)
+        expected = [
+            TaskSchema.model_validate(task).model_dump(mode="json") for task in tasks
+        ]
+
+        assert [serialize_task(task) for task in tasks] == expected
+        assert json.loads(dump_tasks(tasks)) == expected
+        assert list(json.loads(dump_tasks(tasks))[0]) == list(expected[0])
+
+    def test_cached_dicts_pass_through(self, client):
+        """Testa que dicts já serializados (cache) são codificados sem mudança."""
+        tasks = [serialize_task(task) for task in self._tasks(client)]
+        assert json.loads(dump_tasks(tasks)) == tasks
+
+    def test_list_route_response(self, client):
+        """Testa a resposta da rota de listagem com o caminho rápido."""
+        tasks = self._tasks(client)
+
+        response = client.get("/tasks/?limit=1")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert "ETag" in response.headers
+        assert "X-Next-Cursor" in response.headers
+        assert response.json() == [serialize_task(tasks[0])]
+        assert datetime.fromisoformat(response.json()[0]["due_date"]) == datetime(
+            2030, 1, 2, 3, 4, 5, 678901
+        )
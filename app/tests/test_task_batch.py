@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from fastapi import status
+
+from app.core.cache import MemoryCache, RedisCache
+from app.services.task_cache import TaskCache
+
+
+class TestTaskBatch:
+    """Testes para GET /tasks/batch (busca de várias tarefas por id)."""
+
+    def _create(self, client, count):
+        response = client.post(
+            "/tasks/bulk", json=[{"title": f"Tarefa {i}"} for i in range(count)]
+        )
+        return [result["id"] for result in response.json()["results"]]
+
+    def test_preserves_order_and_reports_missing(self, client):
+        """Testa a ordem da requisição, ids ausentes e ids repetidos."""
+        self._create(client, 5)
+
+        response = client.get("/tasks/batch?ids=4,99,2,4&ids=5")
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [task["id"] for task in body["tasks"]] == [4, 2, 5]
+        assert body["tasks"][0]["title"] == "Tarefa 3"
+        assert body["missing"] == [99]
+
+    def test_fields(self, client):
+        """Testa fields= na busca em lote."""
+        self._create(client, 2)
+
+        response = client.get("/tasks/batch?ids=2,1&fields=title")
+        assert response.json() == {
+            "tasks": [{"id": 2, "title": "Tarefa 1"}, {"id": 1, "title": "Tarefa 0"}],
+            "missing": [],
+        }
+
+    def test_single_query_then_cached(self, client, assert_max_queries):
+        """Testa um único SELECT para 200 ids e nenhum na leitura seguinte."""
+        ids = ",".join(str(task_id) for task_id in self._create(client, 200))
+
+        with assert_max_queries(1):
+            assert len(client.get(f"/tasks/batch?ids={ids}").json()["tasks"]) == 200
+        with assert_max_queries(0):
+            assert len(client.get(f"/tasks/batch?ids={ids}").json()["tasks"]) == 200
+
+    def test_write_invalidates(self, client):
+        """Testa que a busca em lote vê as alterações feitas pela API."""
+        self._create(client, 2)
+        client.get("/tasks/batch?ids=1,2")
+
+        client.put("/tasks/1", json={"title": "Renomeada"})
+        client.delete("/tasks/2")
+
+        body = client.get("/tasks/batch?ids=1,2").json()
+        assert [task["title"] for task in body["tasks"]] == ["Renomeada"]
+        assert body["missing"] == [2]
+
+    @pytest.mark.parametrize(
+        "query",
+        ["ids=1,abc", "ids=", ",".join(["ids=1"] + [str(i) for i in range(2, 1002)])],
+    )
+    def test_invalid_ids(self, client, query):
+        """Testa erro 400 para ids inválidos, vazios ou em excesso."""
+        response = client.get(f"/tasks/batch?{query}")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestTaskCacheBatch:
+    """Testes para TaskCache.get_tasks."""
+
+    def _task(self, task_id):
+        return {"id": task_id, "title": f"Tarefa {task_id}"}
+
+    def _loader(self, loads):
+        async def loader(ids):
+            loads.append(list(ids))
+            return {task_id: self._task(task_id) for task_id in ids if task_id < 10}
+
+        return loader
+
+    def test_loads_only_misses(self):
+        """Testa que só os ids fora do cache vão ao banco, em uma chamada."""
+        cache = TaskCache(MemoryCache(), ttl=60, list_ttl=60)
+        loads = []
+
+        async def scenario():
+            first = await cache.get_tasks([1, 2], self._loader(loads))
+            second = await cache.get_tasks([2, 3, 42], self._loader(loads))
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert loads == [[1, 2], [3, 42]]
+        assert sorted(first) == [1, 2]
+        assert sorted(second) == [2, 3]
+
+    def test_local_and_redis(self):
+        """Testa o cache local na frente do Redis (MGET/pipeline)."""
+        fakeredis = pytest.importorskip("fakeredis.aioredis")
+        shared = RedisCache(fakeredis.FakeRedis())
+        cache = TaskCache(shared, ttl=60, list_ttl=60, local=MemoryCache())
+        loads = []
+
+        async def scenario():
+            await cache.get_tasks([1, 2], self._loader(loads))
+            # Outro processo: cache local vazio, Redis preenchido
+            other = TaskCache(shared, ttl=60, list_ttl=60, local=MemoryCache())
+            from_redis = await other.get_tasks([1, 2], self._loader(loads))
+            from_local = await other.get_tasks([2], self._loader(loads))
+            return from_redis, from_local, other.local.snapshot()
+
+        from_redis, from_local, local_stats = asyncio.run(scenario())
+        assert loads == [[1, 2]]
+        assert from_redis == {1: self._task(1), 2: self._task(2)}
+        assert from_local == {2: self._task(2)}
+        assert local_stats["hits"] == 1
@@ -0,0 +1,115 @@
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+
+from app.services.task_services import TaskServices
+
+
+class TestTaskBulk:
+    """Testes para as operações em lote (bulk) de tarefas."""
+
+    def _bulk_create(self, client, count):
+        items = [{"title": f"Lote {i}", "priority": "low"} for i in range(count)]
+        response = client.post("/tasks/bulk", json=items)
+        return [result["id"] for result in response.json()["results"]]
+
+    def test_bulk_create(self, client):
+        """Testa criação em lote preservando a ordem dos itens."""
+        items = [
+            {"title": "Lote 1", "priority": "high"},
+            {"title": "Lote 2", "status": "in_progress"},
+            {"title": "Lote 3"},
+        ]
+
+        response = client.post("/tasks/bulk", json=items)
+        assert response.status_code == status.HTTP_200_OK
+
+        body = response.json()
+        assert body["succeeded"] == 3
+        assert body["failed"] == 0
+        assert [result["task"]["title"] for result in body["results"]] == [
+            "Lote 1",
+            "Lote 2",
+            "Lote 3",
+        ]
+        assert body["results"][1]["task"]["status"] == "in_progress"
+
+        assert len(client.get("/tasks/").json()) == 3
+
+    def test_bulk_create_invalid_item(self, client):
+        """Testa que item inválido é rejeitado na validação."""
+        items = [{"title": "Válida"}, {"title": "Inválida", "status": "bogus"}]
+
+        response = client.post("/tasks/bulk", json=items)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_bulk_create_empty(self, client):
+        """Testa lote vazio."""
+        response = client.post("/tasks/bulk", json=[])
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_bulk_update(self, client):
+        """Testa atualização em lote com relatório por item."""
+        ids = self._bulk_create(client, 2)
+        items = [
+            {"id": ids[0], "status": "completed"},
+            {"id": 999, "status": "completed"},
+            {"id": ids[1], "title": "Renomeada"},
+        ]
+
+        response = client.patch("/tasks/bulk", json=items)
+        assert response.status_code == status.HTTP_200_OK
+
+        body = response.json()
+        assert body["succeeded"] == 2
+        assert body["failed"] == 1
+        results = body["results"]
+        assert results[0]["task"]["status"] == "completed"
+        assert results[0]["task"]["priority"] == "low"  # não alterado
+        assert results[1]["success"] is False
+        assert "not found" in results[1]["error"]
+        assert results[2]["task"]["title"] == "Renomeada"
+
+    def test_bulk_update_partial_failure(self, client, monkeypatch):
+        """Testa que uma falha no banco não descarta os demais itens."""
+        ids = self._bulk_create(client, 2)
+        items = [
+            {"id": ids[0], "title": "Falha"},
+            {"id": ids[1], "status": "completed"},
+        ]
+        update_row = TaskServices._update_row
+
+        def db_error(*args):
+            raise IntegrityError("UPDATE tasks", {}, Exception("constraint failed"))
+
+        def fail_first(self, row):
+            return db_error() if row["id"] == ids[0] else update_row(self, row)
+
+        # null em campo obrigatório agora é 422: a falha do banco é simulada
+        monkeypatch.setattr(TaskServices, "_update_batches", db_error)
+        monkeypatch.setattr(TaskServices, "_update_row", fail_first)
+
+        response = client.patch("/tasks/bulk", json=items)
+        assert response.status_code == status.HTTP_200_OK
+
+        results = response.json()["results"]
+        assert results[0]["success"] is False
+        assert results[0]["error"]
+        assert results[1]["success"] is True
+
+        assert client.get(f"/tasks/{ids[0]}").json()["title"] == "Lote 0"
+        assert client.get(f"/tasks/{ids[1]}").json()["status"] == "completed"
+
+    def test_bulk_delete(self, client):
+        """Testa exclusão em lote reportando IDs inexistentes."""
+        ids = self._bulk_create(client, 3)
+
+        response = client.request("DELETE", "/tasks/bulk", json=[ids[0], 999, ids[2]])
+        assert response.status_code == status.HTTP_200_OK
+
+        body = response.json()
+        assert body["succeeded"] == 2
+        assert body["failed"] == 1
+        assert body["results"][1]["id"] == 999
+
+        remaining = [task["id"] for task in client.get("/tasks/").json()]
+        assert remaining == [ids[1]]
@@ -0,0 +1,270 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from sqlalchemy import update
+
+from app.core.cache import MemoryCache, RedisCache
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services.pagination import Page
+from app.services.task_cache import VERSION_KEY, TaskCache
+
+
+def _rename_in_db(task_id, title):
+    """Altera a tarefa direto no banco, sem passar pela API (e pelo cache)."""
+    with SessionLocal() as db:
+        db.execute(update(Task).where(Task.id == task_id).values(title=title))
+        db.commit()
+
+
+class TestTaskCache:
+    """Testes para o cache de leitura das tarefas."""
+
+    def _create(self, client, title="Cacheada"):
+        return client.post("/tasks/", json={"title": title}).json()["id"]
+
+    def test_get_task_is_cached(self, client):
+        """Testa que GET /tasks/{id} é servido do cache após a primeira leitura."""
+        task_id = self._create(client)
+        assert client.get(f"/tasks/{task_id}").json()["title"] == "Cacheada"
+
+        _rename_in_db(task_id, "Alterada no banco")
+
+        response = client.get(f"/tasks/{task_id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "Cacheada"
+
+    def test_update_invalidates_task(self, client):
+        """Testa que PUT invalida a entrada da tarefa."""
+        task_id = self._create(client)
+        client.get(f"/tasks/{task_id}")
+
+        client.put(f"/tasks/{task_id}", json={"title": "Nova"})
+
+        assert client.get(f"/tasks/{task_id}").json()["title"] == "Nova"
+
+    def test_delete_invalidates_task(self, client):
+        """Testa que DELETE remove a tarefa do cache."""
+        task_id = self._create(client)
+        client.get(f"/tasks/{task_id}")
+
+        client.delete(f"/tasks/{task_id}")
+
+        response = client.get(f"/tasks/{task_id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_is_cached(self, client):
+        """Testa que páginas de listagem são servidas do cache."""
+        task_id = self._create(client)
+        assert client.get("/tasks/").json()[0]["title"] == "Cacheada"
+
+        _rename_in_db(task_id, "Alterada no banco")
+
+        assert client.get("/tasks/").json()[0]["title"] == "Cacheada"
+
+    def test_writes_invalidate_lists(self, client):
+        """Testa que criação, atualização e lote invalidam listagens e filtros."""
+        task_id = self._create(client)
+        assert len(client.get("/tasks/").json()) == 1
+        assert len(client.get("/tasks/filter/status/completed").json()) == 0
+
+        self._create(client, "Segunda")
+        assert len(client.get("/tasks/").json()) == 2
+
+        client.put(f"/tasks/{task_id}", json={"status": "completed"})
+        assert len(client.get("/tasks/filter/status/completed").json()) == 1
+
+        client.request("DELETE", "/tasks/bulk", json=[task_id])
+        assert len(client.get("/tasks/").json()) == 1
+        assert len(client.get("/tasks/filter/status/completed").json()) == 0
+
+
+class TestCacheBackends:
+    """Testes para os backends de cache."""
+
+    def test_memory_cache_lru_eviction(self):
+        """Testa que o LRU em memória descarta a entrada menos usada."""
+        cache = MemoryCache(max_entries=2)
+
+        async def scenario():
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+            await cache.get("a")
+            await cache.set("c", 3)
+            return [await cache.get(key) for key in ("a", "b", "c")]
+
+        assert asyncio.run(scenario()) == [1, None, 3]
+
+    def test_memory_cache_ttl(self, monkeypatch):
+        """Testa expiração por TTL no cache em memória."""
+        cache = MemoryCache()
+        now = [1000.0]
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+
+        async def scenario():
+            await cache.set("key", "value", ttl=10)
+            fresh = await cache.get("key")
+            now[0] += 11
+            return fresh, await cache.get("key")
+
+        assert asyncio.run(scenario()) == ("value", None)
+
+    def test_redis_cache(self):
+        """Testa o backend Redis com fakeredis."""
+        fakeredis = pytest.importorskip("fakeredis.aioredis")
+        cache = RedisCache(fakeredis.FakeRedis())
+
+        async def scenario():
+            await cache.set("task", {"id": 1, "title": "Redis"}, ttl=60)
+            stored = await cache.get("task")
+            await cache.delete("task")
+            version = await cache.incr("version")
+            return stored, await cache.get("task"), version
+
+        assert asyncio.run(scenario()) == ({"id": 1, "title": "Redis"}, None, 1)
+
+    def test_memory_cache_byte_bound(self):
+        """Testa o limite de memória do cache local e o contador de evicções."""
+        cache = MemoryCache(max_entries=100, max_bytes=30)
+
+        async def scenario():
+            await cache.set("a", "x" * 10)
+            await cache.set("b", "y" * 10)
+            await cache.set("c", "z" * 10)
+            await cache.set("huge", "w" * 100)
+            return [await cache.get(key) for key in ("a", "b", "c", "huge")]
+
+        assert asyncio.run(scenario()) == [None, "y" * 10, "z" * 10, None]
+        stats = cache.snapshot()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["bytes"] <= 30
+
+
+class TestLocalTaskCache:
+    """Testes para o cache local por processo na frente do cache compartilhado."""
+
+    def test_local_cache_in_front_of_shared(self):
+        """Testa que a segunda leitura não consulta o cache compartilhado."""
+        shared = MemoryCache()
+        local = MemoryCache(max_entries=10)
+        cache = TaskCache(shared, ttl=60, list_ttl=60, local=local, local_ttl=5)
+        loads = []
+
+        async def loader():
+            loads.append(1)
+            return {
+                "id": 1,
+                "title": "Quente",
+                "description": None,
+                "status": "pending",
+                "priority": "medium",
+                "due_date": None,
+                "assigned_to": None,
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00",
+            }
+
+        async def scenario():
+            first = await cache.get_task(1, loader)
+            shared_lookups = shared.stats.hits + shared.stats.misses
+            second = await cache.get_task(1, loader)
+            untouched = shared.stats.hits + shared.stats.misses == shared_lookups
+            await cache.invalidate([1])
+            third = await cache.get_task(1, loader)
+            return first, second, third, untouched
+
+        first, second, third, untouched = asyncio.run(scenario())
+        assert first == second == third
+        assert len(loads) == 2
+        assert local.stats.hits == 1
+        assert untouched
+
+    def test_stale_read_not_cached_after_invalidation(self):
+        """Testa que uma leitura anterior à escrita não volta ao cache depois dela."""
+        cache = TaskCache(MemoryCache(), ttl=60, list_ttl=60)
+        rows = [{"id": 1, "title": "Antiga"}]
+
+        async def slow_loader():
+            old = dict(rows[0])
+            # A escrita acontece enquanto a leitura está em andamento
+            rows[0] = {"id": 1, "title": "Nova"}
+            await cache.invalidate([1])
+            return old
+
+        async def loader():
+            return rows[0]
+
+        async def scenario():
+            stale = await cache.get_task(1, slow_loader)
+            fresh = await cache.get_task(1, loader)
+            return stale, fresh
+
+        stale, fresh = asyncio.run(scenario())
+        assert stale["title"] == "Antiga"
+        assert fresh["title"] == "Nova"
+
+    def test_evicted_tokens_do_not_revive_old_entries(self):
+        """Testa que geração/versão despejadas não trazem de volta dados antigos."""
+        backend = MemoryCache()
+        cache = TaskCache(backend, ttl=60, list_ttl=60)
+        rows = [{"id": 1, "title": "Antiga"}]
+
+        async def load_task():
+            return rows[0]
+
+        async def load_page():
+            return Page(items=list(rows))
+
+        async def scenario():
+            await cache.get_task(1, load_task)
+            await cache.get_page("list", {}, load_page)
+            rows[0] = {"id": 1, "title": "Nova"}
+            await cache.invalidate([1])
+            # Simula o despejo das chaves de controle pelo LRU
+            await backend.delete(cache.generation_key(1), VERSION_KEY)
+            task = await cache.get_task(1, load_task)
+            page = await cache.get_page("list", {}, load_page)
+            return task, page
+
+        task, page = asyncio.run(scenario())
+        assert task["title"] == "Nova"
+        assert page.items[0]["title"] == "Nova"
+
+    def test_lookup_stats_with_redis(self):
+        """Testa que acertos e falhas são contados também com o backend Redis."""
+        fakeredis = pytest.importorskip("fakeredis")
+        # Servidor próprio: o padrão é compartilhado com os outros testes
+        client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer())
+        cache = TaskCache(RedisCache(client), ttl=60, list_ttl=60)
+
+        async def loader():
+            return {"id": 1, "title": "Redis"}
+
+        async def load_many(ids):
+            return {task_id: {"id": task_id, "title": "Redis"} for task_id in ids}
+
+        async def scenario():
+            await cache.get_task(1, loader)
+            await cache.get_task(1, loader)
+            await cache.get_tasks([1, 2], load_many)
+
+        asyncio.run(scenario())
+        stats = cache.stats()
+        assert stats["backend"] == "RedisCache"
+        assert stats["tasks"] == {"hits": 2, "misses": 2, "hit_ratio": 0.5}
+        assert "memory" not in stats
+
+    def test_cache_health(self, client):
+        """Testa o endpoint de métricas do cache do worker."""
+        task_id = client.post("/tasks/", json={"title": "Métrica"}).json()["id"]
+        client.get(f"/tasks/{task_id}")
+        client.get(f"/tasks/{task_id}")
+
+        body = client.get("/health/cache").json()
+        assert body["backend"] == "MemoryCache"
+        assert body["memory"]["hits"] >= 1
+        assert body["tasks"]["hits"] >= 1
+        assert "pid" in body
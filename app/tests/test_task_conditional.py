@@ -0,0 +1,221 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import status
+from sqlalchemy import update
+
+from app.api import task as task_api
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services.conditional import if_match_versions, task_etag
+
+
+class TestTaskConditional:
+    """Testes para requisições condicionais (ETag/Last-Modified)."""
+
+    def _create(self, client, title="Condicional"):
+        return client.post("/tasks/", json={"title": title}).json()["id"]
+
+    def test_get_task_etag(self, client):
+        """Testa ETag forte e 304 com If-None-Match em GET /tasks/{id}."""
+        task_id = self._create(client)
+
+        response = client.get(f"/tasks/{task_id}")
+        etag = response.headers["etag"]
+        assert not etag.startswith("W/")
+        assert "last-modified" in response.headers
+
+        response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        client.put(f"/tasks/{task_id}", json={"title": "Alterada"})
+        response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_get_task_if_modified_since(self, client):
+        """Testa 304 com If-Modified-Since."""
+        task_id = self._create(client)
+        last_modified = client.get(f"/tasks/{task_id}").headers["last-modified"]
+
+        response = client.get(
+            f"/tasks/{task_id}", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = client.get(
+            f"/tasks/{task_id}",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_weak_etag(self, client):
+        """Testa ETag fraco em listagens e invalidação por escrita."""
+        task_id = self._create(client)
+
+        response = client.get("/tasks/")
+        etag = response.headers["etag"]
+        assert etag.startswith("W/")
+
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+        self._create(client, "Outra")
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+
+        client.delete(f"/tasks/{task_id}")
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+    def test_list_ignores_if_modified_since(self, client):
+        """Testa que listas não têm Last-Modified e ignoram If-Modified-Since."""
+        first = self._create(client)
+        self._create(client, "Segunda")
+        response = client.get("/tasks/filter/status/pending")
+        assert "last-modified" not in response.headers
+
+        since = {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        client.delete(f"/tasks/{first}")
+        response = client.get("/tasks/filter/status/pending", headers=since)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+    def test_list_etag_matches_body(self, client):
+        """Testa que ETag e corpo vêm da mesma fonte, mesmo com o cache velho."""
+        task_id = self._create(client)
+        response = client.get("/tasks/")
+        etag = response.headers["etag"]
+
+        # Escrita fora da API: o cache de páginas ainda tem o corpo antigo
+        with SessionLocal() as db:
+            db.execute(update(Task).where(Task.id == task_id).values(title="Fora"))
+            db.commit()
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # Invalidado o cache, o corpo novo traz um ETag novo
+        asyncio.run(client.app.state.task_cache.invalidate([task_id]))
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["title"] == "Fora"
+        assert response.headers["etag"] != etag
+
+    def test_cached_list_revalidates_without_encoding(
+        self, client, monkeypatch, assert_max_queries
+    ):
+        """Testa 304 de página em cache sem consulta nem codificação dos itens."""
+        self._create(client)
+        etag = client.get("/tasks/?fields=id,title").headers["etag"]
+
+        encoded = []
+        monkeypatch.setattr(
+            task_api, "dump_tasks", lambda *args: encoded.append(args) or b"[]"
+        )
+        with assert_max_queries(0):
+            response = client.get(
+                "/tasks/?fields=id,title", headers={"If-None-Match": etag}
+            )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert encoded == []
+
+    def test_list_etag_per_page_and_filter(self, client):
+        """Testa que páginas e filtros diferentes têm ETags diferentes."""
+        self._create(client)
+        self._create(client, "Segunda")
+
+        first = client.get("/tasks/?limit=1").headers["etag"]
+        second = client.get("/tasks/?limit=2").headers["etag"]
+        assert first != second
+
+        etag = client.get("/tasks/filter/status/pending").headers["etag"]
+        response = client.get(
+            "/tasks/filter/status/pending", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        client.put("/tasks/1", json={"status": "completed"})
+        response = client.get(
+            "/tasks/filter/status/pending", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_put_if_match(self, client):
+        """Testa concorrência otimista com If-Match em PUT."""
+        task_id = self._create(client)
+        etag = client.get(f"/tasks/{task_id}").headers["etag"]
+
+        response = client.put(
+            f"/tasks/{task_id}", json={"title": "Primeira"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+        response = client.put(
+            f"/tasks/{task_id}", json={"title": "Segunda"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert client.get(f"/tasks/{task_id}").json()["title"] == "Primeira"
+
+    def test_delete_if_match(self, client):
+        """Testa If-Match em DELETE."""
+        task_id = self._create(client)
+
+        response = client.delete(f"/tasks/{task_id}", headers={"If-Match": '"stale"'})
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        etag = client.get(f"/tasks/{task_id}").headers["etag"]
+        response = client.delete(f"/tasks/{task_id}", headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_if_match_list_and_wildcard(self, client):
+        """Testa If-Match com lista de ETags, '*' e tarefa inexistente."""
+        task_id = self._create(client)
+        etag = client.get(f"/tasks/{task_id}").headers["etag"]
+
+        response = client.put(
+            f"/tasks/{task_id}",
+            json={"title": "Lista"},
+            headers={"If-Match": f'W/{etag}, "{task_id}-1", {etag}'},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.put(
+            f"/tasks/{task_id}", json={"title": "Qualquer"}, headers={"If-Match": "*"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.put(
+            "/tasks/999", json={"title": "X"}, headers={"If-Match": "*"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_empty_put_keeps_etag(self, client):
+        """Testa que um PUT sem campos não altera updated_at nem o ETag."""
+        task_id = self._create(client)
+        etag = client.get(f"/tasks/{task_id}").headers["etag"]
+
+        response = client.put(f"/tasks/{task_id}", json={}, headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] == etag
+
+
+class TestTaskEtag:
+    """Testes para a conversão entre ETag e updated_at."""
+
+    @pytest.mark.parametrize("microsecond", [0, 1, 123456, 999999])
+    def test_round_trip(self, microsecond):
+        """Testa que o ETag volta exatamente ao updated_at que o gerou."""
+        updated_at = datetime(2026, 10, 18, 14, 21, 9, microsecond)
+        etag = task_etag(7, updated_at)
+
+        assert if_match_versions(etag, 7) == [updated_at]
+        assert if_match_versions(etag, 8) == []
+        assert if_match_versions(f"W/{etag}", 7) == []
+        assert if_match_versions("*", 7) is None
@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
 
+import pytest
 from fastapi import status
 
+from app.services.task_services import TaskServices
+
 
 class TestTaskCRUD:
     """Testes para operações CRUD básicas de tarefas."""
@@ -243,3 +246,32 @@ class TestTaskCRUD:
 
         created_task = response.json()
         assert "due_date" in created_task
+
+
+class TestTaskCRUDWithoutReturning:
+    """Testa o caminho pelo ORM para bancos sem RETURNING."""
+
+    @pytest.fixture(autouse=True)
+    def without_returning(self, monkeypatch):
+        monkeypatch.setattr(TaskServices, "_supports_returning", lambda self: False)
+
+    def test_crud(self, client):
+        """Testa criação, atualização com If-Match e exclusão."""
+        response = client.post("/tasks/", json={"title": "Sem RETURNING"})
+        assert response.status_code == status.HTTP_201_CREATED
+        task_id = response.json()["id"]
+        etag = response.headers["etag"]
+
+        response = client.put(
+            f"/tasks/{task_id}",
+            json={"status": "completed"},
+            headers={"If-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "completed"
+
+        response = client.delete(f"/tasks/{task_id}", headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        assert client.delete(f"/tasks/{task_id}").status_code == 204
+        assert client.delete(f"/tasks/{task_id}").status_code == 404
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+from app.core.events import MemoryBroker, RedisBroker
+from app.main import app
+from app.models.enums import TaskPriority, TaskStatus
+from app.services.task_events import event_stream, matches
+
+
+def _drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestTaskEvents:
+    """Testes para o feed de alterações das tarefas."""
+
+    def test_writes_publish_events(self, client):
+        """Testa que criação, atualização e remoção publicam eventos."""
+        queue = app.state.event_broker.register()
+
+        task_id = client.post("/tasks/", json={"title": "Evento"}).json()["id"]
+        client.put(f"/tasks/{task_id}", json={"status": "completed"})
+        client.delete(f"/tasks/{task_id}")
+
+        events = _drain(queue)
+        assert [event["type"] for event in events] == ["created", "updated", "deleted"]
+        assert events[0]["task"]["title"] == "Evento"
+        assert events[1]["task"]["status"] == "completed"
+        assert events[2]["task"] == {"id": task_id}
+
+    def test_bulk_writes_publish_events(self, client):
+        """Testa eventos das operações em lote, um por tarefa."""
+        queue = app.state.event_broker.register()
+
+        response = client.post("/tasks/bulk", json=[{"title": "A"}, {"title": "B"}])
+        ids = [result["id"] for result in response.json()["results"]]
+        client.request("DELETE", "/tasks/bulk", json=ids + [999])
+
+        events = _drain(queue)
+        assert [event["type"] for event in events] == [
+            "created",
+            "created",
+            "deleted",
+            "deleted",
+        ]
+
+    def test_matches(self):
+        """Testa o filtro por status, prioridade e responsável."""
+        event = {
+            "type": "updated",
+            "task": {"status": "pending", "priority": "high", "assigned_to": "ana"},
+        }
+
+        assert matches(event)
+        assert matches(event, status=TaskStatus.PENDING, assigned_to="ana")
+        assert not matches(event, status=TaskStatus.COMPLETED)
+        assert not matches(event, priority=TaskPriority.LOW)
+        assert not matches(event, assigned_to="bruno")
+        assert matches({"type": "deleted", "task": {"id": 1}}, assigned_to="bruno")
+
+    def test_event_stream(self):
+        """Testa o formato SSE, o filtro e o keepalive do stream."""
+        broker = MemoryBroker()
+        chunks = []
+
+        async def disconnected():
+            return len(chunks) >= 3
+
+        async def scenario():
+            stream = event_stream(
+                broker, disconnected, heartbeat=0.05, status=TaskStatus.PENDING
+            )
+            chunks.append(await stream.__anext__())
+            for status_value in ("completed", "pending"):
+                task = {"id": 1, "status": status_value}
+                task.update(priority="low", assigned_to=None)
+                await broker.publish({"type": "updated", "task": task})
+            chunks.append(await stream.__anext__())
+            chunks.append(await stream.__anext__())
+            await stream.aclose()
+
+        asyncio.run(scenario())
+
+        assert chunks[0] == ": connected\n\n"
+        event_line, data_line = chunks[1].strip().split("\n")
+        assert event_line == "event: updated"
+        assert json.loads(data_line[len("data: ") :])["status"] == "pending"
+        assert chunks[2] == ": keepalive\n\n"
+        assert not broker.subscribers
+
+    def test_redis_broker(self):
+        """Testa o fan-out via Redis pub/sub com fakeredis."""
+        fakeredis = pytest.importorskip("fakeredis.aioredis")
+
+        async def scenario():
+            broker = RedisBroker(fakeredis.FakeRedis())
+            await broker.start()
+            async with broker.subscribe() as queue:
+                await broker.publish({"type": "deleted", "task": {"id": 7}})
+                event = await asyncio.wait_for(queue.get(), 1)
+            await broker.close()
+            return event
+
+        assert asyncio.run(scenario()) == {"type": "deleted", "task": {"id": 7}}
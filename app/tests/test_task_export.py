@@ -0,0 +1,57 @@
+import csv
+import io
+import json
+
+from fastapi import status
+
+
+class TestTaskExport:
+    """Testes para a exportação em streaming (NDJSON/CSV)."""
+
+    def _create_tasks(self, client):
+        tasks = [
+            {"title": "Exportar 1", "status": "pending", "priority": "high"},
+            {"title": "Exportar 2", "status": "completed", "priority": "low"},
+            {"title": "Exportar 3", "status": "pending", "priority": "low"},
+        ]
+        for task_data in tasks:
+            client.post("/tasks/", json=task_data)
+
+    def test_export_ndjson(self, client):
+        """Testa exportação padrão em NDJSON."""
+        self._create_tasks(client)
+
+        response = client.get("/tasks/export")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == [
+            "Exportar 1",
+            "Exportar 2",
+            "Exportar 3",
+        ]
+        assert "created_at" in rows[0]
+
+    def test_export_csv_with_filter(self, client):
+        """Testa exportação em CSV com os mesmos filtros de /tasks/filter."""
+        self._create_tasks(client)
+
+        response = client.get("/tasks/export?format=csv&status=pending")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 2
+        assert all(row["status"] == "pending" for row in rows)
+
+    def test_export_empty(self, client):
+        """Testa exportação sem tarefas."""
+        response = client.get("/tasks/export")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == ""
+
+    def test_export_invalid_format(self, client):
+        """Testa formato de exportação inválido."""
+        response = client.get("/tasks/export?format=xml")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+
+
+class TestTaskFields:
+    """Testes para o parâmetro fields= (sparse fieldsets) das listagens."""
+
+    def _create(self, client, count=3, **extra):
+        for i in range(count):
+            client.post(
+                "/tasks/",
+                json={"title": f"Tarefa {i}", "description": "x" * 400, **extra},
+            )
+
+    def test_list_with_fields(self, client):
+        """Testa que apenas os campos pedidos (e o id) são retornados."""
+        self._create(client)
+
+        response = client.get("/tasks/?fields=title,status")
+        assert response.status_code == status.HTTP_200_OK
+        for task in response.json():
+            assert list(task) == ["title", "status", "id"]
+
+    def test_without_fields_returns_everything(self, client):
+        """Testa que sem fields= a resposta continua completa."""
+        self._create(client, 1)
+
+        task = client.get("/tasks/").json()[0]
+        assert "description" in task and "updated_at" in task
+
+    def test_unselected_columns_not_loaded(self, client, count_app_queries):
+        """Testa que as colunas não pedidas ficam fora do SELECT."""
+        self._create(client)
+
+        with count_app_queries() as counter:
+            client.get("/tasks/?fields=title")
+
+        page_query = counter.statements[-1]
+        assert "tasks.title" in page_query
+        assert "tasks.description" not in page_query
+        assert counter.count == 1
+
+    def test_unknown_field(self, client):
+        """Testa erro 400 para campo inexistente."""
+        response = client.get("/tasks/?fields=title,senha")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "senha" in response.json()["detail"]
+
+    def test_filter_routes_with_fields(self, client):
+        """Testa fields= nas rotas de filtro, incluindo a paginação."""
+        due = (datetime.now() - timedelta(days=2)).isoformat()
+        self._create(client, 3, priority="high", due_date=due)
+
+        urls = [
+            "/tasks/filter?priority=high&fields=priority",
+            "/tasks/filter/priority/high?fields=priority",
+            "/tasks/search?q=Tarefa&fields=priority",
+            "/tasks/overdue?fields=priority",
+        ]
+        for url in urls:
+            response = client.get(f"{url}&limit=2")
+            assert response.status_code == status.HTTP_200_OK, url
+            assert response.json()[0] == {"priority": "high", "id": 1}
+            cursor = response.headers["X-Next-Cursor"]
+
+            next_page = client.get(f"{url}&limit=2&cursor={cursor}").json()
+            assert next_page == [{"priority": "high", "id": 3}]
+
+    def test_etag_depends_on_fields(self, client):
+        """Testa que formatos diferentes da mesma página têm ETags diferentes."""
+        self._create(client, 1)
+
+        full = client.get("/tasks/").headers["ETag"]
+        sparse = client.get("/tasks/?fields=title").headers["ETag"]
+        assert full != sparse
+
+        response = client.get("/tasks/?fields=title", headers={"If-None-Match": full})
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_cached_page_keeps_fields(self, client, count_app_queries):
+        """Testa que a página em cache respeita o fieldset pedido."""
+        self._create(client, 1)
+
+        first = client.get("/tasks/?fields=title").json()
+        with count_app_queries() as counter:
+            cached = client.get("/tasks/?fields=title").json()
+        full = client.get("/tasks/").json()
+
+        assert first == cached == [{"title": "Tarefa 0", "id": 1}]
+        assert counter.count == 0
+        assert "description" in full[0]
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+
+
+class TestTaskPagination:
+    """Testes para a paginação por cursor (keyset) das listagens."""
+
+    def _create_tasks(self, client, count, **extra):
+        ids = []
+        for i in range(count):
+            response = client.post("/tasks/", json={"title": f"Tarefa {i}", **extra})
+            ids.append(response.json()["id"])
+        return ids
+
+    def _collect_pages(self, client, url, limit):
+        """Percorre todas as páginas seguindo o header X-Next-Cursor."""
+        pages = []
+        separator = "&" if "?" in url else "?"
+        response = client.get(f"{url}{separator}limit={limit}")
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return pages
+            response = client.get(f"{url}{separator}limit={limit}&cursor={cursor}")
+
+    def test_list_tasks_paginated(self, client):
+        """Testa que a listagem é dividida em páginas sem repetição."""
+        ids = self._create_tasks(client, 5)
+
+        pages = self._collect_pages(client, "/tasks/", limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [task["id"] for page in pages for task in page] == ids
+
+    def test_last_page_has_no_cursor(self, client):
+        """Testa que a última página não retorna cursor."""
+        self._create_tasks(client, 2)
+
+        response = client.get("/tasks/?limit=2")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_filter_by_status_paginated(self, client):
+        """Testa paginação em filtro por status."""
+        self._create_tasks(client, 3, status="pending")
+        self._create_tasks(client, 2, status="completed")
+
+        pages = self._collect_pages(client, "/tasks/filter/status/pending", limit=2)
+
+        tasks = [task for page in pages for task in page]
+        assert len(tasks) == 3
+        assert all(task["status"] == "pending" for task in tasks)
+
+    def test_due_soon_paginated_by_due_date(self, client):
+        """Testa que tarefas com prazo são paginadas por (due_date, id)."""
+        now = datetime.now()
+        for days in (5, 1, 3, 2, 4):
+            client.post(
+                "/tasks/",
+                json={
+                    "title": f"Prazo {days}",
+                    "due_date": (now + timedelta(days=days)).isoformat(),
+                },
+            )
+
+        pages = self._collect_pages(client, "/tasks/due-soon", limit=2)
+
+        titles = [task["title"] for page in pages for task in page]
+        assert titles == ["Prazo 1", "Prazo 2", "Prazo 3", "Prazo 4", "Prazo 5"]
+
+    def test_invalid_cursor(self, client):
+        """Testa cursor inválido."""
+        response = client.get("/tasks/?cursor=invalido")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_limit_out_of_bounds(self, client):
+        """Testa limite acima do máximo permitido."""
+        response = client.get("/tasks/?limit=100000")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
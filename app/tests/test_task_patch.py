@@ -0,0 +1,135 @@
+from fastapi import status
+
+MERGE_PATCH = {"Content-Type": "application/merge-patch+json"}
+
+
+class TestTaskPatch:
+    """Testes para PATCH /tasks/{id} (JSON Merge Patch)."""
+
+    def _create(self, client):
+        response = client.post(
+            "/tasks/",
+            json={
+                "title": "Cartão",
+                "description": "Quadro kanban",
+                "assigned_to": "ana",
+                "due_date": "2030-01-01T00:00:00",
+                "tags": ["kanban"],
+            },
+        )
+        return response.json()
+
+    def test_patch_single_field(self, client):
+        """Testa que só o campo enviado muda e o updated_at avança."""
+        task = self._create(client)
+
+        response = client.patch(
+            f"/tasks/{task['id']}", json={"status": "in_progress"}, headers=MERGE_PATCH
+        )
+        assert response.status_code == status.HTTP_200_OK
+        patched = response.json()
+        assert patched["status"] == "in_progress"
+        assert patched["updated_at"] > task["updated_at"]
+        for field in ("title", "description", "assigned_to", "due_date", "tags"):
+            assert patched[field] == task[field]
+
+    def test_single_update_of_patched_columns(self, client, assert_max_queries):
+        """Testa um único UPDATE, só com as colunas enviadas (e updated_at/version)."""
+        task = self._create(client)
+
+        with assert_max_queries(1) as counter:
+            client.patch(f"/tasks/{task['id']}", json={"status": "completed"})
+
+        assert counter.statements[0].startswith(
+            "UPDATE tasks SET status=?, version=(tasks.version + ?), updated_at=?"
+        )
+
+    def test_null_clears_fields(self, client):
+        """Testa que null limpa campos opcionais e esvazia as tags."""
+        task = self._create(client)
+
+        response = client.patch(
+            f"/tasks/{task['id']}",
+            json={"assigned_to": None, "due_date": None, "tags": None},
+            headers=MERGE_PATCH,
+        )
+        patched = response.json()
+        assert patched["assigned_to"] is None
+        assert patched["due_date"] is None
+        assert patched["tags"] == []
+        assert patched["description"] == "Quadro kanban"
+
+    def test_invalid_patch(self, client):
+        """Testa 422 para null em campo obrigatório, campo desconhecido ou lista."""
+        task = self._create(client)
+
+        for body in ({"title": None}, {"status": None}, {"senha": "x"}, ["status"]):
+            response = client.patch(f"/tasks/{task['id']}", json=body)
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_invalid_text_is_rejected_before_writing(self, client):
+        """Testa 422 para título em branco, texto longo ou vazio (PATCH e PUT)."""
+        task = self._create(client)
+        bodies = (
+            {"title": "   "},
+            {"title": "x" * 101},
+            {"description": "x" * 600},
+            {"assigned_to": ""},
+        )
+
+        for body in bodies:
+            for method in (client.patch, client.put):
+                response = method(f"/tasks/{task['id']}", json=body)
+                assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        response = client.get(f"/tasks/{task['id']}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == task
+
+    def test_null_required_field_put_and_bulk(self, client):
+        """Testa 422 (não 500) para null em campo obrigatório no PUT e no lote."""
+        task = self._create(client)
+
+        for field in ("title", "status", "priority"):
+            response = client.put(f"/tasks/{task['id']}", json={field: None})
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+            items = [{"id": task["id"], field: None}]
+            response = client.patch("/tasks/bulk", json=items)
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        assert client.get(f"/tasks/{task['id']}").json() == task
+
+    def test_if_match(self, client):
+        """Testa a proteção contra atualização perdida com If-Match."""
+        task = self._create(client)
+        etag = client.get(f"/tasks/{task['id']}").headers["etag"]
+
+        response = client.patch(
+            f"/tasks/{task['id']}",
+            json={"status": "in_progress"},
+            headers={**MERGE_PATCH, "If-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+        response = client.patch(
+            f"/tasks/{task['id']}",
+            json={"status": "completed"},
+            headers={**MERGE_PATCH, "If-Match": etag},
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert client.get(f"/tasks/{task['id']}").json()["status"] == "in_progress"
+
+    def test_patch_not_found(self, client):
+        """Testa 404 para tarefa inexistente."""
+        response = client.patch("/tasks/999", json={"status": "completed"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_patch_updates_cache(self, client):
+        """Testa que o PATCH invalida a tarefa em cache."""
+        task = self._create(client)
+        client.get(f"/tasks/{task['id']}")
+
+        client.patch(f"/tasks/{task['id']}", json={"priority": "high"})
+        assert client.get(f"/tasks/{task['id']}").json()["priority"] == "high"
@@ -0,0 +1,200 @@
+import pytest
+from fastapi import status
+
+from app.services.task_query import (MAX_FILTER_DEPTH, compile_filter,
+                                     parse_filter)
+
+
+class TestTaskQuery:
+    """Testes para POST /tasks/query (filtros compostos em JSON)."""
+
+    @pytest.fixture
+    def tasks(self, client):
+        rows = [
+            ("A", "high", "pending", "ana", ["backend"]),
+            ("B", "medium", "completed", "bruno", []),
+            ("C", "medium", "in_progress", None, ["docs"]),
+            ("D", "low", "pending", "ana", ["backend", "urgent"]),
+            ("E", "high", "in_progress", "carla", []),
+        ]
+        for title, priority, task_status, assigned_to, tags in rows:
+            response = client.post(
+                "/tasks/",
+                json={
+                    "title": title,
+                    "priority": priority,
+                    "status": task_status,
+                    "assigned_to": assigned_to,
+                    "tags": tags,
+                },
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+    def _titles(self, client, where, url="/tasks/query"):
+        response = client.post(url, json=where)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        return sorted(task["title"] for task in response.json())
+
+    def test_in_not_and_or(self, client, tasks):
+        """Testa IN-lists, NOT e grupos OR combinados em uma consulta."""
+        where = {
+            "priority": {"in": ["high", "medium"]},
+            "not": {"status": "completed"},
+            "or": [
+                {"assigned_to": {"in": ["ana", "carla"]}},
+                {"tags": {"any": ["docs"]}},
+            ],
+        }
+        assert self._titles(client, where) == ["A", "C", "E"]
+
+    def test_negation_includes_nulls(self, client, tasks):
+        """Testa que NOT, ne e not_in não descartam linhas com NULL."""
+        assert self._titles(client, {"not": {"assigned_to": "ana"}}) == [
+            "B",
+            "C",
+            "E",
+        ]
+        assert self._titles(client, {"assigned_to": {"ne": "ana"}}) == ["B", "C", "E"]
+        assert self._titles(client, {"assigned_to": {"not_in": ["ana", "bruno"]}}) == [
+            "C",
+            "E",
+        ]
+
+    def test_null_checks(self, client, tasks):
+        """Testa is_null e o atalho com null."""
+        assert self._titles(client, {"assigned_to": None}) == ["C"]
+        assert self._titles(client, {"assigned_to": {"is_null": False}}) == [
+            "A",
+            "B",
+            "D",
+            "E",
+        ]
+        assert self._titles(client, {"due_date": {"is_null": True}}) == [
+            "A",
+            "B",
+            "C",
+            "D",
+            "E",
+        ]
+
+    def test_timestamp_ranges(self, client, tasks):
+        """Testa intervalos em created_at/updated_at, inclusive com fuso."""
+        created = {
+            task["title"]: task["created_at"] for task in client.get("/tasks/").json()
+        }
+        where = {"created_at": {"gte": created["B"], "lte": created["D"]}}
+        assert self._titles(client, where) == ["B", "C", "D"]
+
+        before = {"updated_at": {"lt": "2000-01-01T00:00:00Z"}}
+        assert self._titles(client, before) == []
+        after = {"updated_at": {"gt": "2000-01-01T03:00:00+03:00"}}
+        assert len(self._titles(client, after)) == 5
+        assert self._titles(client, {"created_at": {"lt": "2000-01-01"}}) == []
+
+    def test_tags(self, client, tasks):
+        """Testa tags any/all dentro da expressão."""
+        assert self._titles(client, {"tags": {"all": ["Backend", "urgent"]}}) == ["D"]
+        assert self._titles(
+            client, {"or": [{"tags": {"any": ["docs"]}}, {"priority": "high"}]}
+        ) == ["A", "C", "E"]
+
+    def test_empty_body_returns_everything(self, client, tasks):
+        """Testa que um filtro vazio (ou ausente) lista todas as tarefas."""
+        assert len(self._titles(client, {})) == 5
+        assert len(client.post("/tasks/query").json()) == 5
+
+    def test_paging_sort_and_fields(self, client, tasks):
+        """Testa limit/cursor, sort= e fields= na rota de consulta."""
+        where = {"status": {"ne": "completed"}}
+        url = "/tasks/query?limit=2&sort=-title&fields=title"
+
+        response = client.post(url, json=where)
+        assert response.json() == [{"id": 5, "title": "E"}, {"id": 4, "title": "D"}]
+
+        cursor = response.headers["X-Next-Cursor"]
+        response = client.post(f"{url}&cursor={cursor}", json=where)
+        assert [task["title"] for task in response.json()] == ["C", "A"]
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_single_statement(self, client, tasks, assert_max_queries):
+        """Testa que a consulta composta é um único SELECT."""
+        where = {
+            "priority": {"in": ["high", "medium"]},
+            "assigned_to": {"in": [f"p{i}" for i in range(20)] + ["ana"]},
+            "not": {"status": "completed"},
+        }
+        with assert_max_queries(1):
+            assert self._titles(client, where) == ["A"]
+
+    def test_compiled_cache_hit(self, client, tasks, listen_app_engines):
+        """Testa que o mesmo formato de filtro reusa o SQL já compilado."""
+        hits = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            hits.append(context.cache_hit)
+
+        with listen_app_engines("after_cursor_execute", capture):
+            for names in (["ana"], ["bruno", "carla", "davi"]):
+                self._titles(client, {"assigned_to": {"in": names}, "id": {"gt": 1}})
+
+        assert hits[-1] == hits[-1].CACHE_HIT
+
+    @pytest.mark.parametrize(
+        "where",
+        [
+            {"and": ["status"]},
+            {"senha": "x"},
+            {"status": {"gt": "pending"}},
+            {"status": {"in": ["pending", "nope"]}},
+            {"priority": {"in": []}},
+            {"created_at": {"gte": "ontem"}},
+            {"assigned_to": {"is_null": "sim"}},
+            {"id": {"eq": None}},
+            {"or": {"status": "pending"}},
+            {"not": {}},
+            {"tags": {"any": ["x" * 51]}},
+        ],
+    )
+    def test_invalid_filter(self, client, where):
+        """Testa erro 400 para expressões inválidas."""
+        response = client.post("/tasks/query", json=where)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_depth_limit(self, client):
+        """Testa o limite de aninhamento."""
+        where = {"status": "pending"}
+        for _ in range(MAX_FILTER_DEPTH):
+            where = {"not": where}
+        response = client.post("/tasks/query", json=where)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestCompileFilter:
+    """Testes para o cache de compilação dos filtros."""
+
+    def test_same_shape_shares_clause(self):
+        """Testa que valores e IN-lists de tamanhos diferentes reusam a cláusula."""
+        first, first_params = compile_filter(
+            parse_filter({"priority": {"in": ["high"]}, "id": {"gt": 1}}), "sqlite"
+        )
+        second, second_params = compile_filter(
+            parse_filter({"priority": {"in": ["low", "medium"]}, "id": {"gt": 9}}),
+            "sqlite",
+        )
+
+        assert first is second
+        assert first_params == {"where_0": ["high"], "where_1": 1}
+        assert second_params == {"where_0": ["low", "medium"], "where_1": 9}
+
+    def test_different_shape(self):
+        """Testa que estruturas diferentes geram cláusulas diferentes."""
+        first, _ = compile_filter(parse_filter({"id": {"gt": 1}}), "sqlite")
+        second, _ = compile_filter(parse_filter({"id": {"lt": 1}}), "sqlite")
+        assert first is not second
+
+    def test_values_are_bound(self):
+        """Testa que nenhum valor do cliente aparece no SQL."""
+        clause, _ = compile_filter(
+            parse_filter({"title": "x'; DROP TABLE tasks; --"}), "sqlite"
+        )
+        assert "DROP" not in str(clause)
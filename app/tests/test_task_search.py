@@ -0,0 +1,79 @@
+from fastapi import status
+
+
+class TestTaskSearch:
+    """Testes para a busca textual (FTS5 no SQLite de testes)."""
+
+    def _create(self, client, title, description=None):
+        response = client.post(
+            "/tasks/", json={"title": title, "description": description}
+        )
+        return response.json()["id"]
+
+    def test_search_prefix_match(self, client):
+        """Testa que cada palavra é buscada como prefixo."""
+        self._create(client, "Relatório mensal", "Gerar números do mês")
+        self._create(client, "Outra tarefa", "Sem relação")
+
+        response = client.get("/tasks/search?q=relat")
+        assert response.status_code == status.HTTP_200_OK
+
+        titles = [task["title"] for task in response.json()]
+        assert "Relatório mensal" in titles
+
+    def test_search_ignores_accents(self, client):
+        """Testa busca sem acentos encontrando texto acentuado."""
+        self._create(client, "Revisar autenticação")
+
+        response = client.get("/tasks/search?q=autenticacao")
+        assert [task["title"] for task in response.json()] == ["Revisar autenticação"]
+
+    def test_search_all_words_required(self, client):
+        """Testa que todas as palavras do termo precisam ocorrer."""
+        self._create(client, "Deploy da API", "Publicar em produção")
+        self._create(client, "Deploy do site")
+
+        response = client.get("/tasks/search?q=deploy api")
+        assert [task["title"] for task in response.json()] == ["Deploy da API"]
+
+    def test_search_ranks_title_first(self, client):
+        """Testa que ocorrência no título é mais relevante que na descrição."""
+        self._create(client, "Tarefa genérica", "Atualizar o backup semanal")
+        self._create(client, "Backup do banco")
+
+        response = client.get("/tasks/search?q=backup")
+        titles = [task["title"] for task in response.json()]
+        assert titles == ["Backup do banco", "Tarefa genérica"]
+
+    def test_search_paginated_by_relevance(self, client):
+        """Testa paginação por cursor mantendo a ordem de relevância."""
+        for i in range(5):
+            self._create(client, f"Cache {i}")
+
+        first = client.get("/tasks/search?q=cache&limit=3")
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(f"/tasks/search?q=cache&limit=3&cursor={cursor}")
+
+        ids = [task["id"] for task in first.json() + second.json()]
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_search_reflects_updates_and_deletes(self, client):
+        """Testa que o índice de busca acompanha updates e deletes."""
+        task_id = self._create(client, "Nome antigo")
+        client.put(f"/tasks/{task_id}", json={"title": "Nome novo"})
+
+        assert client.get("/tasks/search?q=antigo").json() == []
+        assert len(client.get("/tasks/search?q=novo").json()) == 1
+
+        client.delete(f"/tasks/{task_id}")
+        assert client.get("/tasks/search?q=novo").json() == []
+
+    def test_search_only_symbols(self, client):
+        """Testa termo sem palavras pesquisáveis."""
+        self._create(client, "Qualquer tarefa")
+
+        response = client.get('/tasks/search?q="*')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
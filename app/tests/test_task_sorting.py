@@ -0,0 +1,162 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+
+from app.database import engine
+
+PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+class TestTaskSorting:
+    """Testes para o parâmetro sort= das listagens e filtros."""
+
+    @pytest.fixture
+    def tasks(self, client):
+        base = datetime(2030, 1, 1)
+        priorities = ["high", "low", "medium"]
+        created = []
+        for i in range(9):
+            # Datas repetidas e nulas para exercitar desempate e NULLs
+            due = None if i % 4 == 0 else (base + timedelta(days=i % 3)).isoformat()
+            response = client.post(
+                "/tasks/",
+                json={
+                    "title": f"Tarefa {(i * 7) % 9}",
+                    "priority": priorities[i % 3],
+                    "due_date": due,
+                    "status": "pending" if i % 2 else "in_progress",
+                },
+            )
+            created.append(response.json())
+        return created
+
+    def _collect(self, client, url, limit=2):
+        """Percorre todas as páginas seguindo o header X-Next-Cursor."""
+        items = []
+        response = client.get(f"{url}&limit={limit}")
+        while True:
+            assert response.status_code == status.HTTP_200_OK, response.text
+            items.extend(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return [task["id"] for task in items]
+            response = client.get(f"{url}&limit={limit}&cursor={cursor}")
+
+    def _expected(self, tasks, key, reverse=False):
+        # SQLite ordena NULL antes dos demais valores (ascendente)
+        def sort_key(task):
+            value = key(task)
+            return (value is not None, value or "", task["id"])
+
+        return [task["id"] for task in sorted(tasks, key=sort_key, reverse=reverse)]
+
+    @pytest.mark.parametrize("limit", [1, 2, 4, 100])
+    def test_sort_due_date_with_nulls(self, client, tasks, limit):
+        """Testa sort=due_date e -due_date, com NULLs, em todas as páginas."""
+        due = lambda task: task["due_date"]  # noqa: E731
+
+        assert self._collect(client, "/tasks/?sort=due_date", limit) == self._expected(
+            tasks, due
+        )
+        assert self._collect(client, "/tasks/?sort=-due_date", limit) == self._expected(
+            tasks, due, reverse=True
+        )
+
+    def test_sort_priority_is_semantic(self, client, tasks):
+        """Testa que priority segue low < medium < high, não a ordem alfabética."""
+        ids = self._collect(client, "/tasks/?sort=-priority")
+        by_id = {task["id"]: task for task in tasks}
+        ranks = [PRIORITY_RANK[by_id[task_id]["priority"]] for task_id in ids]
+
+        assert ranks == sorted(ranks, reverse=True)
+        assert by_id[ids[0]]["priority"] == "high"
+        assert by_id[ids[-1]]["priority"] == "low"
+
+    def test_sort_multiple_fields(self, client, tasks):
+        """Testa ordenação composta com direções diferentes."""
+        ids = self._collect(client, "/tasks/?sort=-priority,title,id", limit=3)
+        expected = [
+            task["id"]
+            for task in sorted(
+                tasks,
+                key=lambda task: (
+                    -PRIORITY_RANK[task["priority"]],
+                    task["title"],
+                    task["id"],
+                ),
+            )
+        ]
+        assert ids == expected
+
+    def test_sort_on_filter_routes(self, client, tasks):
+        """Testa sort= combinado com filtros e fields=."""
+        pending = [task for task in tasks if task["status"] == "pending"]
+        expected = self._expected(pending, lambda task: task["title"], reverse=True)
+
+        assert (
+            self._collect(client, "/tasks/filter/status/pending?sort=-title")
+            == expected
+        )
+        assert (
+            self._collect(client, "/tasks/filter?status=pending&sort=-title&fields=id")
+            == expected
+        )
+
+    def test_default_order_is_id(self, client, tasks):
+        """Testa que sem sort= a ordem continua sendo pelo id."""
+        assert self._collect(client, "/tasks/?sort=") == [task["id"] for task in tasks]
+
+    @pytest.mark.parametrize("sort", ["description", "title,-title", "-senha"])
+    def test_invalid_sort(self, client, sort):
+        """Testa erro 400 para campos fora da lista ou repetidos."""
+        response = client.get(f"/tasks/?sort={sort}")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cursor_from_another_sort(self, client, tasks):
+        """Testa erro 400 ao seguir um cursor com outro sort=."""
+        response = client.get("/tasks/?sort=due_date&limit=2")
+        cursor = response.headers["X-Next-Cursor"]
+
+        for sort in ["title", "-due_date", ""]:
+            response = client.get(f"/tasks/?sort={sort}&limit=2&cursor={cursor}")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = client.get(f"/tasks/?sort=due_date&limit=2&cursor={cursor}")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_etag_depends_on_sort(self, client, tasks):
+        """Testa que ordens diferentes têm ETags diferentes."""
+        by_id = client.get("/tasks/").headers["ETag"]
+        by_title = client.get("/tasks/?sort=title").headers["ETag"]
+        assert by_id != by_title
+
+    @pytest.mark.parametrize(
+        "sort",
+        [
+            "title",
+            "-title",
+            "priority",
+            "-priority",
+            "due_date",
+            "-due_date",
+            "-created_at",
+        ],
+    )
+    def test_sort_uses_index(self, client, sort, listen_app_engines):
+        """Testa que a ordenação é servida por índice, sem ordenar em memória."""
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            captured.append((statement, parameters))
+
+        with listen_app_engines("before_cursor_execute", capture):
+            client.get(f"/tasks/?sort={sort}&limit=10")
+
+        statement, parameters = captured[-1]
+        with engine.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert "INDEX ix_tasks_" in details
+        assert "TEMP B-TREE" not in details
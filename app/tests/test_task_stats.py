@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+
+
+class TestTaskStats:
+    """Testes para o endpoint de estatísticas das tarefas."""
+
+    def _due(self, days):
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        return (today + timedelta(days=days, hours=12)).isoformat()
+
+    def test_stats_empty(self, client):
+        """Testa estatísticas com o banco vazio."""
+        response = client.get("/tasks/stats")
+        assert response.status_code == status.HTTP_200_OK
+
+        body = response.json()
+        assert body["total"] == 0
+        assert body["by_status"]["pending"] == 0
+        assert body["overdue"] == 0
+        assert set(body["due_date_histogram"].values()) == {0}
+        assert body["workload"] == []
+
+    def test_stats_counts(self, client):
+        """Testa contagens por status, prioridade, responsável e vencimento."""
+        tasks = [
+            {"title": "Atrasada", "due_date": self._due(-2), "assigned_to": "ana"},
+            {"title": "Hoje", "due_date": self._due(0), "assigned_to": "ana"},
+            {"title": "Semana", "due_date": self._due(3), "priority": "high"},
+            {"title": "Mês", "due_date": self._due(20), "assigned_to": "bruno"},
+            {"title": "Depois", "due_date": self._due(60), "status": "in_progress"},
+            {"title": "Sem data", "assigned_to": "bruno"},
+            {
+                "title": "Concluída",
+                "due_date": self._due(-5),
+                "status": "completed",
+                "assigned_to": "ana",
+            },
+        ]
+        client.post("/tasks/bulk", json=tasks)
+
+        body = client.get("/tasks/stats").json()
+        assert body["total"] == 7
+        assert body["by_status"] == {
+            "pending": 5,
+            "in_progress": 1,
+            "completed": 1,
+            "overdue": 0,
+        }
+        assert body["by_priority"] == {"low": 0, "medium": 6, "high": 1}
+        assert body["overdue"] == 1
+        assert body["due_today"] == 1
+        assert body["due_date_histogram"] == {
+            "overdue": 1,
+            "today": 1,
+            "next_7_days": 1,
+            "next_30_days": 1,
+            "later": 1,
+            "no_due_date": 1,
+        }
+
+        workload = {item["assigned_to"]: item for item in body["workload"]}
+        assert workload["ana"] == {
+            "assigned_to": "ana",
+            "total": 3,
+            "open": 2,
+            "overdue": 1,
+        }
+        assert workload["bruno"]["open"] == 2
+        assert workload[None]["total"] == 2
+
+    def test_stats_refresh_after_write(self, client):
+        """Testa que as estatísticas em cache são invalidadas por escritas."""
+        client.post("/tasks/", json={"title": "Primeira"})
+        assert client.get("/tasks/stats").json()["total"] == 1
+
+        client.post("/tasks/", json={"title": "Segunda"})
+        assert client.get("/tasks/stats").json()["total"] == 2
@@ -0,0 +1,130 @@
+from fastapi import status
+
+
+class TestTaskTags:
+    """Testes para as tags das tarefas e os filtros tags_any/tags_all."""
+
+    def _create(self, client, title, tags, **extra):
+        response = client.post("/tasks/", json={"title": title, "tags": tags, **extra})
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def _titles(self, client, url):
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return sorted(task["title"] for task in response.json())
+
+    def test_create_with_tags(self, client):
+        """Testa a criação com tags normalizadas (minúsculas, sem repetição)."""
+        task = self._create(client, "Deploy", [" Backend", "urgent", "backend"])
+        assert task["tags"] == ["backend", "urgent"]
+
+        assert client.get(f"/tasks/{task['id']}").json()["tags"] == [
+            "backend",
+            "urgent",
+        ]
+
+    def test_default_tags(self, client):
+        """Testa que tarefas sem tags retornam lista vazia."""
+        task = client.post("/tasks/", json={"title": "Sem tags"}).json()
+        assert task["tags"] == []
+
+    def test_invalid_tags(self, client):
+        """Testa a validação de tags vazias, longas ou em excesso."""
+        for tags in [["ok", "  "], ["x" * 51], [f"t{i}" for i in range(21)]]:
+            response = client.post("/tasks/", json={"title": "Inválida", "tags": tags})
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_update_tags(self, client):
+        """Testa a substituição das tags e a preservação quando omitidas."""
+        task = self._create(client, "Revisar", ["docs"])
+
+        response = client.put(f"/tasks/{task['id']}", json={"tags": ["Docs", "api"]})
+        assert response.json()["tags"] == ["docs", "api"]
+
+        response = client.put(f"/tasks/{task['id']}", json={"title": "Revisar PR"})
+        assert response.json()["tags"] == ["docs", "api"]
+
+    def test_update_null_tags(self, client):
+        """Testa que tags null no PUT e no lote esvaziam as tags sem quebrar a tarefa."""
+        task = self._create(client, "Revisar", ["docs"])
+
+        response = client.put(f"/tasks/{task['id']}", json={"tags": None})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["tags"] == []
+        response = client.get(f"/tasks/{task['id']}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["tags"] == []
+
+        other = self._create(client, "Outra", ["api"])
+        response = client.patch("/tasks/bulk", json=[{"id": other["id"], "tags": None}])
+        assert response.json()["results"][0]["task"]["tags"] == []
+        assert client.get(f"/tasks/{other['id']}").json()["tags"] == []
+
+    def test_filter_tags_any(self, client):
+        """Testa tags_any: pelo menos uma das tags."""
+        self._create(client, "A", ["backend", "urgent"])
+        self._create(client, "B", ["frontend"])
+        self._create(client, "C", ["docs"])
+
+        assert self._titles(client, "/tasks/filter?tags_any=urgent,frontend") == [
+            "A",
+            "B",
+        ]
+        assert self._titles(
+            client, "/tasks/filter?tags_any=docs&tags_any=Frontend"
+        ) == ["B", "C"]
+        assert self._titles(client, "/tasks/filter?tags_any=inexistente") == []
+
+    def test_filter_tags_all(self, client):
+        """Testa tags_all: todas as tags, combinadas com outros filtros."""
+        self._create(client, "A", ["backend", "urgent"], priority="high")
+        self._create(client, "B", ["backend"], priority="high")
+        self._create(client, "C", ["backend", "urgent", "docs"], priority="low")
+
+        assert self._titles(client, "/tasks/filter?tags_all=backend,urgent") == [
+            "A",
+            "C",
+        ]
+        assert self._titles(
+            client, "/tasks/filter?tags_all=backend&tags_all=urgent&priority=high"
+        ) == ["A"]
+        assert self._titles(
+            client, "/tasks/filter?tags_all=backend&tags_any=docs,urgent"
+        ) == ["A", "C"]
+
+    def test_filter_invalid_tag(self, client):
+        """Testa erro 400 para tag de filtro inválida."""
+        response = client.get(f"/tasks/filter?tags_any={'x' * 51}")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_filter_empty_tag_list(self, client):
+        """Testa erro 400 (e não o filtro ignorado) para tags_any/tags_all vazios."""
+        for query in ("tags_any=,", "tags_all=", "tags_any=%20,%20"):
+            for url in ("/tasks/filter", "/tasks/export"):
+                response = client.get(f"{url}?{query}")
+                assert response.status_code == status.HTTP_400_BAD_REQUEST, query
+
+    def test_tags_in_bulk_and_fields(self, client):
+        """Testa tags na criação em lote e no fields= das listagens."""
+        client.post(
+            "/tasks/bulk",
+            json=[{"title": "L1", "tags": ["Lote"]}, {"title": "L2"}],
+        )
+
+        response = client.get("/tasks/?fields=tags")
+        assert response.json() == [
+            {"tags": ["lote"], "id": 1},
+            {"tags": [], "id": 2},
+        ]
+
+    def test_export_with_tags(self, client):
+        """Testa a exportação filtrada por tags, com a coluna tags no CSV."""
+        self._create(client, "A", ["backend"])
+        self._create(client, "B", ["docs"])
+
+        response = client.get("/tasks/export?format=csv&tags_any=docs")
+        lines = response.text.strip().splitlines()
+        assert len(lines) == 2
+        assert "tags" in lines[0]
+        assert '"[""docs""]"' in lines[1]
@@ -0,0 +1,225 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from sqlalchemy import update
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services.task_services import TaskServices
+
+
+def _create(client, **data):
+    return client.post("/tasks/", json={"title": "Versionada", **data}).json()
+
+
+class TestTaskVersion:
+    """Testes para a concorrência otimista com a coluna version."""
+
+    def test_every_write_increments(self, client):
+        """Testa version 1 na criação e +1 a cada PUT/PATCH (não no PUT vazio)."""
+        task = _create(client)
+        assert task["version"] == 1
+
+        task_id = task["id"]
+        assert (
+            client.put(f"/tasks/{task_id}", json={"title": "B"}).json()["version"] == 2
+        )
+        assert (
+            client.patch(f"/tasks/{task_id}", json={"priority": "high"}).json()[
+                "version"
+            ]
+            == 3
+        )
+        assert client.put(f"/tasks/{task_id}", json={}).json()["version"] == 3
+        assert client.get(f"/tasks/{task_id}").json()["version"] == 3
+
+    def test_lost_update_is_rejected(self, client):
+        """Testa que o segundo escritor com a mesma versão recebe 409."""
+        task = _create(client)
+        url = f"/tasks/{task['id']}"
+
+        first = client.put(url, json={"title": "Primeiro", "version": 1})
+        assert first.status_code == status.HTTP_200_OK
+        assert first.json()["version"] == 2
+
+        second = client.patch(url, json={"title": "Segundo", "version": 1})
+        assert second.status_code == status.HTTP_409_CONFLICT
+        assert "version 2, not 1" in second.json()["detail"]
+        assert client.get(url).json()["title"] == "Primeiro"
+
+        # Sem alterações, uma versão antiga também é conflito
+        assert client.put(url, json={"version": 1}).status_code == 409
+        assert client.put(url, json={"version": 2}).status_code == 200
+
+    def test_single_statement(self, client, assert_max_queries):
+        """Testa que a verificação da versão não acrescenta consultas."""
+        task = _create(client)
+
+        with assert_max_queries(1):
+            response = client.put(
+                f"/tasks/{task['id']}", json={"status": "completed", "version": 1}
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_delete(self, client):
+        """Testa DELETE com ?version=: 409 se antiga, 404 se inexistente."""
+        task = _create(client)
+        url = f"/tasks/{task['id']}"
+        client.put(url, json={"title": "Alterada"})
+
+        assert client.delete(f"{url}?version=1").status_code == 409
+        assert client.get(url).status_code == status.HTTP_200_OK
+        assert client.delete(f"{url}?version=2").status_code == 204
+        assert client.delete(f"{url}?version=2").status_code == 404
+
+    def test_bulk_update(self, client):
+        """Testa conflito por item no lote e ids repetidos sem versão."""
+        first, second = (_create(client)["id"] for _ in range(2))
+        client.put(f"/tasks/{second}", json={"title": "Alterada"})
+
+        items = [
+            {"id": first, "status": "completed", "version": 1},
+            {"id": second, "status": "completed", "version": 1},
+            {"id": first, "priority": "high"},
+        ]
+        body = client.patch("/tasks/bulk", json=items).json()
+
+        assert [result["success"] for result in body["results"]] == [
+            True,
+            False,
+            True,
+        ]
+        assert "version 2, not 1" in body["results"][1]["error"]
+        task = client.get(f"/tasks/{first}").json()
+        assert (task["status"], task["priority"], task["version"]) == (
+            "completed",
+            "high",
+            3,
+        )
+        assert client.get(f"/tasks/{second}").json()["status"] == "pending"
+
+    def test_bulk_update_is_batched(self, client, assert_max_queries):
+        """Testa o lote: versões, um UPDATE por conjunto de colunas e a releitura."""
+        ids = [_create(client)["id"] for _ in range(50)]
+        items = [{"id": task_id, "status": "completed"} for task_id in ids]
+        items += [{"id": task_id, "title": "Nova", "version": 1} for task_id in ids[:5]]
+
+        with assert_max_queries(4):
+            body = client.patch("/tasks/bulk", json=items).json()
+
+        assert body["succeeded"] == 50
+        assert body["failed"] == 5  # a versão 1 já foi consumida pelo 1º item
+
+    def test_bulk_update_repeated_id(self, client, assert_max_queries):
+        """Testa id repetido com colunas diferentes: escritas na ordem do pedido."""
+        task_id = _create(client)["id"]
+        items = [
+            {"id": task_id, "title": "x"},
+            {"id": task_id, "priority": "high"},
+            {"id": task_id, "title": "y"},
+        ]
+
+        with assert_max_queries(5):
+            body = client.patch("/tasks/bulk", json=items).json()
+
+        assert body["succeeded"] == 3
+        task = client.get(f"/tasks/{task_id}").json()
+        assert (task["title"], task["priority"], task["version"]) == ("y", "high", 4)
+
+    def test_bulk_update_concurrent_write(self, client, monkeypatch):
+        """Testa que só o item alterado por outra sessão durante o lote falha."""
+        first, second = (_create(client)["id"] for _ in range(2))
+        update_batches = TaskServices._update_batches
+
+        def race_then_update(self, rows):
+            with SessionLocal() as other:
+                other.execute(
+                    update(Task)
+                    .where(Task.id == second)
+                    .values(title="Outra", version=Task.version + 1)
+                )
+                other.commit()
+            update_batches(self, rows)
+
+        monkeypatch.setattr(TaskServices, "_update_batches", race_then_update)
+        items = [{"id": first, "priority": "high"}, {"id": second, "priority": "high"}]
+        results = client.patch("/tasks/bulk", json=items).json()["results"]
+
+        assert [result["success"] for result in results] == [True, False]
+        assert "modified concurrently" in results[1]["error"]
+        task = client.get(f"/tasks/{second}").json()
+        assert (task["title"], task["priority"], task["version"]) == (
+            "Outra",
+            "medium",
+            2,
+        )
+
+    def test_sweeper_increments(self, client):
+        """Testa que a transição automática para OVERDUE também muda a versão."""
+        due_date = (datetime.now() - timedelta(days=2)).isoformat()
+        task = _create(client, due_date=due_date)
+
+        with SessionLocal() as db:
+            (row,) = TaskServices(db).mark_overdue_tasks(batch_size=10)
+        assert row.version == 2
+
+        stale = client.put(f"/tasks/{task['id']}", json={"title": "X", "version": 1})
+        assert stale.status_code == status.HTTP_409_CONFLICT
+
+
+class TestTaskVersionWithoutReturning:
+    """Testa o version_id_col do mapper no caminho pelo ORM."""
+
+    @pytest.fixture(autouse=True)
+    def without_returning(self, monkeypatch):
+        monkeypatch.setattr(TaskServices, "_supports_returning", lambda self: False)
+
+    def test_stale_version(self, client):
+        """Testa 409 para versão antiga no PUT e no DELETE."""
+        task = _create(client)
+        url = f"/tasks/{task['id']}"
+
+        response = client.put(url, json={"title": "B", "version": 1})
+        assert response.json()["version"] == 2
+        assert client.put(url, json={"title": "C", "version": 1}).status_code == 409
+        assert client.delete(f"{url}?version=1").status_code == 409
+        assert client.delete(f"{url}?version=2").status_code == 204
+
+    def test_concurrent_write_between_read_and_commit(self, client, monkeypatch):
+        """Testa 409 quando outra sessão grava entre a leitura e o commit."""
+        task_id = _create(client)["id"]
+        get_task = TaskServices.get_task
+
+        def read_then_race(self, task_id):
+            task = get_task(self, task_id)
+            with SessionLocal() as other:
+                other.execute(
+                    update(Task)
+                    .where(Task.id == task_id)
+                    .values(title="Outra", version=Task.version + 1)
+                )
+                other.commit()
+            return task
+
+        monkeypatch.setattr(TaskServices, "get_task", read_then_race)
+        response = client.put(f"/tasks/{task_id}", json={"title": "Minha"})
+        assert response.status_code == status.HTTP_409_CONFLICT
+        monkeypatch.setattr(TaskServices, "get_task", get_task)
+
+        task = client.get(f"/tasks/{task_id}").json()
+        assert (task["title"], task["version"]) == ("Outra", 2)
+
+    def test_mapper_checks_version(self, client):
+        """Testa que o ORM inclui a versão lida no WHERE do UPDATE."""
+        task_id = _create(client)["id"]
+
+        with SessionLocal() as db, SessionLocal() as other:
+            task = db.get(Task, task_id)
+            other.get(Task, task_id).title = "Outra"
+            other.commit()
+
+            task.title = "Minha"
+            with pytest.raises(StaleDataError):
+                db.commit()
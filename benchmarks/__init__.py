@@ -0,0 +1,4 @@
+"""Performance benchmarks for the Task Manager API.
+
+Run the modules from the project root, e.g. ``python -m benchmarks.query_plans``.
+"""
@@ -0,0 +1,69 @@
+"""Compare two benchmark result files and flag latency regressions.
+
+Usage::
+
+    python -m benchmarks.compare results/before.json results/after.json --threshold 10
+
+Exits with status 1 when any p50 or p95 grew by more than ``--threshold``
+percent, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+GATED = ("p50_ms", "p95_ms")
+
+
+def flatten(results: dict, prefix: str = "") -> Iterator[Tuple[str, dict]]:
+    """Yield (path, summary) for every leaf latency summary."""
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and "p50_ms" in value:
+            yield path, value
+        elif isinstance(value, dict):
+            yield from flatten(value, f"{path} / ")
+
+
+def load(path: Path) -> Dict[str, dict]:
+    return dict(flatten(json.loads(path.read_text())["results"]))
+
+
+def change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent")
+    args = parser.parse_args()
+
+    before, after = load(args.before), load(args.after)
+    regressions = 0
+    for name in sorted(before.keys() & after.keys()):
+        changes = {
+            metric: change(before[name][metric], after[name][metric])
+            for metric in METRICS
+        }
+        regressed = any(changes[metric] > args.threshold for metric in GATED)
+        regressions += regressed
+        marker = "REGRESSION" if regressed else ""
+        print(
+            f"{name:<70} "
+            + " ".join(f"{metric[:3]} {changes[metric]:+7.1f}%" for metric in METRICS)
+            + f" {marker}"
+        )
+
+    for name in sorted(before.keys() - after.keys()):
+        print(f"{name:<70} missing from {args.after}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
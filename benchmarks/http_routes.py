@@ -0,0 +1,287 @@
+"""Throughput and p50/p95/p99 latency of every /tasks route.
+
+Seeds the database with each requested number of synthetic tasks and drives
+the application in-process through httpx's ASGI transport (or a running
+server with --base-url, which must use the same --database-url).
+
+Usage::
+
+    python -m benchmarks.http_routes --rows 10000 100000 1000000
+    python -m benchmarks.http_routes --database-url postgresql://... --rows 100000
+    python -m benchmarks.http_routes --rows 100000 --output results/http.json
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+from benchmarks.report import print_table, summarize, write_results
+
+# GET /tasks/stream fica de fora: é uma conexão longa, não uma requisição
+READ_ROUTES = [
+    "GET /tasks/",
+    "GET /tasks/{task_id}",
+    "GET /tasks/batch",
+    "GET /tasks/?sort",
+    "GET /tasks/overdue",
+    "GET /tasks/due-soon",
+    "GET /tasks/due-today",
+    "GET /tasks/search",
+    "GET /tasks/filter",
+    "GET /tasks/filter?tags_any",
+    "POST /tasks/query",
+    "GET /tasks/filter/status/{status}",
+    "GET /tasks/filter/priority/{priority}",
+    "GET /tasks/filter/assigned/{assigned_to}",
+    "GET /tasks/stats",
+    "GET /tasks/export",
+]
+WRITE_ROUTES = [
+    "POST /tasks/",
+    "PUT /tasks/{task_id}",
+    "PATCH /tasks/{task_id}",
+    "POST /tasks/bulk",
+    "PATCH /tasks/bulk",
+    "DELETE /tasks/bulk",
+    "DELETE /tasks/{task_id}",
+]
+BULK_SIZE = 100
+
+
+class Context:
+    """State shared by the request builders of one benchmark run."""
+
+    def __init__(self, rows: int, seed: int = 7):
+        self.rows = rows
+        self.rng = random.Random(seed)
+        self.created: List[int] = []
+        self.bulk_created: List[List[int]] = []
+
+    def task_id(self) -> int:
+        return self.rng.randint(1, self.rows)
+
+
+class Route(NamedTuple):
+    build: Callable[[Context], Tuple[str, Optional[Any]]]
+    collect: Optional[Callable[[Context, httpx.Response], None]] = None
+
+
+def _new_task(ctx: Context) -> Dict[str, Any]:
+    return {"title": f"bench {ctx.rng.random():.6f}", "priority": "high"}
+
+
+def _pop(items: List, default):
+    return items.pop() if items else default
+
+
+ROUTES: Dict[str, Route] = {
+    "GET /tasks/": Route(lambda ctx: ("/tasks/?limit=100", None)),
+    "GET /tasks/{task_id}": Route(lambda ctx: (f"/tasks/{ctx.task_id()}", None)),
+    "GET /tasks/batch": Route(
+        lambda ctx: (
+            "/tasks/batch?ids=" + ",".join(str(ctx.task_id()) for _ in range(200)),
+            None,
+        )
+    ),
+    "GET /tasks/?sort": Route(
+        lambda ctx: ("/tasks/?limit=100&sort=-priority,due_date", None)
+    ),
+    "GET /tasks/overdue": Route(lambda ctx: ("/tasks/overdue", None)),
+    "GET /tasks/due-soon": Route(lambda ctx: ("/tasks/due-soon?days=7", None)),
+    "GET /tasks/due-today": Route(lambda ctx: ("/tasks/due-today", None)),
+    "GET /tasks/search": Route(lambda ctx: ("/tasks/search?q=relatório", None)),
+    "GET /tasks/filter": Route(
+        lambda ctx: ("/tasks/filter?status=pending&priority=high", None)
+    ),
+    "GET /tasks/filter?tags_any": Route(
+        lambda ctx: ("/tasks/filter?tags_any=tag-01,tag-02", None)
+    ),
+    "POST /tasks/query": Route(
+        lambda ctx: (
+            "/tasks/query",
+            {
+                "priority": {"in": ["high", "medium"]},
+                "assigned_to": {"in": [f"Pessoa {i:03d}" for i in range(20)]},
+                "not": {"status": "completed"},
+            },
+        )
+    ),
+    "GET /tasks/filter/status/{status}": Route(
+        lambda ctx: ("/tasks/filter/status/in_progress", None)
+    ),
+    "GET /tasks/filter/priority/{priority}": Route(
+        lambda ctx: ("/tasks/filter/priority/high", None)
+    ),
+    "GET /tasks/filter/assigned/{assigned_to}": Route(
+        lambda ctx: ("/tasks/filter/assigned/Pessoa 000", None)
+    ),
+    "GET /tasks/stats": Route(lambda ctx: ("/tasks/stats", None)),
+    "GET /tasks/export": Route(
+        lambda ctx: ("/tasks/export?assigned_to=Pessoa 000&status=pending", None)
+    ),
+    "POST /tasks/": Route(
+        lambda ctx: ("/tasks/", _new_task(ctx)),
+        lambda ctx, response: ctx.created.append(response.json()["id"]),
+    ),
+    "PUT /tasks/{task_id}": Route(
+        lambda ctx: (f"/tasks/{ctx.task_id()}", {"priority": "low"})
+    ),
+    "PATCH /tasks/{task_id}": Route(
+        lambda ctx: (
+            f"/tasks/{ctx.task_id()}",
+            {"status": ctx.rng.choice(["pending", "in_progress", "completed"])},
+        )
+    ),
+    "POST /tasks/bulk": Route(
+        lambda ctx: ("/tasks/bulk", [_new_task(ctx) for _ in range(BULK_SIZE)]),
+        lambda ctx, response: ctx.bulk_created.append(
+            [result["id"] for result in response.json()["results"]]
+        ),
+    ),
+    "PATCH /tasks/bulk": Route(
+        lambda ctx: (
+            "/tasks/bulk",
+            [{"id": ctx.task_id(), "status": "in_progress"} for _ in range(BULK_SIZE)],
+        )
+    ),
+    "DELETE /tasks/bulk": Route(
+        lambda ctx: ("/tasks/bulk", _pop(ctx.bulk_created, [0]))
+    ),
+    "DELETE /tasks/{task_id}": Route(
+        lambda ctx: (f"/tasks/{_pop(ctx.created, 0)}", None)
+    ),
+}
+
+
+async def run_route(
+    client: httpx.AsyncClient,
+    name: str,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    method = name.split(" ", 1)[0]
+    route = ROUTES[name]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        url, body = route.build(ctx)
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            await response.aread()
+            latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            errors += 1
+        elif route.collect is not None:
+            route.collect(ctx, response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    summary = summarize(latencies, time.perf_counter() - start)
+    summary["errors"] = errors
+    return summary
+
+
+async def run_size(
+    rows: int,
+    requests: int,
+    concurrency: int,
+    base_url: Optional[str],
+    routes: List[str],
+) -> Dict[str, dict]:
+    from app.main import app
+
+    ctx = Context(rows)
+    if base_url:
+        client = httpx.AsyncClient(base_url=base_url, timeout=60)
+        async with client:
+            return {
+                name: await run_route(client, name, ctx, requests, concurrency)
+                for name in routes
+            }
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=60
+        ) as client:
+            return {
+                name: await run_route(client, name, ctx, requests, concurrency)
+                for name in routes
+            }
+
+
+def prepare_database(rows: int) -> None:
+    from app.database import engine
+    from app.models.base import Base
+    from benchmarks.seed import seed_tasks
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    seed_tasks(engine, rows)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "ANALYZE tasks" if conn.dialect.name == "postgresql" else "ANALYZE"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--requests", type=int, default=200, help="Per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--base-url", help="Benchmark a running server instead")
+    parser.add_argument("--reads-only", action="store_true")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{tmp.name}/bench.db"
+    # Configuração lida na importação do app: defina antes de importá-lo
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("CACHE_BACKEND", "none")
+    os.environ.setdefault("EVENT_BROKER", "memory")
+    os.environ.setdefault("OVERDUE_SWEEP_IN_PROCESS", "False")
+
+    # Uma linha de log por requisição distorce as medições
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    routes = READ_ROUTES if args.reads_only else READ_ROUTES + WRITE_ROUTES
+    results: Dict[str, Dict[str, dict]] = {}
+    for rows in args.rows:
+        prepare_database(rows)
+        results[str(rows)] = asyncio.run(
+            run_size(rows, args.requests, args.concurrency, args.base_url, routes)
+        )
+        print(f"\n{rows} tasks")
+        print_table(results[str(rows)])
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        write_results(
+            args.output,
+            results,
+            benchmark="http_routes",
+            database=database_url.split(":", 1)[0],
+            requests=args.requests,
+            concurrency=args.concurrency,
+            transport="http" if args.base_url else "asgi",
+        )
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
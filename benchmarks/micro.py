@@ -0,0 +1,127 @@
+"""Microbenchmarks of TaskServices methods and task serialization.
+
+Usage::
+
+    python -m benchmarks.micro --rows 100000
+    python -m benchmarks.micro --database-url postgresql://... --rows 100000 --output results/micro.json
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.base import Base
+from app.schemas.task import Task as TaskSchema
+from app.services.export import encode_csv, encode_ndjson
+from app.services.serialization import dump_tasks, serialize_task
+from app.services.task_services import EXPORT_COLUMNS, TaskServices
+from benchmarks.query_plans import SCENARIOS
+from benchmarks.report import print_table, summarize, write_results
+from benchmarks.seed import seed_tasks
+
+SERVICE_SCENARIOS: Dict[str, Callable[[TaskServices], object]] = {
+    **{f"TaskServices {name}": scenario for name, scenario in SCENARIOS.items()},
+    "TaskServices.get_task_stats": lambda s: s.get_task_stats(),
+    "TaskServices.export_tasks (first batch)": lambda s: next(s.export_tasks()),
+}
+
+TASK_LIST = TypeAdapter(List[TaskSchema])
+
+
+def time_calls(call: Callable[[], object], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def bench_services(engine: Engine, repeat: int) -> Dict[str, dict]:
+    results = {}
+    with Session(engine) as session:
+        service = TaskServices(session)
+        for name, scenario in SERVICE_SCENARIOS.items():
+            scenario(service)  # aquecimento (cache de statements, páginas)
+            session.expunge_all()
+
+            def call(scenario=scenario):
+                scenario(service)
+                session.expunge_all()
+
+            results[name] = summarize(time_calls(call, repeat))
+    return results
+
+
+def bench_serialization(engine: Engine, repeat: int) -> Dict[str, dict]:
+    with Session(engine) as session:
+        page = TaskServices(session).list_tasks(limit=100).items
+        large_page = TaskServices(session).list_tasks(limit=1000).items
+        rows = next(TaskServices(session).export_tasks(batch_size=1000))
+        dicts = [serialize_task(task) for task in page]
+    columns = [column.key for column in EXPORT_COLUMNS]
+
+    cases = {
+        "serialize page: model_validate + model_dump (x100)": lambda: [
+            TaskSchema.model_validate(task).model_dump(mode="json") for task in page
+        ],
+        "serialize page: TypeAdapter.dump_json (x100)": lambda: TASK_LIST.dump_json(
+            TASK_LIST.validate_python(page, from_attributes=True)
+        ),
+        "serialize page: json.dumps cached dicts (x100)": lambda: json.dumps(dicts),
+        "serialize page: dump_tasks (x100)": lambda: dump_tasks(page),
+        "serialize page: dump_tasks cached dicts (x100)": lambda: dump_tasks(dicts),
+        "serialize page: model_validate + model_dump (x1000)": lambda: [
+            TaskSchema.model_validate(task).model_dump(mode="json")
+            for task in large_page
+        ],
+        "serialize page: dump_tasks (x1000)": lambda: dump_tasks(large_page),
+        "export: encode_ndjson (x1000)": lambda: encode_ndjson(rows),
+        "export: encode_csv (x1000)": lambda: encode_csv(rows, columns, header=True),
+    }
+    return {name: summarize(time_calls(call, repeat)) for name, call in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench.db"
+        engine = create_engine(database_url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        seed_tasks(engine, args.rows)
+
+        results = {
+            **bench_services(engine, args.repeat),
+            **bench_serialization(engine, args.repeat),
+        }
+        engine.dispose()
+
+    print_table(results)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        write_results(
+            args.output,
+            {str(args.rows): results},
+            benchmark="micro",
+            database=database_url.split(":", 1)[0],
+            repeat=args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Compare query plans of every /tasks query before and after the indexes
+added in migration 7c1e5f2a9b4d.
+
+Usage::
+
+    python -m benchmarks.query_plans --rows 100000
+    python -m benchmarks.query_plans --database-url postgresql://... --rows 1000000
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from app.models.base import Base
+from app.models.enums import TaskPriority, TaskStatus
+from app.models.search import POSTGRES_SEARCH_DDL
+from app.models.task import POSTGRES_TAGS_INDEX_DDL, Task
+from app.services.task_query import parse_filter
+from app.services.task_services import TaskServices
+from benchmarks.seed import ASSIGNEES, TAGS, seed_tasks
+
+# Índices criados pela migração inicial (95f6134fd4cb), sem o índice
+# redundante da chave primária
+BASELINE_INDEXES = [
+    "CREATE INDEX ix_tasks_status ON tasks (status)",
+    "CREATE INDEX ix_tasks_title ON tasks (title)",
+]
+
+SCENARIOS: Dict[str, Callable[[TaskServices], object]] = {
+    "GET /tasks/": lambda s: s.list_tasks(),
+    "GET /tasks/{id}": lambda s: s.get_task(1),
+    "GET /tasks/overdue": lambda s: s.get_overdue_tasks(),
+    "GET /tasks/due-soon": lambda s: s.get_tasks_due_soon(7),
+    "GET /tasks/due-today": lambda s: s.get_tasks_due_today(),
+    "GET /tasks/search": lambda s: s.search_tasks("relatório"),
+    "GET /tasks/filter": lambda s: s.filter_tasks_advanced(
+        status=TaskStatus.PENDING, priority=TaskPriority.HIGH
+    ),
+    "GET /tasks/?sort=due_date": lambda s: s.list_tasks(sort=("due_date",)),
+    "GET /tasks/?sort=-priority": lambda s: s.list_tasks(sort=("-priority",)),
+    "GET /tasks/filter?tags_any": lambda s: s.filter_tasks_advanced(tags_any=TAGS[:2]),
+    "GET /tasks/filter?tags_all": lambda s: s.filter_tasks_advanced(tags_all=TAGS[:2]),
+    "POST /tasks/query": lambda s: s.query_tasks(
+        parse_filter(
+            {
+                "assigned_to": {"in": ASSIGNEES[:20]},
+                "not": {"status": TaskStatus.COMPLETED.value},
+                "or": [{"priority": "high"}, {"due_date": {"is_null": True}}],
+            }
+        )
+    ),
+    "GET /tasks/filter/status/{status}": lambda s: s.filter_tasks_by_status(
+        TaskStatus.IN_PROGRESS
+    ),
+    "GET /tasks/filter/priority/{priority}": lambda s: s.filter_tasks_by_priority(
+        TaskPriority.HIGH
+    ),
+    "GET /tasks/filter/assigned/{assigned_to}": (
+        lambda s: s.filter_tasks_by_assigned_to(ASSIGNEES[0])
+    ),
+}
+
+
+def model_indexes(engine: Engine) -> List[str]:
+    """DDL for the indexes currently declared on the Task model."""
+    ddl = [
+        str(CreateIndex(index).compile(dialect=engine.dialect))
+        for index in Task.__table__.indexes
+    ]
+    if engine.dialect.name == "postgresql":
+        # Índice GIN da busca textual (a coluna gerada não está no modelo)
+        ddl.append(POSTGRES_SEARCH_DDL[-1])
+        ddl.append(POSTGRES_TAGS_INDEX_DDL)
+    return ddl
+
+
+def reset_indexes(engine: Engine, indexes: List[str]) -> None:
+    """Drop every secondary index on ``tasks`` and run the ``indexes`` DDL."""
+    with engine.begin() as conn:
+        for existing in inspect(conn).get_indexes("tasks"):
+            conn.exec_driver_sql(f"DROP INDEX {existing['name']}")
+        # O inspector ignora índices de expressão (ix_tasks_priority_rank_id)
+        for index in Task.__table__.indexes:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+        for ddl in indexes:
+            conn.exec_driver_sql(ddl)
+        if conn.dialect.name == "postgresql":
+            conn.exec_driver_sql("ANALYZE tasks")
+        else:
+            conn.exec_driver_sql("ANALYZE")
+
+
+def capture_statement(engine: Engine, scenario: Callable) -> Tuple[str, object]:
+    """Run ``scenario`` and return the SQL statement it emitted."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with Session(engine) as session:
+            scenario(TaskServices(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured[0]
+
+
+def explain(engine: Engine, statement: str, parameters: object) -> List[str]:
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+    # SQLite devolve (id, parent, notused, detail); Postgres uma coluna de texto
+    return [row[-1] for row in rows]
+
+
+def time_scenario(engine: Engine, scenario: Callable, repeat: int) -> float:
+    """Median wall time of ``scenario`` in milliseconds."""
+    timings = []
+    with Session(engine) as session:
+        service = TaskServices(session)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            scenario(service)
+            timings.append((time.perf_counter() - start) * 1000)
+            session.expunge_all()
+    return statistics.median(timings)
+
+
+def run(engine: Engine, repeat: int) -> Dict[str, Dict[str, dict]]:
+    results: Dict[str, Dict[str, dict]] = {name: {} for name in SCENARIOS}
+    phases = {
+        "baseline": BASELINE_INDEXES,
+        "indexed": model_indexes(engine),
+    }
+    for phase, indexes in phases.items():
+        reset_indexes(engine, indexes)
+        for name, scenario in SCENARIOS.items():
+            statement, parameters = capture_statement(engine, scenario)
+            results[name][phase] = {
+                "plan": explain(engine, statement, parameters),
+                "median_ms": round(time_scenario(engine, scenario, repeat), 3),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(args.database_url or f"sqlite:///{tmp}/bench.db")
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        seed_tasks(engine, args.rows)
+
+        results = run(engine, args.repeat)
+        engine.dispose()
+
+    for name, phases in results.items():
+        print(f"\n{name}")
+        for phase, result in phases.items():
+            print(f"  {phase:<9} {result['median_ms']:>10.3f} ms")
+            for line in result["plan"]:
+                print(f"            {line}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
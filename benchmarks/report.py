@@ -0,0 +1,72 @@
+import json
+import math
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import sqlalchemy
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ms: List[float], wall_seconds: Optional[float] = None) -> dict:
+    """Latency percentiles (ms) and throughput of one benchmark."""
+    ordered = sorted(samples_ms)
+    total_seconds = wall_seconds if wall_seconds else sum(ordered) / 1000
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p95_ms": round(percentile(ordered, 95), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+        "throughput_per_s": round(len(ordered) / total_seconds, 1)
+        if total_seconds
+        else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(**extra: Any) -> Dict[str, Any]:
+    """Environment details stored next to the results of a run."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "machine": platform.machine(),
+        **extra,
+    }
+
+
+def write_results(path: Path, results: Dict[str, Any], **meta: Any) -> None:
+    payload = {"meta": metadata(**meta), "results": results}
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+def print_table(results: Dict[str, dict]) -> None:
+    print(f"{'benchmark':<48} {'p50':>9} {'p95':>9} {'p99':>9} {'ops/s':>10}")
+    for name, summary in results.items():
+        print(
+            f"{name:<48} {summary['p50_ms']:>9.3f} {summary['p95_ms']:>9.3f} "
+            f"{summary['p99_ms']:>9.3f} {summary['throughput_per_s']:>10.1f}"
+        )
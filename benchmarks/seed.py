@@ -0,0 +1,60 @@
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from app.models.enums import TaskPriority, TaskStatus
+from app.models.task import Task
+
+WORDS = (
+    "implementar revisar documentar configurar testar corrigir migrar "
+    "deploy relatório api banco cache fila autenticação dashboard cliente "
+    "pagamento notificação integração backup monitoramento"
+).split()
+ASSIGNEES = [f"Pessoa {i:03d}" for i in range(200)]
+STATUSES = [status.value for status in TaskStatus]
+PRIORITIES = [priority.value for priority in TaskPriority]
+TAGS = [f"tag-{i:02d}" for i in range(50)]
+
+
+def generate_tasks(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` synthetic task rows with a realistic value spread."""
+    rng = random.Random(seed)
+    now = datetime.now()
+
+    for _ in range(count):
+        created_at = now - timedelta(days=rng.randint(0, 365))
+        yield {
+            "title": " ".join(rng.choices(WORDS, k=rng.randint(2, 6)))[:100],
+            "description": " ".join(rng.choices(WORDS, k=rng.randint(5, 40)))[:500],
+            "status": rng.choices(STATUSES, weights=(40, 25, 30, 5))[0],
+            "priority": rng.choice(PRIORITIES),
+            # 10% das tarefas não tem data de vencimento
+            "due_date": (
+                None
+                if rng.random() < 0.1
+                else now + timedelta(hours=rng.randint(-24 * 60, 24 * 60))
+            ),
+            "assigned_to": rng.choice(ASSIGNEES),
+            # Metade das tarefas com 1 a 3 tags
+            "tags": (
+                rng.sample(TAGS, k=rng.randint(1, 3)) if rng.random() < 0.5 else []
+            ),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def seed_tasks(engine: Engine, count: int, batch_size: int = 10_000) -> None:
+    """Insert ``count`` synthetic tasks in batches of ``batch_size``."""
+    batch: List[Dict[str, Any]] = []
+    with engine.begin() as conn:
+        for row in generate_tasks(count):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                conn.execute(insert(Task.__table__), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(Task.__table__), batch)